@@ -0,0 +1,698 @@
+"""
+DSCIT Consolidator - synthetic corpus generator + benchmark harness
+-------------------------------------------------------------------
+Production DSCIT files cannot leave the bank, so performance work on
+dscit_consolidator_vip7 is measured against synthetic workbooks instead:
+
+  * generate: writes realistic DSCIT Tier-1 workbooks from TARGET_COLUMNS /
+    COLUMN_ALIASES - a handful of template versions (alias spellings,
+    missing columns, with / without the lineage banner), title and section
+    banner rows, ghost formatting rows past the data, byte-identical copies,
+    re-issued versions of the same DSCIT ID, repeated rows inside a file and
+    rows shared between files. --xls writes a share of them as legacy .xls
+    (needs xlwt).
+  * run: times every stage of run_consolidation (discover, hash, parse,
+    dedup), build_analytics, write_output and generate_dashboard, records
+    peak RSS, and compares the result with a stored baseline.
+  * xls: times the .xls reader against the pd.read_excel path it replaced,
+    file by file and over a process pool, and checks both extract the same.
+
+Run:
+  python dscit_benchmark.py generate bench_corpus --files 200 --rows 50:800
+  python dscit_benchmark.py run bench_corpus --repeat 3 --save-baseline b.json
+  python dscit_benchmark.py run bench_corpus --repeat 3 --baseline b.json
+  python dscit_benchmark.py generate xls_corpus --files 60 --xls 1
+  python dscit_benchmark.py xls xls_corpus --repeat 3
+(run exits with status 1 when a stage regressed past --tolerance.)
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+
+import dscit_consolidator_vip7 as dscit
+
+CORPUS_MANIFEST = "corpus.json"
+
+# ============================================================================
+# 1. SYNTHETIC CORPUS GENERATOR
+# ============================================================================
+
+SOURCE_COLUMNS = [t for t in dscit.TARGET_COLUMNS
+                  if t not in dscit.LINEAGE_COLUMNS]
+
+# Headers as they appear on the lineage side of real templates: bare names
+# that collide with the source side, which is what the section-aware
+# mapping exists for.
+LINEAGE_HEADERS = {
+    "Lineage System": "System",
+    "Lineage Database": "Database",
+    "Lineage Schema": "Schema",
+    "Lineage Physical Table / API":
+        "Physical Table Name / API / Data Structure",
+    "Lineage Physical Column / API":
+        "Physical Column Name / API / Data Element",
+}
+
+# Columns older templates leave out (they end up as WARN files).
+OPTIONAL_COLUMNS = ["Data Element Description",
+                    "Source Application EUC / MAL Code",
+                    "Technology Asset Owner Name", "Data Owner Name"]
+
+_FIRST = ["Alex", "Priya", "Jordan", "Wei", "Fatima", "Liam", "Sofia",
+          "Mateo", "Aisha", "Noah", "Chen", "Olivia", "Ravi", "Emma"]
+_LAST = ["Singh", "Tremblay", "Nguyen", "Roy", "Martin", "Patel", "Li",
+         "Gagnon", "Brown", "Khan", "Wilson", "Cote", "Smith", "Lee"]
+_SEGMENTS = ["Canadian Personal Banking", "Wealth Management",
+             "Wholesale Banking", "Corporate Treasury", "Enterprise Risk",
+             "Finance", "US Retail", "Technology & Operations"]
+_SOURCE_TYPES = ["Database", "File", "API", "EUC", "Application",
+                 "database", "Flat File"]
+_DB_TYPES = ["Oracle", "ORACLE 19c", "Oracle Exadata", "Essbase",
+             "SQL Server", "MS SQL", "DB2", "db2 udb", "Teradata",
+             "Snowflake", "Databricks", "Azure Synapse", "Hive", "Excel",
+             "xlsx", "CSV file", "Flat File", "SAS", "Mainframe VSAM",
+             "PostgreSQL", "MongoDB", "SharePoint", "N/A", "TBD", "", "  ",
+             "Vendor Platform", None]
+_INDICATORS = ["CDE", "cde", "Critical Data Element", "BDE", "Metric",
+               "KPI", "Business Data Element", "N/A", "", None]
+
+
+def _name(rng):
+    return f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"
+
+
+def _label(target, rng):
+    """A header spelling that still maps to target: the canonical name, a
+    decorated or upper-cased variant, or one of its aliases."""
+    aliases = [a for a in dscit.COLUMN_ALIASES.get(target, []) if len(a) >= 6]
+    pick = rng.random()
+    if pick < 0.4 or not aliases:
+        return target
+    if pick < 0.55:
+        return target.upper()
+    if pick < 0.7:
+        return f"{target} *"
+    return rng.choice(aliases).upper()
+
+
+def make_templates(n, rng):
+    """n template versions: header labels per target, the columns present,
+    whether the lineage banner is drawn and a few cosmetic differences."""
+    templates = []
+    for i in range(n):
+        # The last version is always a legacy one: fewer columns, often
+        # no lineage banner (the mapping must infer the boundary).
+        legacy = i > 0 and (i == n - 1 or rng.random() < 0.3)
+        present = [t for t in SOURCE_COLUMNS
+                   if not (legacy and t in OPTIONAL_COLUMNS
+                           and rng.random() < 0.6)]
+        labels = {t: (t if i == 0 else _label(t, rng)) for t in present}
+        labels.update(LINEAGE_HEADERS)
+        templates.append({
+            "id": i,
+            "source": present,
+            "labels": labels,
+            "lineage_banner": not legacy or rng.random() < 0.3,
+            "sheet": rng.choice(["DSCIT", "DSCIT Report", "DSCIT Tier 1",
+                                 "dscit_tier1"]),
+            "title_rows": rng.randint(0, 3),
+            "extra_sheets": rng.randint(0, 2),
+        })
+    return templates
+
+
+class _Pools:
+    """Per-corpus value pools, so repeated values (owners, databases,
+    schemas...) recur across files the way they do in real reports."""
+
+    def __init__(self, rng, scale):
+        self.rng = rng
+        self.outputs = [f"{rng.choice(['Regulatory', 'Liquidity', 'Capital', 'Credit', 'Market', 'AML'])} "
+                        f"Report {k:03d}" for k in range(max(20, scale // 4))]
+        self.people = [_name(rng) for _ in range(60)]
+        self.sources = [f"{rng.choice(['GL', 'CRM', 'LMS', 'ODS', 'EDW', 'RDM', 'CIF'])}"
+                        f"_{k:02d}" for k in range(80)]
+        self.dbs = [f"{rng.choice(['PRD', 'UAT', 'RPT', 'FIN'])}"
+                    f"{rng.choice(['ORA', 'SQL', 'TD', 'DB'])}{k:02d}"
+                    for k in range(50)]
+        self.schemas = [f"{rng.choice(['fin', 'risk', 'ref', 'stg', 'rpt'])}"
+                        f"_{rng.choice(['core', 'mart', 'hist', 'dim'])}{k}"
+                        for k in range(70)]
+        self.tables = [f"T_{rng.choice(['ACCT', 'TXN', 'CUST', 'POS', 'LIMIT', 'RATE'])}"
+                       f"_{k:03d}" for k in range(200)]
+        self.elements = [f"{rng.choice(['Account', 'Balance', 'Exposure', 'Customer', 'Rate', 'Limit'])} "
+                         f"{rng.choice(['Id', 'Amount', 'Date', 'Code', 'Type', 'Status'])} {k}"
+                         for k in range(400)]
+
+    def blank(self, value, rate=0.08):
+        r = self.rng.random()
+        if r < rate:
+            return None
+        if r < rate + 0.02:
+            return self.rng.choice(["", "  ", "N/A", "-"])
+        return value
+
+    def record(self, output):
+        rng = self.rng
+        element = rng.choice(self.elements)
+        db = rng.choice(self.dbs)
+        schema = rng.choice(self.schemas)
+        rec = {
+            "Output Name": output,
+            "Output Owner": self.blank(rng.choice(self.people)),
+            "Data Element": element,
+            "Data Element Description": self.blank(
+                f"{element} as reported {rng.choice(['daily', 'monthly', 'at month end'])}"),
+            "Data Element Indicator": rng.choice(_INDICATORS),
+            "Source Name": self.blank(rng.choice(self.sources)),
+            "Source Type": self.blank(rng.choice(_SOURCE_TYPES)),
+            "Source Application EUC / MAL Code": self.blank(
+                rng.choice([f"MAL{rng.randint(1000, 9999)}",
+                            f"EUC-{rng.randint(100, 999)}", "N/A"])),
+            "Database Type": rng.choice(_DB_TYPES),
+            "Database Name": self.blank(
+                db if rng.random() > 0.03 else rng.randint(100, 999)),
+            "Schema Name / File Path / API": self.blank(
+                schema if rng.random() > 0.1
+                else f"\\\\share\\{rng.choice(self.sources)}\\extract.csv"),
+            "Database": self.blank(db, 0.3),
+            "Business Segment / Corporate Function":
+                self.blank(rng.choice(_SEGMENTS)),
+            "Asset Owner Name": self.blank(rng.choice(self.people)),
+            "Technology Asset Owner Name": self.blank(rng.choice(self.people)),
+            "Data Owner Name": self.blank(rng.choice(self.people)),
+        }
+        if rng.random() < 0.6:                 # lineage filled in
+            rec.update({
+                "Lineage System": rng.choice(self.sources),
+                "Lineage Database": rng.choice(self.dbs),
+                "Lineage Schema": rng.choice(self.schemas),
+                "Lineage Physical Table / API": rng.choice(self.tables),
+                "Lineage Physical Column / API":
+                    element.upper().replace(" ", "_"),
+            })
+        return rec
+
+
+def _write_workbook(path, template, records, ghost, rng):
+    wb = Workbook(write_only=True)
+    for k in range(template["extra_sheets"]):
+        ws = wb.create_sheet(["Instructions", "Change Log"][k % 2])
+        ws.append(["See the DSCIT guidance for how to fill this report."])
+    ws = wb.create_sheet(template["sheet"])
+    width = 1 + len(template["source"]) + len(dscit.LINEAGE_COLUMNS)
+    for k in range(template["title_rows"]):
+        ws.append([["DSCIT Tier-1 Report", "Prepared for Data Governance",
+                    f"As of {date(2024, 1, 1) + timedelta(days=k)}"][k]])
+    if template["lineage_banner"]:
+        banner = [None] * width
+        banner[1] = "Output Information"
+        banner[6] = "Source Information"
+        banner[1 + len(template["source"])] = "Data Flow Linkage Information"
+        ws.append(banner)
+    header = ["Object ID"] + [template["labels"][t] for t in
+                              template["source"] + dscit.LINEAGE_COLUMNS]
+    bold = Font(bold=True)
+    cells = []
+    for h in header:
+        c = WriteOnlyCell(ws, value=h)
+        c.font = bold
+        cells.append(c)
+    ws.append(cells)
+    for n, rec in enumerate(records, 1):
+        if rec is None:                        # stray blank row mid-data
+            ws.append([])
+            continue
+        ws.append([n] + [rec.get(t) for t in template["source"]]
+                  + [rec.get(t) for t in dscit.LINEAGE_COLUMNS])
+    if ghost:
+        # Formatted-but-empty rows past the data, then a stray note that
+        # the ghost-row cutoff must not pick up.
+        fill = PatternFill("solid", fgColor="FFF2CC")
+        for _ in range(dscit.GHOST_ROW_LIMIT + rng.randint(5, 50)):
+            cells = []
+            for _ in range(4):
+                c = WriteOnlyCell(ws, value=None)
+                c.fill = fill
+                cells.append(c)
+            ws.append(cells)
+        ws.append(["Notes: reviewed by governance"])
+    wb.save(path)
+
+
+def _write_xls(path, template, records, ghost, rng):
+    """_write_workbook for the legacy BIFF format (xlwt)."""
+    try:
+        import xlwt
+    except ImportError:
+        raise RuntimeError("legacy .xls output needs xlwt "
+                           "(pip install xlwt)") from None
+    wb = xlwt.Workbook()
+    for k in range(template["extra_sheets"]):
+        wb.add_sheet(["Instructions", "Change Log"][k % 2]).write(
+            0, 0, "See the DSCIT guidance for how to fill this report.")
+    ws = wb.add_sheet(template["sheet"])
+    r = 0
+    for k in range(template["title_rows"]):
+        ws.write(r, 0, ["DSCIT Tier-1 Report", "Prepared for Data Governance",
+                        f"As of {date(2024, 1, 1) + timedelta(days=k)}"][k])
+        r += 1
+    if template["lineage_banner"]:
+        ws.write(r, 1, "Output Information")
+        ws.write(r, 6, "Source Information")
+        ws.write(r, 1 + len(template["source"]),
+                 "Data Flow Linkage Information")
+        r += 1
+    header = ["Object ID"] + [template["labels"][t] for t in
+                              template["source"] + dscit.LINEAGE_COLUMNS]
+    bold = xlwt.easyxf("font: bold on")
+    for j, h in enumerate(header):
+        ws.write(r, j, h, bold)
+    r += 1
+    for n, rec in enumerate(records, 1):
+        if rec is not None:
+            row = [n] + [rec.get(t) for t in template["source"]] \
+                + [rec.get(t) for t in dscit.LINEAGE_COLUMNS]
+            for j, v in enumerate(row):
+                if v is not None:
+                    ws.write(r, j, v)
+        r += 1
+    if ghost:
+        fill = xlwt.easyxf("pattern: pattern solid, fore_colour "
+                           "light_yellow")
+        for _ in range(dscit.GHOST_ROW_LIMIT + rng.randint(5, 50)):
+            for j in range(4):
+                ws.write(r, j, None, fill)
+            r += 1
+        ws.write(r, 0, "Notes: reviewed by governance")
+    wb.save(path)
+
+
+def generate_corpus(folder, files=40, rows=(50, 500), seed=1, templates=4,
+                    dup_file_rate=0.08, reissue_rate=0.08, dup_row_rate=0.05,
+                    overlap_rate=0.2, ghost_rate=0.25, xls_rate=0.0) -> dict:
+    """Write `files` synthetic DSCIT workbooks (plus duplicate copies and
+    re-issues) into folder and return the corpus manifest, which is also
+    saved there as corpus.json. A share xls_rate of them is written as
+    legacy .xls."""
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    layouts = make_templates(templates, rng)
+    pools = _Pools(rng, files)
+    stats = {"workbooks": 0, "records": 0, "copies": 0, "reissues": 0,
+             "repeated_rows": 0, "shared_rows": 0, "ghost_files": 0,
+             "xls_files": 0}
+    previous = []
+    start = date(2024, 1, 1)
+    for i in range(files):
+        template = layouts[0] if rng.random() < 0.5 else rng.choice(layouts)
+        n = rng.randint(*rows)
+        output = rng.choice(pools.outputs)
+        records = [pools.record(output) for _ in range(n)]
+        if previous and rng.random() < overlap_rate:
+            shared = previous[:rng.randint(1, max(1, len(previous) // 3))]
+            records[:0] = [dict(r) for r in shared]
+            stats["shared_rows"] += len(shared)
+        for _ in range(int(n * dup_row_rate)):
+            records.append(dict(rng.choice(records)))
+            stats["repeated_rows"] += 1
+        rng.shuffle(records)
+        for _ in range(rng.randint(0, 3)):     # blank rows inside the data
+            records.insert(rng.randrange(len(records) + 1), None)
+        ghost = rng.random() < ghost_rate
+        stamp = (start + timedelta(days=rng.randint(0, 180))).strftime("%Y%m%d")
+        legacy = rng.random() < xls_rate
+        ext, write = (".xls", _write_xls) if legacy else \
+            (".xlsx", _write_workbook)
+        name = f"DSCIT_{i:05d}_{stamp}{ext}"
+        write(os.path.join(folder, name), template, records, ghost, rng)
+        stats["workbooks"] += 1
+        stats["xls_files"] += legacy
+        stats["records"] += sum(r is not None for r in records)
+        stats["ghost_files"] += ghost
+        previous = [r for r in records if r is not None]
+
+        if rng.random() < dup_file_rate:       # byte-identical copy
+            shutil.copyfile(os.path.join(folder, name),
+                            os.path.join(folder, f"{name[:-len(ext)]}"
+                                                 f" - Copy{ext}"))
+            stats["copies"] += 1
+        if rng.random() < reissue_rate:        # newer version of the same ID
+            later = (datetime.strptime(stamp, "%Y%m%d")
+                     + timedelta(days=rng.randint(7, 60))).strftime("%Y%m%d")
+            tail = [pools.record(output) for _ in range(rng.randint(1, 20))]
+            write(os.path.join(folder, f"DSCIT_{i:05d}_{later}{ext}"),
+                  template, previous + tail, False, rng)
+            stats["reissues"] += 1
+
+    manifest = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "params": {"files": files, "rows": list(rows), "seed": seed,
+                   "templates": templates, "dup_file_rate": dup_file_rate,
+                   "reissue_rate": reissue_rate, "dup_row_rate": dup_row_rate,
+                   "overlap_rate": overlap_rate, "ghost_rate": ghost_rate,
+                   "xls_rate": xls_rate},
+        "stats": stats,
+    }
+    with open(os.path.join(folder, CORPUS_MANIFEST), "w",
+              encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+# ============================================================================
+# 2. BENCHMARK HARNESS
+# ============================================================================
+
+STAGES = ("discover", "hash", "parse", "dedup", "analytics", "write",
+          "dashboard")
+
+
+def peak_rss_mb():
+    """(this process, reaped child processes) peak resident set size in MB,
+    or (None, None) where the platform cannot tell."""
+    try:
+        import resource
+    except ImportError:                        # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None, None
+        return psutil.Process().memory_info().peak_wset / 2 ** 20, None
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS.
+    scale = 2 ** 20 if sys.platform == "darwin" else 2 ** 10
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale)
+
+
+def run_once(corpus, executor="thread", workers=None, formats=("xlsx",),
+             cache_dir=None, dashboard=True) -> dict:
+    """One timed end-to-end run over corpus. Outputs go to a scratch
+    folder that is removed afterwards."""
+    timings = {}
+    results, combined, dedup = dscit.run_consolidation(
+        corpus, workers=workers, executor=executor, cache_dir=cache_dir,
+        timings=timings)
+    t0 = time.perf_counter()
+    analytics = dscit.build_analytics(combined, results, dedup)
+    timings["analytics"] = time.perf_counter() - t0
+    with tempfile.TemporaryDirectory(prefix="dscit_bench_") as out:
+        t0 = time.perf_counter()
+        path = dscit.write_output(out, results, combined, analytics, dedup,
+                                  formats=formats)
+        timings["write"] = time.perf_counter() - t0
+        if dashboard:
+            t0 = time.perf_counter()
+            dscit.generate_dashboard(out, analytics, combined, path, dedup)
+            timings["dashboard"] = time.perf_counter() - t0
+    timings["total"] = sum(timings.values())
+    return {"timings": timings,
+            "files": dedup["files_found"],
+            "rows_before_dedup": dedup["rows_before_dedup"],
+            "rows_after_dedup": dedup["rows_after_dedup"]}
+
+
+def run_benchmark(corpus, repeat=3, executor="thread", workers=None,
+                  formats=("xlsx",), cache_dir=None, dashboard=True) -> dict:
+    """repeat timed runs; stage times are the median over the runs, peak
+    RSS the maximum seen."""
+    runs = [run_once(corpus, executor, workers, formats, cache_dir,
+                     dashboard) for _ in range(repeat)]
+    rss, child_rss = peak_rss_mb()
+    names = [s for s in STAGES + ("total",) if s in runs[0]["timings"]]
+    manifest = None
+    try:
+        with open(os.path.join(corpus, CORPUS_MANIFEST),
+                  encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        pass
+    rows = runs[0]["rows_before_dedup"]
+    total = statistics.median(r["timings"]["total"] for r in runs)
+    return {
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "env": {"python": platform.python_version(),
+                "pandas": pd.__version__, "platform": platform.platform(),
+                "cpus": os.cpu_count()},
+        "config": {"executor": executor,
+                   "workers": workers or dscit.default_workers(executor),
+                   "formats": list(formats), "cache": bool(cache_dir),
+                   "repeat": repeat},
+        "corpus": {"path": os.path.abspath(corpus),
+                   "files": runs[0]["files"], "rows": rows,
+                   "rows_after_dedup": runs[0]["rows_after_dedup"],
+                   "params": (manifest or {}).get("params")},
+        "stages": {s: round(statistics.median(r["timings"][s] for r in runs),
+                            4) for s in names},
+        "runs": [{s: round(r["timings"][s], 4) for s in names}
+                 for r in runs],
+        "rows_per_second": round(rows / max(total, 1e-9), 1),
+        "peak_rss_mb": None if rss is None else round(rss, 1),
+        "peak_rss_children_mb": (None if child_rss is None
+                                 else round(child_rss, 1)),
+    }
+
+
+def compare(current, baseline, tolerance=0.25, min_seconds=0.05):
+    """Stages (and peak RSS) that got more than tolerance slower / bigger
+    than baseline. Differences under min_seconds are timer noise and are
+    never flagged."""
+    regressions = []
+    for stage, base in baseline.get("stages", {}).items():
+        now = current["stages"].get(stage)
+        if now is None or not base:
+            continue
+        if now > base * (1 + tolerance) and now - base >= min_seconds:
+            regressions.append({"stage": stage, "baseline": base,
+                                "current": now,
+                                "ratio": round(now / base, 2)})
+    base, now = baseline.get("peak_rss_mb"), current.get("peak_rss_mb")
+    if base and now and now > base * (1 + tolerance):
+        regressions.append({"stage": "peak_rss_mb", "baseline": base,
+                            "current": now, "ratio": round(now / base, 2)})
+    return regressions
+
+
+# ---- legacy .xls reader ----
+
+def read_xls_pandas(path) -> dscit.FileResult:
+    """process_file's .xls path before the xlrd reader: the whole sheet
+    through pd.read_excel, then back out as row tuples."""
+    res = dscit.FileResult(file=os.path.basename(path))
+    try:
+        xls = pd.ExcelFile(path)
+        sheet_name = dscit.find_dscit_sheet(xls.sheet_names)
+        if not sheet_name:
+            res.status, res.message = "ERROR", "No DSCIT sheet found"
+            return res
+        res.sheet = sheet_name
+        df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
+        return dscit._extract(df.itertuples(index=False, name=None), res)
+    except Exception as e:
+        res.status, res.message = "ERROR", f"{type(e).__name__}: {e}"
+        return res
+
+
+def _filled_rows(res):
+    """Extracted rows holding at least one value. read_excel gives empty
+    cells as NaN, which the blank-row test does not take for blank, so the
+    old path also kept blank and ghost rows (as all-NaN records, but for
+    the "Not Specified" Database Type)."""
+    if res.data is None:
+        return 0
+    cols = [c for c in dscit.TARGET_COLUMNS if c != "Database Type"]
+    return int(res.data[cols + ["Database Type (Original)"]].notna()
+               .any(axis=1).sum())
+
+
+def _timed_pool(fn, paths, workers):
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = sum(r.rows for r in pool.map(fn, paths))
+    return time.perf_counter() - t0, rows
+
+
+def bench_xls(corpus, repeat=3, workers=None) -> dict:
+    """Time the .xls reader against read_xls_pandas over every .xls file
+    in corpus: serially per file (median over repeat) and as one
+    process-pool pass. Files where the two disagree on status, header row
+    or the number of non-empty rows extracted are listed under
+    "mismatches"."""
+    paths = sorted(p for p in dscit.discover_files(corpus)
+                   if p.lower().endswith(".xls"))
+    if not paths:
+        raise ValueError(f"no .xls files in {corpus}")
+    workers = workers or dscit.default_workers("process")
+    readers = {"pandas": read_xls_pandas, "xlrd": dscit.process_file}
+    serial = {k: 0.0 for k in readers}
+    rows, mismatches = 0, []
+    for p in paths:
+        out = {}
+        for k, fn in readers.items():
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                out[k] = fn(p)
+                times.append(time.perf_counter() - t0)
+            serial[k] += statistics.median(times)
+        a, b = out["pandas"], out["xlrd"]
+        rows += b.rows
+        a = [a.status, a.header_row, _filled_rows(a)]
+        b = [b.status, b.header_row, _filled_rows(b)]
+        if a != b:
+            mismatches.append({"file": out["xlrd"].file, "pandas": a,
+                               "xlrd": b})
+    pooled = {k: statistics.median(_timed_pool(fn, paths, workers)[0]
+                                   for _ in range(repeat))
+              for k, fn in readers.items()}
+    return {
+        "recorded": datetime.now().isoformat(timespec="seconds"),
+        "corpus": {"path": os.path.abspath(corpus), "xls_files": len(paths),
+                   "rows": rows},
+        "workers": workers, "repeat": repeat,
+        "serial": {k: round(v, 4) for k, v in serial.items()},
+        "pool": {k: round(v, 4) for k, v in pooled.items()},
+        "rows_per_second": {k: round(rows / max(v, 1e-9), 1)
+                            for k, v in serial.items()},
+        "speedup": round(serial["pandas"] / max(serial["xlrd"], 1e-9), 2),
+        "mismatches": mismatches,
+    }
+
+
+def _print_report(record, baseline=None):
+    c = record["corpus"]
+    print(f"Corpus: {c['files']} files, {c['rows']:,} rows "
+          f"({c['rows_after_dedup']:,} after dedup)  "
+          f"executor={record['config']['executor']} "
+          f"workers={record['config']['workers']}")
+    base = (baseline or {}).get("stages", {})
+    for stage, secs in record["stages"].items():
+        line = f"  {stage:<10} {secs:9.3f}s"
+        if stage in base and base[stage]:
+            line += f"   baseline {base[stage]:9.3f}s  " \
+                    f"x{secs / base[stage]:.2f}"
+        print(line)
+    print(f"  throughput {record['rows_per_second']:,.0f} rows/s   "
+          f"peak RSS {record['peak_rss_mb']} MB "
+          f"(workers {record['peak_rss_children_mb']} MB)")
+
+
+# ============================================================================
+# 3. ENTRY
+# ============================================================================
+
+def _row_range(value):
+    lo, _, hi = value.partition(":")
+    lo, hi = int(lo), int(hi or lo)
+    if lo < 1 or hi < lo:
+        raise argparse.ArgumentTypeError("rows must be N or MIN:MAX")
+    return lo, hi
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(
+        description="Synthetic DSCIT corpus generator and benchmark.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    g = sub.add_parser("generate", help="write a synthetic corpus")
+    g.add_argument("folder")
+    g.add_argument("--files", type=int, default=40)
+    g.add_argument("--rows", type=_row_range, default=(50, 500),
+                   help="data rows per workbook, N or MIN:MAX")
+    g.add_argument("--seed", type=int, default=1)
+    g.add_argument("--templates", type=int, default=4)
+    g.add_argument("--dup-files", type=float, default=0.08,
+                   help="share of workbooks that also get a byte copy")
+    g.add_argument("--reissues", type=float, default=0.08,
+                   help="share of workbooks re-issued under a later date")
+    g.add_argument("--dup-rows", type=float, default=0.05,
+                   help="repeated rows inside a workbook, per data row")
+    g.add_argument("--overlap", type=float, default=0.2,
+                   help="share of workbooks repeating the previous one's rows")
+    g.add_argument("--ghost", type=float, default=0.25,
+                   help="share of workbooks with ghost formatting rows")
+    g.add_argument("--xls", type=float, default=0.0,
+                   help="share of workbooks written as legacy .xls")
+
+    r = sub.add_parser("run", help="benchmark a corpus")
+    r.add_argument("folder")
+    r.add_argument("--repeat", type=int, default=3)
+    r.add_argument("--executor", choices=dscit.EXECUTORS, default="thread")
+    r.add_argument("--workers", type=int, default=None)
+    r.add_argument("--formats", default="xlsx",
+                   help=f"comma list from {dscit.OUTPUT_FORMATS}")
+    r.add_argument("--cache-dir", default=None,
+                   help="use (and warm) an extraction cache here")
+    r.add_argument("--no-dashboard", action="store_true")
+    r.add_argument("--baseline", help="baseline JSON to compare against")
+    r.add_argument("--save-baseline", metavar="PATH",
+                   help="write this run's record as the new baseline")
+    r.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed slowdown per stage (0.25 = 25%%)")
+    r.add_argument("--json", action="store_true",
+                   help="print the run record as JSON")
+
+    x = sub.add_parser("xls", help="benchmark the legacy .xls reader")
+    x.add_argument("folder")
+    x.add_argument("--repeat", type=int, default=3)
+    x.add_argument("--workers", type=int, default=None)
+    args = p.parse_args(argv)
+
+    if args.command == "generate":
+        m = generate_corpus(args.folder, args.files, args.rows, args.seed,
+                            args.templates, args.dup_files, args.reissues,
+                            args.dup_rows, args.overlap, args.ghost,
+                            args.xls)
+        print(json.dumps(m["stats"], indent=2))
+        return 0
+    if args.command == "xls":
+        print(json.dumps(bench_xls(args.folder, args.repeat, args.workers),
+                         indent=2))
+        return 0
+
+    formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    record = run_benchmark(args.folder, args.repeat, args.executor,
+                           args.workers, formats, args.cache_dir,
+                           not args.no_dashboard)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if (baseline.get("corpus", {}).get("rows"), baseline.get("config")) \
+                != (record["corpus"]["rows"], record["config"]):
+            print("WARNING: baseline was recorded on a different corpus or "
+                  "configuration; ratios are not comparable.",
+                  file=sys.stderr)
+    if args.json:
+        print(json.dumps(record, indent=2))
+    else:
+        _print_report(record, baseline)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+    if baseline:
+        regressions = compare(record, baseline, args.tolerance)
+        for reg in regressions:
+            print(f"REGRESSION {reg['stage']}: {reg['baseline']} -> "
+                  f"{reg['current']} (x{reg['ratio']})", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
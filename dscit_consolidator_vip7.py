@@ -11,7 +11,8 @@ v2 enhancements:
   * New "Generate Executive Dashboard" button in the UI
 
 Run:  python dscit_consolidator.py
-Requires:  pip install openpyxl pandas
+Batch:  python dscit_consolidator.py <folder> [--progress json] (see --help)
+Requires:  pip install openpyxl pandas pyarrow   (+ xlrd for legacy .xls files)
 """
 
 import os
@@ -20,17 +21,34 @@ import sys
 import glob
 import json
 import hashlib
+import argparse
+import base64
 import html
+import importlib.util
+import itertools
+import operator
 import queue
 import threading
+import time
 import traceback
 import webbrowser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed, wait)
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
+
+# Parquet needs pyarrow (a declared requirement); without it the extraction
+# cache stays empty and columnar sidecars are unavailable.
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+# Legacy .xls workbooks are read with xlrd (2.x still reads BIFF .xls).
+XLRD_AVAILABLE = importlib.util.find_spec("xlrd") is not None
 
 # ============================================================================
 # 1. EXTRACTION ENGINE
@@ -128,6 +146,8 @@ COLUMN_ALIASES = {
 
 HEADER_SCAN_ROWS = 40
 HEADER_SCAN_COLS = 5
+BANNER_ROWS = 6           # rows above the header searched for section banners
+GHOST_ROW_LIMIT = 300     # consecutive blank rows that end the data block
 SHEET_KEY = "dscit"
 
 
@@ -146,14 +166,22 @@ def find_dscit_sheet(sheetnames):
 
 
 def find_header_row(rows):
-    for idx, row in enumerate(rows[:HEADER_SCAN_ROWS]):
+    """Find the 'Object ID' header row within the first HEADER_SCAN_ROWS.
+
+    rows may be any iterable. An iterator is consumed only up to and
+    including the header row, so the caller can keep streaming data rows
+    from it. Returns (idx, header, banner), banner being the BANNER_ROWS
+    rows directly above the header, or (None, None, None)."""
+    banner = deque(maxlen=BANNER_ROWS)
+    for idx, row in enumerate(itertools.islice(rows, HEADER_SCAN_ROWS)):
         for cell in row[:HEADER_SCAN_COLS]:
             n = _norm(cell)
             if n == "objectid":
-                return idx, row
+                return idx, row, list(banner)
             if n:
                 break
-    return None, None
+        banner.append(row)
+    return None, None, None
 
 
 _LINEAGE_BANNER_KEYS = ("dataflowlinkage", "dataflowlineage",
@@ -161,20 +189,26 @@ _LINEAGE_BANNER_KEYS = ("dataflowlinkage", "dataflowlineage",
                         "linkageinformation")
 
 
-def find_lineage_boundary(rows, hdr_idx):
-    """Locate the column where the 'Data Flow Linkage Information' section
-    begins by scanning the banner rows just above the header row. Merged
-    banner cells surface their value at the section's first column."""
-    for row in rows[max(0, hdr_idx - 6):hdr_idx]:
+def _banner_boundary(banner):
+    for row in banner:
         for i, cell in enumerate(row):
             n = _norm(cell)
             if n and any(k in n for k in _LINEAGE_BANNER_KEYS):
                 return i
+    return None
+
+
+def find_lineage_boundary(banner, header):
+    """Locate the column where the 'Data Flow Linkage Information' section
+    begins by scanning the banner rows just above the header row. Merged
+    banner cells surface their value at the section's first column."""
+    i = _banner_boundary(banner)
+    if i is not None:
+        return i
     # No banner found: infer from the header row itself. A bare "System"
     # header followed by bare "Database"/"Schema"/"Physical Table..." is the
     # signature of the Data Flow Linkage block (source-side headers are
     # always qualified, e.g. "Database Name", "Source Physical Table...").
-    header = rows[hdr_idx]
     followers = ("database", "schema")
     for i in range(len(header) - 1, -1, -1):
         if _norm(header[i]) != "system":
@@ -191,11 +225,15 @@ def map_columns(header_row, lineage_start=None):
     mapping, claimed = {}, set()
 
     src_targets = [t for t in TARGET_COLUMNS if t not in LINEAGE_COLUMNS]
+    # Header cells in column order, split at the lineage boundary once;
+    # the passes below skip claimed cells instead of re-sorting.
+    src = sorted((i, h) for i, h in headers.items()
+                 if lineage_start is None or i < lineage_start)
+    lin = sorted((i, h) for i, h in headers.items()
+                 if lineage_start is None or i >= lineage_start)
 
     def src_items():
-        return sorted((i, h) for i, h in headers.items()
-                      if i not in claimed
-                      and (lineage_start is None or i < lineage_start))
+        return ((i, h) for i, h in src if i not in claimed)
 
     order = sorted(src_targets, key=lambda t: -len(_norm(t)))
     for target in order:                                    # exact pass
@@ -221,9 +259,7 @@ def map_columns(header_row, lineage_start=None):
 
     # ---- lineage side ----
     def lin_items():
-        return sorted((i, h) for i, h in headers.items()
-                      if i not in claimed
-                      and (lineage_start is None or i >= lineage_start))
+        return ((i, h) for i, h in lin if i not in claimed)
 
     lorder = sorted(LINEAGE_COLUMNS, key=lambda t: -len(_norm(t)))
     for target in lorder:                                   # exact pass
@@ -253,6 +289,59 @@ def map_columns(header_row, lineage_start=None):
     return mapping
 
 
+# ---- template registry ----
+# Nearly every DSCIT workbook is one of a handful of template versions, so
+# the column mapping and lineage boundary are resolved once per distinct
+# layout and reused. The fingerprint is the normalised header row (trailing
+# blanks dropped) plus the banner column holding the lineage section title,
+# the only part of the banner rows the resolution reads, so per-report
+# titles in the banner do not split one template into many.
+
+TEMPLATE_REGISTRY_MAX = 256
+
+
+@dataclass
+class Template:
+    id: str
+    mapping: dict
+    lineage_start: int | None
+
+
+class TemplateRegistry:
+    """Header fingerprint -> resolved Template. Thread-safe; each worker
+    process of a process pool keeps its own."""
+
+    def __init__(self, limit=TEMPLATE_REGISTRY_MAX):
+        self.limit = limit
+        self.templates = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(banner, header) -> str:
+        norm = [_norm(h) for h in header]
+        while norm and not norm[-1]:
+            norm.pop()
+        blob = json.dumps([_banner_boundary(banner), norm])
+        return hashlib.md5(blob.encode("utf-8")).hexdigest()
+
+    def resolve(self, banner, header) -> Template:
+        key = self.fingerprint(banner, header)
+        t = self.templates.get(key)
+        if t is not None:
+            return t
+        lineage_start = find_lineage_boundary(banner, header)
+        t = Template(id=f"T-{key[:8]}",
+                     mapping=map_columns(header, lineage_start),
+                     lineage_start=lineage_start)
+        with self._lock:
+            if len(self.templates) < self.limit:
+                t = self.templates.setdefault(key, t)
+        return t
+
+
+TEMPLATES = TemplateRegistry()
+
+
 # ============================================================================
 # 2. DATABASE TYPE NORMALIZATION
 # ============================================================================
@@ -285,8 +374,164 @@ DB_TYPE_RULES = [
 _DB_RULES_COMPILED = [(re.compile(p), canon) for p, canon in DB_TYPE_RULES]
 
 
+# ---- memoised normalisers + learned mapping table ----
+# Raw Database Type / Data Element Indicator spellings repeat endlessly
+# across files (a few hundred distinct values), so each distinct value is
+# canonicalised once and remembered. With a cache folder the table also
+# persists as normalization.json: values learned in earlier runs under the
+# same rules skip the regex work entirely, and the table is the audit
+# record behind the "DB Type Mapping" sheet.
+
+NORMALIZATION_VERSION = 1    # bump when the normaliser functions change
+NORMALIZATION_FILE = "normalization.json"
+NORMALIZER_MAX_VALUES = 100_000
+_JSON_RAW_TYPES = {"str": str, "int": int, "float": float, "bool": bool}
+
+
+def normalization_rules() -> str:
+    blob = json.dumps([NORMALIZATION_VERSION, DB_TYPE_RULES])
+    return hashlib.md5(blob.encode("utf-8")).hexdigest()[:12]
+
+
+class Normalizer:
+    """(kind, raw value) -> canonical value, computed once per distinct raw
+    value. record() keeps per-value audit entries (rows, runs, first and
+    last seen) that load() / save() persist between runs."""
+
+    def __init__(self):
+        self.rules = normalization_rules()
+        self.memo = {}               # (kind, type name, raw) -> canonical
+        self.entries = {}            # same key -> audit record
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(kind, raw):
+        if raw is None or raw is pd.NA or \
+                (isinstance(raw, float) and raw != raw):
+            return None
+        return kind, type(raw).__name__, raw
+
+    def lookup(self, kind, raw, fn):
+        key = self._key(kind, raw)
+        try:
+            return self.memo[key]
+        except KeyError:
+            pass
+        except TypeError:                    # unhashable cell value
+            return fn(raw)
+        out = fn(raw)
+        if key is not None and len(self.memo) < NORMALIZER_MAX_VALUES:
+            self.memo[key] = out
+        return out
+
+    def seed(self, memo):
+        self.memo.update(memo)
+
+    def record(self, kind, series, fn):
+        """Fold this run's distinct raw values of series (and their row
+        counts) into the audit entries."""
+        cat = series.array if isinstance(series.dtype, pd.CategoricalDtype) \
+            else encode(series)
+        counts = np.bincount(np.asarray(cat.codes) + 1,
+                             minlength=len(cat.categories) + 1)[1:]
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            for raw, rows in zip(cat.categories, counts):
+                key = self._key(kind, raw)
+                if key is None or not rows:
+                    continue
+                try:
+                    e = self.entries.get(key)
+                except TypeError:
+                    continue
+                if e is None:
+                    e = self.entries[key] = {
+                        "kind": kind, "raw_type": key[1],
+                        "raw": raw if key[1] in _JSON_RAW_TYPES
+                        else str(raw),
+                        "first_seen": now, "runs": 0}
+                e.update(canonical=self.lookup(kind, raw, fn),
+                         rows=int(rows), last_seen=now, runs=e["runs"] + 1)
+
+    def load(self, path=None):
+        """Start a run's audit table: the one saved at path, or an empty
+        one. Memoised values are kept either way."""
+        with self._lock:
+            self.entries = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                blob = json.load(f)
+        except (OSError, TypeError, ValueError):
+            return
+        if blob.get("rules") != self.rules:  # rules changed: relearn
+            return
+        with self._lock:
+            for e in blob.get("entries", []):
+                typ = _JSON_RAW_TYPES.get(e.get("raw_type"))
+                raw = typ(e["raw"]) if typ else e["raw"]
+                key = (e["kind"], e["raw_type"], raw)
+                self.entries[key] = e
+                if typ:
+                    self.memo[key] = e["canonical"]
+
+    def save(self, path):
+        blob = {"rules": self.rules, "saved":
+                datetime.now().isoformat(timespec="seconds"),
+                "entries": sorted(self.entries.values(),
+                                  key=lambda e: (e["kind"], str(e["raw"])))}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(blob, f, indent=1, ensure_ascii=False, default=str)
+        os.replace(tmp, path)
+
+    def audit_map(self, kind, series, fn):
+        """Raw value -> canonical value with this frame's row counts and the
+        table's first-seen / runs columns (the "DB Type Mapping" sheet)."""
+        cat = series.array if isinstance(series.dtype, pd.CategoricalDtype) \
+            else encode(series)
+        counts = np.bincount(np.asarray(cat.codes) + 1,
+                             minlength=len(cat.categories) + 1)
+        raws = [None] + list(cat.categories)
+        keep = [i for i, c in enumerate(counts) if c]
+        na = pd.array([None], dtype=cat.categories.dtype)[0]
+        m = pd.DataFrame({
+            "Raw Value": pd.Series([raws[i] for i in keep], dtype=object),
+            "Normalized To": [self.lookup(kind, na if i == 0 else raws[i],
+                                          fn) for i in keep],
+            "Rows": counts[keep].astype(np.int64)})
+        try:                                 # raw values are unique here;
+            m = (m.groupby(["Raw Value", "Normalized To"],  # this orders
+                           dropna=False)["Rows"].sum().reset_index())
+        except TypeError:                    # unorderable mixed raw types
+            pass
+        m = m.sort_values(["Normalized To", "Rows"], ascending=[True, False])
+
+        def entry(raw, col):
+            try:
+                e = self.entries.get(self._key(kind, raw))
+            except TypeError:
+                e = None
+            return e.get(col) if e else None
+        m["First Seen"] = [entry(r, "first_seen") for r in m["Raw Value"]]
+        m["Runs Seen"] = pd.array([entry(r, "runs") for r in m["Raw Value"]],
+                                  dtype="Int64")
+        return m
+
+
+NORMALIZER = Normalizer()
+
+
+def _seed_normalizer(memo):
+    """Process-pool initializer: start workers with the learned values."""
+    NORMALIZER.seed(memo)
+
+
 def normalize_db_type(raw):
-    """Map any raw Database Type variant to a canonical name."""
+    """Map any raw Database Type variant to a canonical name (memoised)."""
+    return NORMALIZER.lookup("db_type", raw, _normalize_db_type)
+
+
+def _normalize_db_type(raw):
     if raw is None or (isinstance(raw, float) and raw != raw) \
             or str(raw).strip() == "":
         return "Not Specified"
@@ -310,11 +555,14 @@ class FileResult:
     status: str = "OK"
     sheet: str = ""
     header_row: int | None = None
+    template: str = ""
     rows: int = 0
     matched: int = 0
     missing: list = field(default_factory=list)
     message: str = ""
+    cached: bool = False
     data: pd.DataFrame | None = None
+    row_hash: np.ndarray | None = None       # (rows, 2) uint64, see below
 
 
 def human_size(n):
@@ -334,16 +582,10 @@ def process_file(path: str) -> FileResult:
         pass
     try:
         if fname.lower().endswith(".xls"):
-            xls = pd.ExcelFile(path)
-            sheet_name = find_dscit_sheet(xls.sheet_names)
-            if not sheet_name:
-                res.status, res.message = "ERROR", "No DSCIT sheet found"
-                return res
-            res.sheet = sheet_name
-            df = pd.read_excel(xls, sheet_name=sheet_name, header=None)
-            rows = [tuple(r) for r in df.itertuples(index=False, name=None)]
-            return _extract(rows, res)
+            return _process_xls(path, res)
 
+        # The sheet is streamed straight into _extract, which stops reading
+        # at the ghost-row cutoff; the workbook stays open until it is done.
         wb = load_workbook(path, read_only=True, data_only=True)
         try:
             sheet_name = find_dscit_sheet(wb.sheetnames)
@@ -352,25 +594,203 @@ def process_file(path: str) -> FileResult:
                 return res
             res.sheet = sheet_name
             ws = wb[sheet_name]
-            rows = [tuple(r) for r in ws.iter_rows(values_only=True)]
+            return _extract(ws.iter_rows(values_only=True), res)
         finally:
             wb.close()
-        return _extract(rows, res)
     except Exception as e:
         res.status = "ERROR"
         res.message = f"{type(e).__name__}: {e}"
         return res
 
 
+# ---- legacy .xls ----
+# xlrd opens the workbook on demand, so only the globals and the DSCIT sheet
+# are parsed; the sheet's rows are handed to _extract through the public
+# row_values / row_types API as openpyxl-style value tuples.
+
+def _process_xls(path, res: FileResult) -> FileResult:
+    if not XLRD_AVAILABLE:
+        res.status = "ERROR"
+        res.message = "Legacy .xls needs xlrd (pip install xlrd)"
+        return res
+    import xlrd
+    wb = xlrd.open_workbook(path, on_demand=True)
+    try:
+        sheet_name = find_dscit_sheet(wb.sheet_names())
+        if not sheet_name:
+            res.status, res.message = "ERROR", "No DSCIT sheet found"
+            return res
+        res.sheet = sheet_name
+        return _extract(_xls_rows(wb.sheet_by_name(sheet_name), wb.datemode),
+                        res)
+    finally:
+        wb.release_resources()
+
+
+def _xls_converters(datemode):
+    """{xlrd cell type: fn(raw value)} giving openpyxl's value types:
+    whole numbers as int, dates as datetime (time for time-only cells),
+    booleans as bool and error cells as their text ("#N/A")."""
+    import xlrd
+
+    def number(v):
+        return int(v) if v.is_integer() else v
+
+    def xldate(v):
+        try:
+            dt = xlrd.xldate.xldate_as_datetime(v, datemode)
+        except Exception:                  # out-of-range serial
+            return v
+        return dt.time() if 0 <= v < 1 else dt
+
+    return {xlrd.XL_CELL_NUMBER: number, xlrd.XL_CELL_DATE: xldate,
+            xlrd.XL_CELL_BOOLEAN: bool,
+            xlrd.XL_CELL_ERROR: xlrd.error_text_from_code.get}
+
+
+def _xls_rows(sheet, datemode):
+    """Yield an xlrd sheet's rows as value tuples (empty cells as None)."""
+    import xlrd
+    text = xlrd.XL_CELL_TEXT
+    convert = _xls_converters(datemode)
+    for i in range(sheet.nrows):
+        values, types = sheet.row_values(i), sheet.row_types(i)
+        if types.count(text) != len(types):
+            for j, t in enumerate(types):
+                if t != text:
+                    f = convert.get(t)
+                    values[j] = f(values[j]) if f else None
+        yield tuple(values)
+
+
+# ---- column-oriented row extraction ----
+# Data rows are pulled from the sheet iterator in blocks; each block is cut
+# down to the mapped columns in one pass and blank detection, stripping and
+# the ghost-row search run as array operations over the whole block.
+
+EXTRACT_BLOCK_ROWS = 4096
+
+
+def _row_blocks(rows, idxs, size=EXTRACT_BLOCK_ROWS):
+    """Yield (n, len(idxs)) object arrays holding the idxs columns of the
+    next size rows. Only the mapped cells are picked out of each row (one
+    C-level itemgetter call per row) and streamed straight into the
+    array; short rows are padded with None."""
+    width = max(idxs) + 1
+    pick = operator.itemgetter(*idxs) if len(idxs) > 1 \
+        else (lambda r, i=idxs[0]: (r[i],))
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        if min(map(len, chunk)) < width:
+            pad = (None,) * width
+            chunk = [r if len(r) >= width else tuple(r) + pad[len(r):]
+                     for r in chunk]
+        flat = np.fromiter(itertools.chain.from_iterable(map(pick, chunk)),
+                           dtype=object, count=len(chunk) * len(idxs))
+        yield flat.reshape(len(chunk), len(idxs))
+        if len(chunk) < size:
+            return
+
+
+class _CellMemo(dict):
+    """Cell value -> code for one sheet, with per-code tables: the cleaned
+    value (strings stripped, whitespace-only strings as None), whether the
+    value is a string, and whether it is blank. Each distinct value is
+    cleaned once however often it repeats."""
+
+    def __init__(self):
+        super().__init__()
+        self.clean, self.is_str, self.blank = [], [], []
+        self._tables = (np.empty(0, dtype=object), np.empty(0, dtype=bool),
+                        np.empty(0, dtype=bool))
+
+    def __missing__(self, value):
+        code = len(self.clean)
+        if isinstance(value, str):
+            text = value.strip()
+            self.clean.append(text or None)
+            self.is_str.append(True)
+            self.blank.append(not text)
+        else:
+            self.clean.append(value)
+            self.is_str.append(False)
+            self.blank.append(value is None)
+        self[value] = code
+        return code
+
+    def tables(self):
+        """The per-code tables as arrays; only codes added since the last
+        call are converted."""
+        clean, is_str, blank = self._tables
+        done = len(clean)
+        if done < len(self.clean):
+            tail = np.empty(len(self.clean) - done, dtype=object)
+            tail[:] = self.clean[done:]
+            self._tables = (np.concatenate([clean, tail]),
+                            np.concatenate([is_str, self.is_str[done:]]).astype(bool),
+                            np.concatenate([blank, self.blank[done:]]).astype(bool))
+        return self._tables
+
+
+def _clean_block(block, memo=None):
+    """Return (columns, blank_rows): columns is the block transposed to
+    (n_cols, n_rows), so every output column is one contiguous slice.
+    Strings are stripped; None and whitespace-only strings become None.
+    A row is blank when every cell is.
+
+    Cells are coded by value through `memo` (a _CellMemo, shared across a
+    sheet's blocks) in one C-level map and the cleaned values broadcast
+    back through the codes. Equal values share a code across types (True,
+    1 and 1.0), so only string cells take their code's cleaned value;
+    every other cell is passed through untouched. Only None is blank, NaN
+    stays NaN."""
+    memo = _CellMemo() if memo is None else memo
+    raw = np.ascontiguousarray(block.T).ravel()
+    codes = np.fromiter(map(memo.__getitem__, raw), dtype=np.intp,
+                        count=len(raw))
+    clean, is_str, blank = memo.tables()
+
+    hit = is_str[codes]
+    raw[hit] = clean[codes[hit]]           # raw is our own transposed copy
+    n_cols, n_rows = block.shape[1], block.shape[0]
+    return raw.reshape(n_cols, n_rows), \
+        blank[codes].reshape(n_cols, n_rows).all(axis=0)
+
+
+def _ghost_cutoff(blank, run):
+    """Index of the first row at which GHOST_ROW_LIMIT consecutive blank
+    rows have been seen (run blanks carried in from earlier blocks), or
+    None."""
+    pos = np.arange(len(blank))
+    last = np.maximum.accumulate(np.where(blank, -1 - run, pos))
+    hit = np.flatnonzero(blank & (pos - last >= GHOST_ROW_LIMIT))
+    return int(hit[0]) if len(hit) else None
+
+
+def _trailing_blanks(blank, run):
+    nonblank = np.flatnonzero(~blank)
+    if not len(nonblank):
+        return run + len(blank)
+    return len(blank) - 1 - int(nonblank[-1])
+
+
 def _extract(rows, res: FileResult) -> FileResult:
-    hdr_idx, header = find_header_row(rows)
+    """Single pass over a sheet's rows (any iterable, typically a lazy
+    worksheet iterator): locate the header, map columns, then collect data
+    rows until GHOST_ROW_LIMIT consecutive blanks. Only the banner rows and
+    the extracted records are held in memory."""
+    rows = iter(rows)
+    hdr_idx, header, banner = find_header_row(rows)
     if hdr_idx is None:
         res.status, res.message = "ERROR", "Header row with 'Object ID' not found"
         return res
     res.header_row = hdr_idx + 1
 
-    lineage_start = find_lineage_boundary(rows, hdr_idx)
-    mapping = map_columns(header, lineage_start)
+    tpl = TEMPLATES.resolve(banner, header)
+    mapping = tpl.mapping
+    res.template = tpl.id
     res.matched = len(mapping)
     res.missing = [t for t in TARGET_COLUMNS if t not in mapping]
     if not mapping:
@@ -380,36 +800,177 @@ def _extract(rows, res: FileResult) -> FileResult:
         res.status = "WARN"
         res.message = f"{len(res.missing)} column(s) not found"
 
-    records = []
-    consecutive_blank = 0
-    for row in rows[hdr_idx + 1:]:
-        rec, blank = {}, True
-        for target in TARGET_COLUMNS:
-            idx = mapping.get(target)
-            val = row[idx] if (idx is not None and idx < len(row)) else None
-            if val is not None and str(val).strip() != "":
-                blank = False
-                rec[target] = str(val).strip() if isinstance(val, str) else val
-            else:
-                rec[target] = None
-        if not blank:
-            records.append(rec)
-            consecutive_blank = 0
-        else:
-            consecutive_blank += 1
-            if consecutive_blank >= 300:      # stray-formatting ghost rows
-                break
-
-    df = pd.DataFrame(records, columns=TARGET_COLUMNS)
+    targets = [t for t in TARGET_COLUMNS if t in mapping]
+    blocks, run, memo = [], 0, _CellMemo()
+    for block in _row_blocks(rows, [mapping[t] for t in targets]):
+        values, blank = _clean_block(block, memo)
+        keep = ~blank
+        cut = _ghost_cutoff(blank, run)
+        if cut is not None:                  # stray-formatting ghost rows
+            keep[cut:] = False
+        blocks.append(values[:, keep])
+        if cut is not None:
+            break
+        run = _trailing_blanks(blank, run)
+
+    values = np.concatenate(blocks, axis=1) if blocks else \
+        np.empty((len(targets), 0), dtype=object)
+    if values.shape[1]:
+        # values is already laid out as one object block (column-major),
+        # so the frame wraps it without copying
+        df = pd.DataFrame(values.T, columns=targets, copy=False)
+        df = df.infer_objects()
+        for i, t in enumerate(TARGET_COLUMNS):
+            if t not in mapping:
+                df.insert(i, t, None)
+    else:
+        df = pd.DataFrame(columns=TARGET_COLUMNS)
+    df = encode_frame(df)
     # --- Database Type normalization (keep original for audit) ---
     df["Database Type (Original)"] = df["Database Type"]
-    df["Database Type"] = df["Database Type"].map(normalize_db_type)
-    df.insert(0, "DSCIT File Name", res.file)
+    df["Database Type"] = map_encoded(df["Database Type"], normalize_db_type)
+    df[LINEAGE_MASK] = lineage_mask(df)
+    df.insert(0, "DSCIT File Name", constant_column(res.file, len(df)))
     res.rows = len(df)
     res.data = df
+    res.row_hash = row_hash128(df)
     return res
 
 
+# ---- dictionary-encoded frames ----
+# Extracted and consolidated frames hold every column as a pandas
+# Categorical with object-dtype categories: DSCIT columns are a few
+# thousand distinct owners / types / systems repeated over millions of
+# rows. Concatenation, row dedup and analytics work on the integer codes;
+# values are decoded only where they are written out.
+
+def encode(values) -> pd.Categorical:
+    """Dictionary-encode values (categories in first-seen order, missing
+    values as code -1)."""
+    if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype):
+        cat = pd.Categorical(values)
+        if cat.categories.dtype == object:
+            return cat
+        return pd.Categorical.from_codes(
+            cat.codes, pd.Index(np.asarray(cat.categories, dtype=object),
+                                dtype=object))
+    codes, uniques = pd.factorize(values)
+    return pd.Categorical.from_codes(
+        codes, pd.Index(np.asarray(uniques, dtype=object), dtype=object))
+
+
+def encode_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({c: df[c] if c == LINEAGE_MASK else encode(df[c])
+                         for c in df.columns},
+                        index=df.index, columns=df.columns)
+
+
+def constant_column(value, n) -> pd.Categorical:
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8),
+                                     pd.Index([value], dtype=object))
+
+
+def decode(series: pd.Series) -> pd.Series:
+    """Plain (non-categorical) copy of series in its categories' dtype."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(series.cat.categories.dtype)
+    return series
+
+
+def map_encoded(series: pd.Series, fn) -> pd.Series:
+    """series.map(fn) evaluated once per distinct value. Categorical input
+    gives categorical output; fn also sees the missing value (None, or
+    pd.NA for string categories) exactly as an element-wise map would."""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.map(fn)
+    cats = series.cat.categories
+    na = pd.array([None], dtype=cats.dtype)[0]
+    out = np.empty(len(cats) + 1, dtype=object)
+    out[:] = [fn(v) for v in cats] + [fn(na)]
+    codes, uniques = pd.factorize(out)
+    return pd.Series(pd.Categorical.from_codes(
+        codes[series.cat.codes.to_numpy()],
+        pd.Index(np.asarray(uniques, dtype=object), dtype=object)),
+        index=series.index, name=series.name)
+
+
+def fill_encoded(series: pd.Series, value) -> pd.Series:
+    """series.fillna(value), adding value as a category when needed."""
+    if isinstance(series.dtype, pd.CategoricalDtype) \
+            and value not in series.cat.categories:
+        cats = series.cat.categories
+        series = series.cat.add_categories(pd.Index([value], dtype=cats.dtype))
+    return series.fillna(value)
+
+
+def concat_encoded(frames, columns) -> pd.DataFrame:
+    """Row-concatenate encoded frames, unioning each column's categories
+    (sorted where the values allow, so groupby order matches plain
+    object columns). The lineage mask is concatenated as plain uint8."""
+    data = {}
+    for c in columns:
+        if c == LINEAGE_MASK:
+            data[c] = np.concatenate(
+                [lineage_mask(f) for f in frames]
+                or [np.empty(0, dtype=np.uint8)])
+            continue
+        parts = [encode(f[c]) if c in f else
+                 pd.Categorical.from_codes(np.full(len(f), -1, np.int8),
+                                           pd.Index([], dtype=object))
+                 for f in frames]
+        try:
+            data[c] = union_categoricals(parts, sort_categories=True)
+        except TypeError:                  # mixed types do not sort
+            data[c] = union_categoricals(parts)
+    return pd.DataFrame(data, columns=columns)
+
+
+# ---- lineage bitmask ----
+# Lineage status is asked for by the analytics, the dashboard and the
+# workbook alike. Each row carries it once, as a uint8 with bit j set when
+# LINEAGE_COLUMNS[j] holds a real value (not blank or a placeholder such
+# as "N/A" / "TBD"); status and per-field presence are read off the bits.
+
+LINEAGE_MASK = "Lineage Mask"
+LINEAGE_FULL = (1 << len(LINEAGE_COLUMNS)) - 1
+LINEAGE_STATUS = ("Full Lineage", "Partial Lineage", "No Lineage")
+_MISSING_TEXT = ("", "na", "n/a", "none", "null", "tbd", "-")
+
+
+def _has_value(v) -> bool:
+    if v is None or v is pd.NA or (isinstance(v, float) and v != v):
+        return False
+    return str(v).strip().lower() not in _MISSING_TEXT
+
+
+def lineage_mask(df: pd.DataFrame) -> np.ndarray:
+    """The frame's LINEAGE_MASK column, computed from the lineage columns
+    (once per distinct value) when the frame does not carry one."""
+    if LINEAGE_MASK in df:
+        return df[LINEAGE_MASK].to_numpy(np.uint8)
+    mask = np.zeros(len(df), dtype=np.uint8)
+    for j, c in enumerate(LINEAGE_COLUMNS):
+        if c not in df:
+            continue
+        cat = encode(df[c])
+        has = np.array([_has_value(v) for v in cat.categories] + [False])
+        mask |= has[np.asarray(cat.codes)].astype(np.uint8) << j
+    return mask
+
+
+def lineage_present(mask, column) -> np.ndarray:
+    """Rows whose lineage field `column` is populated."""
+    return (np.asarray(mask) >> LINEAGE_COLUMNS.index(column) & 1) \
+        .astype(bool)
+
+
+def lineage_status_codes(mask) -> np.ndarray:
+    """Index into LINEAGE_STATUS per row: 0 full, 1 partial, 2 none."""
+    mask = np.asarray(mask)
+    return np.where(mask == LINEAGE_FULL, 0,
+                    np.where(mask != 0, 1, 2)).astype(np.int8)
+
+
 def discover_files(folder: str):
     pats = ["DSCIT*.xlsx", "DSCIT*.xlsm", "DSCIT*.xls",
             "dscit*.xlsx", "dscit*.xlsm", "dscit*.xls"]
@@ -432,6 +993,24 @@ def _file_md5(path, chunk=1 << 20):
     return h.hexdigest()
 
 
+SAMPLE_BYTES = 1 << 16       # head and tail span read by _file_sample_md5
+HASH_WORKERS = 8             # hashing is pure I/O; threads are enough
+
+
+def _file_sample_md5(path, size, span=SAMPLE_BYTES):
+    """Quick pre-filter digest over the size plus the first and last span
+    bytes. Returns (digest, is_full): files no longer than 2*span are read
+    whole and the digest is then exactly _file_md5's."""
+    with open(path, "rb") as f:
+        if size <= 2 * span:
+            return hashlib.md5(f.read()).hexdigest(), True
+        h = hashlib.md5(str(size).encode())
+        h.update(f.read(span))
+        f.seek(-span, os.SEEK_END)
+        h.update(f.read(span))
+    return h.hexdigest(), False
+
+
 _ID_RX = re.compile(r"(?i)^DSCIT[\s_\-]*([A-Za-z0-9]+)")
 _DATE_RX = re.compile(r"(20\d{6})")
 
@@ -452,7 +1031,131 @@ def _file_version_key(path):
         return (0, 0)
 
 
-def dedupe_files(files, keep_latest_per_id=False):
+def iter_dedupe(files, keep_latest_per_id=False, hashes=None,
+                full_hash=False, workers=HASH_WORKERS):
+    """Staged duplicate-file filter. Yields (path, reason, rank) as soon as
+    each file is decided: reason None means process it, otherwise it is the
+    skip reason, and rank orders the skips the way one serial pass over
+    files would have listed them.
+
+    Identical content implies identical size, so files are first grouped
+    by size and a file alone in its size group is kept without being read.
+    Larger groups get a head/tail sample hash, and only files whose sample
+    collides inside the group get a full MD5. Hashing runs on a thread
+    pool and each size group is decided as soon as its own hashes are in,
+    so callers can start parsing unique files while the rest is hashed.
+
+    full_hash=True full-hashes every file instead (the extraction cache
+    needs the MD5 as its key). If a dict is passed as hashes it is filled
+    with path -> MD5 for every file that got one; entries already in it
+    are trusted and the file is not re-read."""
+    order = {f: i for i, f in enumerate(files)}
+    digest = {} if hashes is None else hashes       # filled as we go
+    out, groups = [], {}
+
+    # -- superseded versions: a DSCIT ID is decided once all its files are --
+    ids = {}
+    if keep_latest_per_id:
+        for f in files:
+            ids.setdefault(_dscit_id(os.path.basename(f)), []).append(f)
+    id_left = {fid: len(g) for fid, g in ids.items()}
+    id_kept = {fid: [] for fid in ids}
+
+    def settle(f, reason):
+        if reason is not None:
+            out.append((f, reason, (0, order[f], 0)))
+        elif not keep_latest_per_id:
+            out.append((f, None, None))
+        if not keep_latest_per_id:
+            return
+        fid = _dscit_id(os.path.basename(f))
+        if reason is None:
+            id_kept[fid].append(f)
+        id_left[fid] -= 1
+        if id_left[fid]:
+            return
+        group = sorted(id_kept[fid], key=order.get)
+        group.sort(key=_file_version_key, reverse=True)
+        if group:
+            out.append((group[0], None, None))
+        for i, g in enumerate(group[1:]):
+            out.append((g, f"Superseded — newer file for DSCIT {fid}: "
+                           f"{os.path.basename(group[0])}",
+                        (1, order[ids[fid][0]], i)))
+
+    # -- identical content, decided per size group --
+    for f in files:
+        try:
+            groups.setdefault(os.path.getsize(f), []).append(f)
+        except OSError as e:
+            settle(f, f"Unreadable: {e}")
+
+    def decide(size):
+        seen = {}
+        for f in groups.pop(size):
+            key = digest.get(f, f)
+            if key in seen:
+                settle(f, "Duplicate file — identical content to "
+                          f"{os.path.basename(seen[key])}")
+            else:
+                seen[key] = f
+                settle(f, None)
+
+    jobs, waiting, sample = {}, {}, {}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+
+        def submit(size, todo, full):
+            for f in todo:
+                fut = (ex.submit(_file_md5, f) if full else
+                       ex.submit(_file_sample_md5, f, size))
+                jobs[fut] = (f, size, full)
+            waiting[size] = len(todo)
+            if not todo:
+                decide(size)
+
+        for size, group in list(groups.items()):
+            full = full_hash or any(f in digest for f in group)
+            if len(group) == 1 and not full:
+                decide(size)
+            else:
+                submit(size, [f for f in group if f not in digest], full)
+        yield from out
+        out.clear()
+
+        while jobs:
+            finished, _ = wait(jobs, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                f, size, full = jobs.pop(fut)
+                try:
+                    res = fut.result()
+                except OSError as e:
+                    groups[size].remove(f)
+                    settle(f, f"Unreadable: {e}")
+                else:
+                    if full:
+                        digest[f] = res
+                    else:
+                        sample[f], is_full = res
+                        if is_full:
+                            digest[f] = res[0]
+                waiting[size] -= 1
+                if waiting[size]:
+                    continue
+                if full or not groups[size]:
+                    decide(size)
+                    continue
+                # sample pass done: only colliding samples need a full read
+                counts = {}
+                for g in groups[size]:
+                    counts[sample[g]] = counts.get(sample[g], 0) + 1
+                submit(size, [g for g in groups[size]
+                              if counts[sample[g]] > 1 and g not in digest],
+                       True)
+            yield from out
+            out.clear()
+
+
+def dedupe_files(files, keep_latest_per_id=False, hashes=None):
     """Return (files_to_process, skipped) where skipped is a list of
     (path, reason).
 
@@ -465,118 +1168,702 @@ def dedupe_files(files, keep_latest_per_id=False):
 
     keep_latest_per_id=True enables the optional filename-versioning mode
     (keep only the newest file per DSCIT ID). Use only if IDs are known to
-    be unique per report."""
-    skipped = []
-
-    # -- identical content --
-    by_hash = {}
-    survivors = []
-    for f in files:
-        try:
-            h = _file_md5(f)
-        except OSError as e:
-            skipped.append((f, f"Unreadable: {e}"))
-            continue
-        if h in by_hash:
-            skipped.append(
-                (f, "Duplicate file — identical content to "
-                    f"{os.path.basename(by_hash[h])}"))
+    be unique per report.
+
+    If a dict is passed as hashes it is filled with path -> MD5 for every
+    readable file, for reuse as the extraction-cache key; entries already
+    in it are trusted and the file is not re-read. Without it only files
+    that might be duplicates are read (see iter_dedupe)."""
+    kept, skipped = [], []
+    for f, reason, rank in iter_dedupe(files, keep_latest_per_id, hashes,
+                                       full_hash=hashes is not None):
+        if reason is None:
+            kept.append(f)
         else:
-            by_hash[h] = f
-            survivors.append(f)
+            skipped.append((rank, f, reason))
+    return sorted(kept), [(f, r) for _, f, r in sorted(skipped)]
 
-    # -- superseded versions of the same DSCIT ID --
-    if keep_latest_per_id:
-        by_id = {}
-        for f in survivors:
-            by_id.setdefault(_dscit_id(os.path.basename(f)), []).append(f)
-        final = []
-        for fid, group in by_id.items():
-            if len(group) == 1:
-                final.extend(group)
-                continue
-            group.sort(key=_file_version_key, reverse=True)
-            final.append(group[0])
-            for g in group[1:]:
-                skipped.append(
-                    (g, f"Superseded — newer file for DSCIT {fid}: "
-                        f"{os.path.basename(group[0])}"))
-        survivors = sorted(final)
 
-    return survivors, skipped
+# ---- persistent extraction cache ----
+# One entry per workbook content hash, stored under a subfolder named after
+# rules_version(): editing the mapping rules (aliases, DB type rules, scan
+# limits...) moves the cache to a fresh subfolder, so stale extractions are
+# never served. Frames are stored as Parquet only (nothing in the cache is
+# ever unpickled): columns with mixed Python types, which Arrow cannot
+# hold, are written as type-tagged text and restored on read, so a cached
+# extraction is value-for-value the fresh one. Only subfolders carrying
+# CACHE_MARKER are ever pruned, since --cache-dir may point anywhere.
 
+CACHE_DIRNAME = ".dscit_cache"
+CACHE_MARKER = ".dscit_cache_version"
+EXTRACTOR_VERSION = 6        # bump when _extract's output changes shape
+
+
+def rules_version() -> str:
+    blob = json.dumps([EXTRACTOR_VERSION, TARGET_COLUMNS, LINEAGE_COLUMNS,
+                       COLUMN_ALIASES, DB_TYPE_RULES, HEADER_SCAN_ROWS,
+                       HEADER_SCAN_COLS, BANNER_ROWS, GHOST_ROW_LIMIT,
+                       SHEET_KEY], sort_keys=True)
+    return hashlib.md5(blob.encode("utf-8")).hexdigest()[:12]
+
+
+def _cache_tag(v):
+    """Type-tagged text for one cell of a mixed-type column."""
+    if v is None or v is pd.NA or (isinstance(v, float) and v != v):
+        return None
+    if isinstance(v, str):
+        return "s:" + v
+    if isinstance(v, (bool, np.bool_)):
+        return "b:1" if v else "b:0"
+    if isinstance(v, (int, np.integer)):
+        return f"i:{int(v)}"
+    if isinstance(v, (float, np.floating)):
+        return f"f:{float(v)!r}"
+    if isinstance(v, datetime):
+        return "t:" + v.isoformat()
+    raise TypeError(f"cannot cache {type(v).__name__} cells")
 
-def run_consolidation(folder, progress_cb=None, workers=8,
-                      keep_latest_per_id=False):
-    all_files = discover_files(folder)
-    files, skipped = dedupe_files(all_files, keep_latest_per_id)
-    total = len(all_files)
-    results, done = [], 0
 
-    for path, reason in skipped:
-        r = FileResult(file=os.path.basename(path), status="SKIP",
-                       message=reason)
+def _cache_untag(v):
+    if v is None or v is pd.NA:
+        return None
+    kind, text = v[0], v[2:]
+    if kind == "s":
+        return text
+    if kind == "b":
+        return text == "1"
+    if kind == "i":
+        return int(text)
+    if kind == "f":
+        return float(text)
+    return datetime.fromisoformat(text)
+
+
+def _write_tagged_parquet(df: pd.DataFrame, path) -> list:
+    """Write an extracted frame as Parquet, type-tagging the columns Arrow
+    cannot hold as plain text. Returns the tagged column names; raises
+    TypeError/ValueError on a cell type the tags don't cover."""
+    frame, tagged = {}, []
+    for c in df.columns:
+        s = df[c]
+        if c != LINEAGE_MASK:
+            s = encode(s)
+            if pd.api.types.infer_dtype(s.categories, skipna=True) \
+                    not in ("string", "empty"):
+                s = map_encoded(pd.Series(s), _cache_tag)
+                tagged.append(c)
+        frame[c] = s
+    pd.DataFrame(frame).to_parquet(path, index=False)
+    return tagged
+
+
+def _read_tagged_parquet(path, tagged) -> pd.DataFrame:
+    df = encode_frame(pd.read_parquet(path))
+    for c in tagged:
+        df[c] = map_encoded(df[c], _cache_untag)
+    return df
+
+
+def _is_marked_cache(path) -> bool:
+    return os.path.isfile(os.path.join(path, CACHE_MARKER))
+
+
+class ExtractionCache:
+    """MD5 + rules version -> extracted frame and FileResult metadata."""
+
+    META_FIELDS = ("status", "sheet", "header_row", "template", "rows",
+                   "matched", "missing", "message")
+
+    def __init__(self, root, rebuild=False):
+        self.root = root
+        self.dir = os.path.join(root, rules_version())
+        if rebuild and _is_marked_cache(self.dir):
+            for name in os.listdir(self.dir):
+                if name != CACHE_MARKER:
+                    os.remove(os.path.join(self.dir, name))
+        os.makedirs(self.dir, exist_ok=True)
+        with open(os.path.join(self.dir, CACHE_MARKER), "w",
+                  encoding="utf-8") as f:
+            f.write(rules_version())
+        # Drop subfolders this cache left behind for earlier rule versions.
+        for name in os.listdir(root):
+            old = os.path.join(root, name)
+            if old != self.dir and re.fullmatch(r"[0-9a-f]{12}", name) \
+                    and _is_marked_cache(old):
+                for f in os.listdir(old):
+                    os.remove(os.path.join(old, f))
+                os.rmdir(old)
+        self.hits = self.misses = 0
+
+    def _base(self, md5):
+        return os.path.join(self.dir, md5)
+
+    def get(self, md5, path) -> FileResult | None:
+        base = self._base(md5)
+        try:
+            with open(base + ".json", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.pop("format") != "parquet":
+                raise ValueError("legacy cache entry")
+            df = _read_tagged_parquet(base + ".parquet", meta.pop("tagged"))
+        except Exception:                # missing, legacy or unreadable
+            self.misses += 1
+            return None
+        # Identical bytes may arrive under a new name: re-stamp the file.
+        res = FileResult(file=os.path.basename(path), cached=True, **meta)
         try:
-            r.size = os.path.getsize(path)
+            res.size = os.path.getsize(path)
         except OSError:
             pass
-        results.append(r)
+        df["DSCIT File Name"] = constant_column(res.file, len(df))
+        res.data = df
+        self.hits += 1
+        return res
+
+    def put(self, md5, res: FileResult):
+        """Store a successful extraction; errors are always re-parsed."""
+        if res.data is None or not ARROW_AVAILABLE:
+            return
+        base = self._base(md5)
+        try:
+            tagged = _write_tagged_parquet(res.data, base + ".parquet")
+        except (TypeError, ValueError):  # a cell type the tags don't cover
+            return
+        meta = {k: getattr(res, k) for k in self.META_FIELDS}
+        meta["format"] = "parquet"
+        meta["tagged"] = tagged
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+
+# ---- incremental run state ----
+# With incremental=True, run_consolidation keeps the previous run next to
+# the extraction cache: per-file stat signature + MD5 + FileResult, the
+# pre-dedup combined frame (each file's rows as one contiguous slice) and
+# its row hashes. Unchanged files are neither re-hashed nor re-loaded;
+# their slices are spliced back in file order around the re-extracted
+# ones, so dedup attribution comes out exactly as in a full run. Like the
+# cache, nothing is unpickled: the per-file metadata is JSON, the frame
+# Parquet (tagged as in the cache) and the row hashes a plain .npy. The
+# data files are named per save and the JSON, replaced last, names them,
+# so an interrupted save never pairs new data with old metadata; a run
+# that changed no file rewrites nothing.
+
+class RunState:
+    """The previous run's per-file state (run_state.* in the cache)."""
+
+    FILENAME = "run_state.json"
+
+    def __init__(self, cache_dir):
+        self.dir = cache_dir
+        self.path = os.path.join(cache_dir, self.FILENAME)
+        self.files, self.frame, self.row_hash = {}, None, None
+        self.reused = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            frame = _read_tagged_parquet(
+                os.path.join(cache_dir, saved["frame"]), saved["tagged"])
+            row_hash = np.load(os.path.join(cache_dir, saved["hashes"]),
+                               allow_pickle=False)
+            if len(frame) != len(row_hash):
+                raise ValueError("run state files out of step")
+            self.files = saved["files"]
+            self.frame, self.row_hash = frame, row_hash
+        except Exception:                # first run or unreadable state
+            pass
+
+    @staticmethod
+    def _stat(path):
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def known_hashes(self, paths):
+        """path -> MD5 for files whose size and mtime are unchanged."""
+        out = {}
+        for p in paths:
+            e = self.files.get(p)
+            try:
+                if e and self._stat(p) == (e["size"], e["mtime_ns"]):
+                    out[p] = e["md5"]
+            except OSError:
+                pass
+        return out
+
+    def take(self, path, md5):
+        """(FileResult with data, row hashes) from the previous run, or
+        None when path is new or its content changed."""
+        e = self.files.get(path)
+        if e is None or e["md5"] != md5 or self.frame is None:
+            return None
+        res = FileResult(**e["result"])
+        a, b = e["rows"]
+        res.data = self.frame.iloc[a:b].reset_index(drop=True)
+        res.cached = True
+        self.reused += 1
+        return res, self.row_hash[a:b]
+
+    def save(self, results, paths, hashes, frame, row_hash):
+        """Persist this run: results in frame order, each holding its
+        r.rows rows of frame (the pre-dedup rows)."""
+        if not ARROW_AVAILABLE:
+            return
+        files, start = {}, 0
+        by_name = {os.path.basename(p): p for p in paths}
+        for r in results:
+            n = r.rows
+            p = by_name.get(r.file)
+            if p is None or r.status == "SKIP" or r.status == "ERROR":
+                start += n
+                continue
+            size, mtime_ns = self._stat(p)
+            files[p] = {"size": size, "mtime_ns": mtime_ns,
+                        "md5": hashes[p], "rows": [start, start + n],
+                        "result": {k: getattr(r, k) for k in
+                                   ExtractionCache.META_FIELDS
+                                   + ("file", "size")}}
+            start += n
+        if self.frame is not None and files == self.files:
+            return                       # same files, same slices
+        gen = os.urandom(6).hex()
+        names = {"frame": f"run_state.{gen}.parquet",
+                 "hashes": f"run_state.{gen}.npy"}
+        try:
+            tagged = _write_tagged_parquet(
+                frame, os.path.join(self.dir, names["frame"]))
+        except (TypeError, ValueError):
+            return
+        np.save(os.path.join(self.dir, names["hashes"]),
+                np.ascontiguousarray(row_hash, dtype=np.uint64))
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"files": files, "tagged": tagged, **names}, f)
+        os.replace(tmp, self.path)
+        for name in os.listdir(self.dir):    # earlier saves, legacy .pkl
+            if name.startswith("run_state.") and name != self.FILENAME \
+                    and name not in names.values():
+                os.remove(os.path.join(self.dir, name))
+
+
+# ---- process-pool transport ----
+# Worker processes ship extracted frames back as dictionary-encoded columns
+# (int32 codes + the distinct values) instead of pickled DataFrames: DSCIT
+# columns are highly repetitive, so the payload is a fraction of the size
+# and unpickles without rebuilding pandas block structures.
+
+def _pack_frame(df: pd.DataFrame) -> dict:
+    cols = {}
+    for c in df.columns:
+        if isinstance(df[c].dtype, pd.CategoricalDtype):
+            cols[c] = (df[c].cat.codes.to_numpy(np.int32),
+                       np.asarray(df[c].cat.categories, dtype=object),
+                       "category")
+            continue
+        codes, uniques = pd.factorize(df[c], use_na_sentinel=True)
+        cols[c] = (codes.astype(np.int32), np.asarray(uniques),
+                   df[c].dtype)
+    return {"rows": len(df), "columns": list(df.columns), "data": cols}
+
+
+def _unpack_frame(payload: dict) -> pd.DataFrame:
+    data = {}
+    for c in payload["columns"]:
+        codes, uniques, dtype = payload["data"][c]
+        if dtype == "category":
+            data[c] = pd.Categorical.from_codes(
+                codes, pd.Index(uniques, dtype=object))
+            continue
+        lut = np.asarray(uniques, dtype=dtype)
+        if len(codes) and codes.min() < 0:        # -1 = missing value
+            na = (np.array([None], dtype=object) if dtype == object
+                  else np.full(1, np.nan).astype(dtype))
+            lut = np.concatenate([lut, na])
+        data[c] = lut[codes] if len(codes) else np.empty(0, dtype=dtype)
+    return pd.DataFrame(data, columns=payload["columns"])
+
+
+def _process_file_packed(path: str):
+    """Process-pool entry point: run process_file and return the result
+    with its frame detached as a columnar payload."""
+    res = process_file(path)
+    payload = None
+    if res.data is not None:
+        payload = _pack_frame(res.data)
+        res.data = None
+    return res, payload
+
+
+EXECUTORS = ("thread", "process")
+
+
+def default_workers(executor="thread"):
+    """Threads only overlap file I/O, so a small fixed pool is enough;
+    processes scale the parsing itself, one per core."""
+    if executor == "process":
+        return max(1, os.cpu_count() or 1)
+    return 8
+
+
+# ---- streaming row dedup ----
+# Each extraction carries a 128-bit hash per row (two independent 64-bit
+# hashes over TARGET_COLUMNS), computed where the file is parsed. Files are
+# folded into a RowDeduper the moment they arrive, whatever their order,
+# and rows already seen are dropped before concatenation, so only unique
+# rows (plus copies a lower-ranked file has yet to reclaim) are held
+# together. A row still ends up with the first file in name order that has
+# it, exactly as a serial pass would decide. Values are keyed by kind as
+# well as text, so hash equality follows duplicated(): 1 == 1.0 == True,
+# but 1 != "1".
+
+ROW_HASH_KEYS = ("dscit-row-hash-1", "dscit-row-hash-2")   # 16 bytes each
+_ROW_HASH_MULT = np.uint64(0x100000001B3)
+
+
+def _row_value_key(v):
+    if isinstance(v, str):
+        return "s:" + v
+    if isinstance(v, (bool, int, float, np.number)):
+        f = float(v)
+        return f"n:{int(f)}" if f.is_integer() and abs(f) < 2 ** 53 \
+            else f"n:{f!r}"                # np.float64 keys as float
+    return f"o:{v}"
+
+
+def row_hash128(df: pd.DataFrame) -> np.ndarray:
+    """(len(df), 2) uint64 content hash of each row's TARGET_COLUMNS,
+    hashing each column's distinct values once."""
+    h = np.zeros((len(df), 2), dtype=np.uint64)
+    for c in TARGET_COLUMNS:
+        cat = encode(df[c])
+        keys = np.array([_row_value_key(v) for v in cat.categories]
+                        + ["\0"], dtype=object)           # \0 = missing
+        codes = np.asarray(cat.codes)
+        for k, key in enumerate(ROW_HASH_KEYS):
+            col = pd.util.hash_array(keys, hash_key=key, categorize=False)
+            h[:, k] = h[:, k] * _ROW_HASH_MULT ^ col[codes]
+    return h
+
+
+class RowDeduper:
+    """Seen-row set for streaming dedup: sorted (hi, lo, owner) runs, each
+    at least twice the size of the next, merged as they grow. Holds 20
+    bytes per unique row, plus each file's distinct keys and counts for
+    the per-file figures.
+
+    Files may be folded in any order. Each has a rank (its place in the
+    final file order) and a row belongs to the lowest-ranked file that has
+    it. A file folded ahead of its rank can lose kept rows to a lower-
+    ranked one arriving later: lost[fid] counts them (until the caller
+    pops the entry) and owned() tells which of a file's kept rows it
+    still holds."""
+
+    def __init__(self):
+        self.files, self.ranks = [], []  # owner id -> file name, rank
+        self.runs = []
+        self.extracted, self.removed = {}, {}
+        self.overlap = {}                # (file id, first-seen id) -> rows
+        self.lost = {}                   # file id -> kept rows taken over
+        self._keys = []                  # file id -> (hi, lo, count)
+        self._settled = True
+
+    def _find(self, hi, lo):
+        """(run, position) of each (hi, lo) key; run -1 where unseen."""
+        run = np.full(len(hi), -1, dtype=np.int32)
+        pos = np.zeros(len(hi), dtype=np.intp)
+        for r, (rh, rl, _) in enumerate(self.runs):
+            i = np.searchsorted(rh, hi)
+            i[i == len(rh)] = 0
+            hit = (rh[i] == hi) & (rl[i] == lo)
+            run[hit], pos[hit] = r, i[hit]
+            # keys sharing their high word with another: scan the tie run
+            for j in np.flatnonzero(~hit & (rh[i] == hi) & (run < 0)):
+                k = i[j]
+                while k < len(rh) and rh[k] == hi[j]:
+                    if rl[k] == lo[j]:
+                        run[j], pos[j] = r, k
+                        break
+                    k += 1
+        return run, pos
+
+    def _owners(self, run, pos):
+        owner = np.full(len(run), -1, dtype=np.int32)
+        for r, (_, _, ro) in enumerate(self.runs):
+            at = run == r
+            owner[at] = ro[pos[at]]
+        return owner
+
+    def _lookup(self, hi, lo):
+        """Owner file id of each (hi, lo) key, -1 where unseen."""
+        return self._owners(*self._find(hi, lo))
+
+    def _add(self, hi, lo, owner):
+        if not len(hi):
+            return
+        self.runs.append((hi, lo, owner))
+        while len(self.runs) > 1 and \
+                len(self.runs[-2][0]) <= 2 * len(self.runs[-1][0]):
+            (h1, l1, o1), (h2, l2, o2) = self.runs.pop(), self.runs.pop()
+            hi, lo = np.concatenate([h2, h1]), np.concatenate([l2, l1])
+            order = np.lexsort((lo, hi))
+            self.runs.append((hi[order], lo[order],
+                              np.concatenate([o2, o1])[order]))
+
+    def add_file(self, name, row_hash, rank=None) -> np.ndarray:
+        """Fold in a file's rows; returns the keep mask (first occurrence
+        of each row no lower-ranked file folded so far has). rank defaults
+        to the arrival position; the file's id is its arrival position."""
+        fid = len(self.files)
+        rank = fid if rank is None else rank
+        self.files.append(name)
+        self.ranks.append(rank)
+        self._settled = False
+        n = len(row_hash)
+        hi, lo = row_hash[:, 0], row_hash[:, 1]
+        order = np.lexsort((lo, hi))              # stable: earliest first
+        sh, sl = hi[order], lo[order]
+        start = np.ones(n, dtype=bool)
+        start[1:] = (sh[1:] != sh[:-1]) | (sl[1:] != sl[:-1])
+        first = order[start]                      # first row of each value
+        uh, ul = sh[start], sl[start]
+        self._keys.append((uh, ul, np.diff(np.append(np.flatnonzero(start),
+                                                     n))))
+        run, pos = self._find(uh, ul)
+        owner = self._owners(run, pos)
+        new = run < 0
+        # rows held by a higher-ranked file that arrived first move here
+        take = ~new
+        take[take] = np.asarray(self.ranks)[owner[take]] > rank
+        if take.any():
+            lost = np.bincount(owner[take])
+            for src in np.flatnonzero(lost):
+                self.lost[int(src)] = self.lost.get(int(src), 0) \
+                    + int(lost[src])
+            for r, (_, _, ro) in enumerate(self.runs):
+                at = take & (run == r)
+                ro[pos[at]] = fid
+        keep = np.zeros(n, dtype=bool)
+        keep[first[new | take]] = True
+        self._add(uh[new], ul[new], np.full(int(new.sum()), fid,
+                                            dtype=np.int32))
+        self.extracted[name] = n
+        return keep
+
+    def owned(self, fid, row_hash) -> np.ndarray:
+        """Which of file fid's kept rows (by hash) it still holds."""
+        return self._lookup(row_hash[:, 0], row_hash[:, 1]) == fid
+
+    def _settle(self):
+        """removed / overlap from each file's distinct keys and their
+        final owners: a file's extra copies of its own rows and every copy
+        of a row owned elsewhere count against it."""
+        if self._settled:
+            return
+        self.removed, self.overlap = {}, {}
+        for fid, (uh, ul, counts) in enumerate(self._keys):
+            owner = self._lookup(uh, ul)
+            dup = counts - (owner == fid)
+            self.removed[self.files[fid]] = int(dup.sum())
+            by = np.bincount(owner, weights=dup, minlength=fid + 1)
+            for src in np.flatnonzero(by):
+                self.overlap[(fid, int(src))] = int(by[src])
+        self._settled = True
+
+    def per_file(self) -> pd.DataFrame:
+        self._settle()
+        names = sorted(f for f in self.files if self.extracted[f])
+        ext = [self.extracted[f] for f in names]
+        rem = [self.removed[f] for f in names]
+        return pd.DataFrame({
+            "File": pd.Series(names, dtype=object),
+            "Rows Extracted": pd.Series(ext, dtype=np.int64),
+            "Duplicate Rows Removed": pd.Series(rem, dtype=int),
+            "Unique Rows Kept": pd.Series(np.subtract(ext, rem),
+                                          dtype=np.int64)})
+
+    def overlap_table(self) -> pd.DataFrame:
+        self._settle()
+        keys = sorted(self.overlap,
+                      key=lambda k: (self.files[k[0]], self.files[k[1]]))
+        return pd.DataFrame({
+            "File": pd.Series([self.files[a] for a, _ in keys],
+                              dtype=object),
+            "Duplicates Rows First Seen In": pd.Series(
+                [self.files[b] for _, b in keys], dtype=object),
+            "Overlapping Rows": pd.Series([self.overlap[k] for k in keys],
+                                          dtype=np.int64)}) \
+            .sort_values("Overlapping Rows", ascending=False)
+
+
+def run_consolidation(folder, progress_cb=None, workers=None,
+                      keep_latest_per_id=False, executor="thread",
+                      cache_dir=None, rebuild_cache=False, incremental=False,
+                      timings=None):
+    """Extract, combine and row-dedup every DSCIT workbook in folder.
+
+    executor="thread" parses files on a thread pool (openpyxl holds the
+    GIL, so this mostly overlaps I/O); executor="process" spreads parsing
+    over worker processes, one per core unless workers says otherwise.
+    progress_cb(done, total, FileResult) fires once per file either way.
+
+    With cache_dir set, files whose content hash already has an extraction
+    under the current rules_version() are loaded from the cache instead of
+    being parsed; rebuild_cache=True discards the cache and re-parses all.
+
+    incremental=True (needs cache_dir) also keeps a RunState: files whose
+    size and mtime are unchanged since the last incremental run are not
+    re-hashed, and unchanged content is spliced in from the previous
+    combined frame instead of being loaded file by file.
+
+    timings, if given a dict, receives wall-clock seconds per stage under
+    "discover", "hash", "parse" and "dedup". Parsing starts while files
+    are still being hashed, so "parse" is only the time spent after the
+    duplicate-file filter finished."""
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {EXECUTORS}, "
+                         f"got {executor!r}")
+    if incremental and not cache_dir:
+        raise ValueError("incremental=True needs a cache_dir")
+    if workers is None:
+        workers = default_workers(executor)
+    timings = {} if timings is None else timings
+    t0 = time.perf_counter()
+    all_files = discover_files(folder)
+    t1 = time.perf_counter()
+    timings["discover"] = t1 - t0
+    cache = ExtractionCache(cache_dir, rebuild_cache) if cache_dir else None
+    NORMALIZER.load(os.path.join(cache.root, NORMALIZATION_FILE)
+                    if cache else None)
+    state = RunState(cache.dir) if incremental else None
+    hashes = state.known_hashes(all_files) if state else {}
+    total = len(all_files)
+    results, done, files, skipped = [], 0, [], []
+    # Rows are deduped file by file as results arrive; each file's rank in
+    # the final (name) order decides which copy of a row is kept. Copies a
+    # file has lost to a lower-ranked latecomer are dropped once they make
+    # up half its kept rows, and the rest when all files are in.
+    file_rank = {f: i for i, f in enumerate(sorted(
+        (os.path.basename(p) for p in all_files),
+        key=lambda f: (f.lower(), f)))}
+    deduper, kept, raw = RowDeduper(), [], []
+    dedup_secs = 0.0
+
+    def compact(fid):
+        frame, h = kept[fid]
+        mine = deduper.owned(fid, h)
+        kept[fid] = (frame[mine].reset_index(drop=True), h[mine])
+        deduper.lost.pop(fid, None)
+
+    def absorb(res):
+        nonlocal dedup_secs
+        if res.data is None or res.data.empty:
+            return
+        t = time.perf_counter()
+        if res.row_hash is None:          # cached extraction
+            res.row_hash = row_hash128(res.data)
+        if state:                         # the run state keeps raw rows
+            raw.append((file_rank[res.file], res.data, res.row_hash))
+        keep = deduper.add_file(res.file, res.row_hash,
+                                file_rank[res.file])
+        kept.append((res.data if keep.all() else
+                     res.data[keep].reset_index(drop=True),
+                     res.row_hash[keep]))
+        for fid, n in list(deduper.lost.items()):
+            if 2 * n >= len(kept[fid][1]):
+                compact(fid)
+        res.data = res.row_hash = None
+        dedup_secs += time.perf_counter() - t
+
+    def finish(res):
+        nonlocal done
+        results.append(res)
         done += 1
         if progress_cb:
-            progress_cb(done, total, r)
-
-    if files:
-        with ThreadPoolExecutor(
-                max_workers=min(workers, max(1, len(files)))) as ex:
-            futures = {ex.submit(process_file, f): f for f in files}
-            for fut in as_completed(futures):
-                results.append(fut.result())
-                done += 1
-                if progress_cb:
-                    progress_cb(done, total, results[-1])
-
-    results.sort(key=lambda r: r.file.lower())
-    frames = [r.data for r in results if r.data is not None and not r.data.empty]
-    cols = ["DSCIT File Name"] + TARGET_COLUMNS + ["Database Type (Original)"]
-    combined = pd.concat(frames, ignore_index=True) if frames else \
+            progress_cb(done, total, res)
+        absorb(res)
+
+    def collect(fut):
+        res = fut.result()
+        if executor == "process":
+            res, payload = res
+            if payload is not None:
+                res.data = _unpack_frame(payload)
+        if cache:
+            cache.put(hashes[futures[fut]], res)
+        del futures[fut]
+        finish(res)
+
+    # Files are handed to the parse pool as soon as the duplicate filter
+    # clears them, so parsing overlaps the hashing of the rest.
+    n = min(workers, max(1, total))
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers=n,
+                                   initializer=_seed_normalizer,
+                                   initargs=(dict(NORMALIZER.memo),))
+        fn = _process_file_packed
+    else:
+        pool, fn = ThreadPoolExecutor(max_workers=n), process_file
+    futures = {}
+    with pool as ex:
+        for path, reason, rank in iter_dedupe(all_files, keep_latest_per_id,
+                                              hashes, full_hash=bool(cache)):
+            if reason is not None:
+                skipped.append((rank, path, reason))
+                r = FileResult(file=os.path.basename(path), status="SKIP",
+                               message=reason)
+                try:
+                    r.size = os.path.getsize(path)
+                except OSError:
+                    pass
+                finish(r)
+                continue
+            files.append(path)
+            prev = state.take(path, hashes[path]) if state else None
+            if prev is not None:
+                res, res.row_hash = prev
+                finish(res)
+                continue
+            res = cache.get(hashes[path], path) if cache else None
+            if res is not None:
+                finish(res)
+                continue
+            futures[ex.submit(fn, path)] = path
+            for fut in [f for f in futures if f.done()]:
+                collect(fut)
+        t0, t1 = t1, time.perf_counter()
+        timings["hash"] = t1 - t0        # parsing overlaps this stage
+        for fut in as_completed(list(futures)):
+            collect(fut)
+    skipped = [(p, r) for _, p, r in sorted(skipped)]
+
+    results.sort(key=lambda r: (r.file.lower(), r.file))
+    t0, t1 = t1, time.perf_counter()
+    timings["parse"] = t1 - t0
+    cols = (["DSCIT File Name"] + TARGET_COLUMNS
+            + ["Database Type (Original)", LINEAGE_MASK])
+    if state:
+        raw.sort(key=lambda x: x[0])
+        state.save(results, all_files, hashes,
+                   concat_encoded([f for _, f, _ in raw], cols) if raw else
+                   pd.DataFrame(columns=cols),
+                   np.concatenate([h for _, _, h in raw]) if raw else
+                   np.empty((0, 2), dtype=np.uint64))
+        raw.clear()
+    for fid in list(deduper.lost):
+        compact(fid)
+    frames = [kept[fid][0] for fid in
+              sorted(range(len(kept)), key=deduper.ranks.__getitem__)]
+    kept.clear()
+    combined = concat_encoded(frames, cols) if frames else \
         pd.DataFrame(columns=cols)
-
-    # -- row-level dedup: identical records inflate every count --
-    # Content-based: a row is a duplicate when ALL 14 extracted fields
-    # match an earlier row, regardless of which file it came from.
-    rows_before = len(combined)
-    per_file = pd.DataFrame(columns=["File", "Rows Extracted",
-                                     "Duplicate Rows Removed",
-                                     "Unique Rows Kept"])
-    overlap = pd.DataFrame(columns=["File", "Duplicates Rows First Seen In",
-                                    "Overlapping Rows"])
-    if rows_before:
-        dup_mask = combined.duplicated(subset=TARGET_COLUMNS, keep="first")
-        key_hash = pd.util.hash_pandas_object(
-            combined[TARGET_COLUMNS], index=False)
-        first_file = combined["DSCIT File Name"].groupby(
-            key_hash.values).transform("first")
-        per_file = (pd.DataFrame({"File": combined["DSCIT File Name"],
-                                  "dup": dup_mask})
-                    .groupby("File")["dup"]
-                    .agg([("Rows Extracted", "size"),
-                          ("Duplicate Rows Removed", "sum")])
-                    .reset_index())
-        per_file["Duplicate Rows Removed"] = \
-            per_file["Duplicate Rows Removed"].astype(int)
-        per_file["Unique Rows Kept"] = (per_file["Rows Extracted"]
-                                        - per_file["Duplicate Rows Removed"])
-        if dup_mask.any():
-            overlap = (pd.DataFrame({
-                "File": combined.loc[dup_mask, "DSCIT File Name"],
-                "Duplicates Rows First Seen In": first_file[dup_mask]})
-                .groupby(["File", "Duplicates Rows First Seen In"])
-                .size().reset_index(name="Overlapping Rows")
-                .sort_values("Overlapping Rows", ascending=False))
-        combined = combined[~dup_mask].reset_index(drop=True)
+    frames.clear()
+    rows_before = sum(deduper.extracted.values())
+    per_file = deduper.per_file()
+    overlap = deduper.overlap_table()
     dedup = {
         "files_found": total,
         "files_processed": len(files),
+        "files_from_cache": (cache.hits if cache else 0)
+        + (state.reused if state else 0),
         "identical_files_skipped": sum(
             1 for _, r in skipped if r.startswith("Duplicate file")),
         "superseded_files_skipped": sum(
@@ -588,6 +1875,14 @@ def run_consolidation(folder, progress_cb=None, workers=8,
         "per_file": per_file,
         "overlap": overlap,
     }
+    if len(combined):
+        NORMALIZER.record("db_type", combined["Database Type (Original)"],
+                          _normalize_db_type)
+        NORMALIZER.record("indicator", combined["Data Element Indicator"],
+                          _classify_indicator)
+        if cache:
+            NORMALIZER.save(os.path.join(cache.root, NORMALIZATION_FILE))
+    timings["dedup"] = dedup_secs + time.perf_counter() - t1
     return results, combined, dedup
 
 
@@ -596,7 +1891,12 @@ def run_consolidation(folder, progress_cb=None, workers=8,
 # ============================================================================
 
 def classify_indicator(v):
-    """Canonicalize Data Element Indicator values to CDE / BDE / Metric."""
+    """Canonicalize Data Element Indicator values to CDE / BDE / Metric
+    (memoised, see Normalizer)."""
+    return NORMALIZER.lookup("indicator", v, _classify_indicator)
+
+
+def _classify_indicator(v):
     if v is None or (isinstance(v, float) and v != v):
         return None
     n = _norm(v)
@@ -613,17 +1913,26 @@ def classify_indicator(v):
 
 def lineage_status_series(df):
     """Full Lineage = all five lineage fields populated; Partial = some;
-    No Lineage = none."""
-    present = pd.DataFrame({c: df[c].notna() for c in LINEAGE_COLUMNS})
-    cnt = present.sum(axis=1)
-    return cnt.map(lambda c: "Full Lineage" if c == len(LINEAGE_COLUMNS)
-                   else ("Partial Lineage" if c > 0 else "No Lineage"))
+    No Lineage = none. Categorical, read off the frame's lineage mask."""
+    return pd.Series(pd.Categorical.from_codes(
+        lineage_status_codes(lineage_mask(df)),
+        pd.Index(LINEAGE_STATUS, dtype=object)),
+        index=df.index, name="Lineage Status")
 
 
 def _clean(series):
-    """Series of stripped strings with blanks/placeholder values as NA."""
+    """Series of stripped strings with blanks/placeholder values as NA.
+    Categorical input is cleaned per category and stays categorical (with
+    sorted string categories)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        cats = _clean(pd.Series(series.cat.categories, dtype=object))
+        codes, uniques = pd.factorize(cats, sort=True)
+        codes = np.append(codes, -1)       # missing stays missing
+        return pd.Series(pd.Categorical.from_codes(
+            codes[series.cat.codes.to_numpy()], uniques),
+            index=series.index, name=series.name)
     s = series.astype("string").str.strip()
-    s = s.mask(s.str.lower().isin(["", "na", "n/a", "none", "null", "tbd", "-"]))
+    s = s.mask(s.str.lower().isin(_MISSING_TEXT))
     return s
 
 
@@ -631,6 +1940,127 @@ def _nunique(df, col):
     return int(_clean(df[col]).dropna().nunique()) if col in df else 0
 
 
+# ---- grouped aggregation kernel ----
+# Every analytics table is a group-by over a handful of dimension columns
+# with distinct counts / sizes as measures. Columns are factorised once
+# (sorted codes, NA = -1) and shared; a grouping is a dense group id per
+# row, and each measure is a bincount / unique over integer arrays. Group
+# order matches DataFrame.groupby(sort=True): keys ascending, NA last.
+
+class _Groups:
+    """One grouping of a frame: a group id for each selected row plus a
+    representative row per group (used to read back the key values)."""
+
+    def __init__(self, frame, rows, gid, ngroups, first):
+        self.frame = frame
+        self.rows = rows              # positions of the rows taking part
+        self.gid = gid                # group id of each of those rows
+        self.n = ngroups
+        self.first = first            # row position of each group's first row
+
+    def keys(self, col):
+        """Key column values, one per group, as groupby would report them."""
+        return decode(self.frame.df[col].take(self.first)
+                      .reset_index(drop=True))
+
+    def size(self):
+        return np.bincount(self.gid, minlength=self.n).astype(np.int64)
+
+    def _codes(self, col, where):
+        codes, nu = self.frame.factor(col)
+        codes = codes[self.rows]
+        ok = codes >= 0
+        if where is not None:
+            ok &= where[self.rows]
+        return codes[ok], self.gid[ok], nu
+
+    def _pairs(self, col, where):
+        """Sorted distinct (group, value code) pairs, as flat int64 keys."""
+        codes, gid, nu = self._codes(col, where)
+        return np.unique(gid * max(nu, 1) + codes), max(nu, 1)
+
+    def nunique(self, col, where=None):
+        """Distinct non-null values of col per group (rows limited to
+        `where`, a boolean mask over the whole frame, when given)."""
+        pairs, nu = self._pairs(col, where)
+        return np.bincount(pairs // nu, minlength=self.n).astype(np.int64)
+
+    def nulls(self, col):
+        codes, _ = self.frame.factor(col)
+        return np.bincount(self.gid, weights=codes[self.rows] < 0,
+                           minlength=self.n).astype(np.int64)
+
+    def first_valid(self, col, default):
+        """First non-null value of col (in row order) per group."""
+        codes, _ = self.frame.factor(col)
+        pos = np.flatnonzero(codes[self.rows] >= 0)
+        grp, at = np.unique(self.gid[pos], return_index=True)
+        out = np.full(self.n, default, dtype=object)
+        out[grp] = self.frame.df[col].to_numpy(object)[self.rows[pos[at]]]
+        return out
+
+    def joined(self, col, limit, sep=", "):
+        """The first `limit` distinct non-null values of col per group in
+        sorted order, joined with sep."""
+        pairs, nu = self._pairs(col, None)
+        uniques = self.frame.uniques(col)
+        bounds = np.searchsorted(pairs // nu, np.arange(self.n + 1))
+        vals = uniques[pairs % nu]
+        return np.array([sep.join(vals[b:min(b + limit, e)])
+                         for b, e in zip(bounds[:-1], bounds[1:])],
+                        dtype=object)
+
+
+class _CodedFrame:
+    """Lazily factorised view of a frame for the grouped kernel."""
+
+    def __init__(self, df):
+        self.df = df
+        self._fac = {}
+
+    def factor(self, col):
+        """(codes, number of distinct non-null values)."""
+        if col not in self._fac:
+            s = self.df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                # rank the categories the way plain values would sort
+                rank, uniques = pd.factorize(
+                    pd.Series(s.cat.categories), sort=True)
+                codes = np.append(rank, -1)[s.cat.codes.to_numpy()]
+            else:
+                codes, uniques = pd.factorize(s, sort=True)
+            self._fac[col] = (codes.astype(np.int64, copy=False),
+                              np.asarray(uniques, dtype=object))
+        codes, uniques = self._fac[col]
+        return codes, len(uniques)
+
+    def uniques(self, col):
+        self.factor(col)
+        return self._fac[col][1]
+
+    def group(self, keys, dropna=True, where=None):
+        """Group the rows selected by `where` (all when None) on keys."""
+        if isinstance(keys, str):
+            keys = [keys]
+        sel = np.ones(len(self.df), dtype=bool) if where is None \
+            else np.asarray(where, dtype=bool).copy()
+        comb = None
+        for k in keys:
+            codes, nu = self.factor(k)
+            if dropna:
+                sel &= codes >= 0
+            codes = np.where(codes < 0, nu, codes)     # NA sorts last
+            if comb is None:
+                comb = codes
+            else:                 # re-densify so the radix never overflows
+                comb = np.unique(comb, return_inverse=True)[1].ravel()
+                comb = comb * (nu + 1) + codes
+        rows = np.flatnonzero(sel)
+        _, first, gid = np.unique(comb[rows], return_index=True,
+                                  return_inverse=True)
+        return _Groups(self, rows, gid.ravel(), len(first), rows[first])
+
+
 def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     df = combined.copy()
     for c in TARGET_COLUMNS:
@@ -657,8 +2087,10 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
         "Technology Asset Owners": _nunique(df, "Technology Asset Owner Name"),
         "Data Owners": _nunique(df, "Data Owner Name"),
     }
-    df["_ind"] = df["Data Element Indicator"].map(classify_indicator)
+    df["_ind"] = map_encoded(df["Data Element Indicator"], classify_indicator)
+    mask = lineage_mask(df)
     df["_lstat"] = lineage_status_series(df)
+    lcount = np.bincount(lineage_status_codes(mask), minlength=3)
 
     def _elems(mask):
         return int(df.loc[mask, "Data Element"].dropna().nunique())
@@ -667,13 +2099,11 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     kpi["CDEs"] = _elems(df["_ind"] == "CDE")
     kpi["BDEs"] = _elems(df["_ind"] == "BDE")
     kpi["Metrics"] = _elems(df["_ind"] == "Metric")
-    kpi["Rows with Full Lineage"] = int((df["_lstat"] == "Full Lineage").sum())
-    kpi["Rows with Partial Lineage"] = \
-        int((df["_lstat"] == "Partial Lineage").sum())
-    kpi["Rows with No Lineage"] = int((df["_lstat"] == "No Lineage").sum())
+    kpi["Rows with Full Lineage"] = int(lcount[0])
+    kpi["Rows with Partial Lineage"] = int(lcount[1])
+    kpi["Rows with No Lineage"] = int(lcount[2])
     kpi["Lineage Coverage %"] = round(
-        100 * (len(df) - int((df["_lstat"] == "No Lineage").sum()))
-        / len(df), 1) if len(df) else 0.0
+        100 * (len(df) - int(lcount[2])) / len(df), 1) if len(df) else 0.0
     if dedup:
         kpi["Duplicate Rows Removed"] = dedup.get("duplicate_rows_removed", 0)
         kpi["Duplicate Files Skipped"] = (
@@ -682,34 +2112,37 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     a["kpis"] = kpi
 
     # ---- By Database Type (normalized) ----
-    g = (df.groupby("Database Type", dropna=False)
-           .agg(Databases=("Database Name", lambda s: s.dropna().nunique()),
-                Data_Element_Rows=("Database Type", "size"),
-                Outputs=("Output Name", lambda s: s.dropna().nunique()),
-                Sources=("Source Name", lambda s: s.dropna().nunique()))
-           .reset_index()
-           .sort_values("Data_Element_Rows", ascending=False))
+    cf = _CodedFrame(df)
+    gr = cf.group("Database Type", dropna=False)
+    g = pd.DataFrame({"Database Type": gr.keys("Database Type"),
+                      "Databases": gr.nunique("Database Name"),
+                      "Data_Element_Rows": gr.size(),
+                      "Outputs": gr.nunique("Output Name"),
+                      "Sources": gr.nunique("Source Name")}) \
+        .sort_values("Data_Element_Rows", ascending=False)
     g.columns = ["Database Type", "Distinct Databases", "Data Element Rows",
                  "Outputs", "Sources"]
     a["db_type"] = g
 
     # ---- Database Name x Type inventory ----
-    inv = (df.dropna(subset=["Database Name"])
-             .groupby(["Database Type", "Database Name"])
-             .agg(Rows=("Database Name", "size"),
-                  Outputs=("Output Name", lambda s: s.dropna().nunique()))
-             .reset_index()
+    gr = cf.group(["Database Type", "Database Name"])
+    inv = (pd.DataFrame({"Database Type": gr.keys("Database Type"),
+                         "Database Name": gr.keys("Database Name"),
+                         "Rows": gr.size(),
+                         "Outputs": gr.nunique("Output Name")})
              .sort_values(["Database Type", "Rows"],
                           ascending=[True, False]))
     a["db_inventory"] = inv
 
     # ---- Outputs by Business Segment ----
-    seg = (df.groupby("Business Segment / Corporate Function", dropna=False)
-             .agg(Outputs=("Output Name", lambda s: s.dropna().nunique()),
-                  Output_Owners=("Output Owner", lambda s: s.dropna().nunique()),
-                  Data_Elements=("Data Element", lambda s: s.dropna().nunique()),
-                  Rows=("Output Name", "size"))
-             .reset_index()
+    gr = cf.group("Business Segment / Corporate Function", dropna=False)
+    seg = (pd.DataFrame({
+        "Business Segment / Corporate Function":
+            gr.keys("Business Segment / Corporate Function"),
+        "Outputs": gr.nunique("Output Name"),
+        "Output_Owners": gr.nunique("Output Owner"),
+        "Data_Elements": gr.nunique("Data Element"),
+        "Rows": gr.size()})
              .sort_values("Outputs", ascending=False))
     seg["Business Segment / Corporate Function"] = \
         seg["Business Segment / Corporate Function"].fillna("Not Specified")
@@ -718,11 +2151,11 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     a["segment"] = seg
 
     # ---- Databases by Asset Owner ----
-    ao = (df.groupby("Asset Owner Name", dropna=False)
-            .agg(Databases=("Database Name", lambda s: s.dropna().nunique()),
-                 DB_Types=("Database Type", lambda s: s.dropna().nunique()),
-                 Outputs=("Output Name", lambda s: s.dropna().nunique()))
-            .reset_index()
+    gr = cf.group("Asset Owner Name", dropna=False)
+    ao = (pd.DataFrame({"Asset Owner Name": gr.keys("Asset Owner Name"),
+                        "Databases": gr.nunique("Database Name"),
+                        "DB_Types": gr.nunique("Database Type"),
+                        "Outputs": gr.nunique("Output Name")})
             .sort_values("Databases", ascending=False))
     ao["Asset Owner Name"] = ao["Asset Owner Name"].fillna("Not Specified")
     ao.columns = ["Asset Owner Name", "Databases", "Database Types", "Outputs"]
@@ -730,11 +2163,11 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
 
     # ---- Databases by Output Name / Output Owner / Source Type ----
     def dbs_by(col):
-        t = (df.groupby(col, dropna=False)
-               .agg(Databases=("Database Name", lambda s: s.dropna().nunique()),
-                    DB_Types=("Database Type",
-                              lambda s: ", ".join(sorted(s.dropna().unique())[:6])))
-               .reset_index()
+        gr = cf.group(col, dropna=False)
+        t = (pd.DataFrame({col: gr.keys(col),
+                           "Databases": gr.nunique("Database Name"),
+                           "DB_Types": pd.array(gr.joined("Database Type", 6),
+                                                dtype="string")})
                .sort_values("Databases", ascending=False))
         t[col] = t[col].fillna("Not Specified")
         t.columns = [col, "Databases", "Database Types"]
@@ -744,29 +2177,30 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     a["dbs_by_srctype"] = dbs_by("Source Type")
 
     # ---- Source inventory + gap flags ----
-    src = (df.groupby(["Source Name", "Source Application EUC / MAL Code",
-                       "Source Type"], dropna=False)
-             .agg(Databases=("Database Name", lambda s: s.dropna().nunique()),
-                  Rows=("Source Name", "size"),
-                  Missing_DB_Name=("Database Name",
-                                   lambda s: int(s.isna().sum())),
-                  Missing_Data_Owner=("Data Owner Name",
-                                      lambda s: int(s.isna().sum())),
-                  Missing_Asset_Owner=("Asset Owner Name",
-                                       lambda s: int(s.isna().sum())))
-             .reset_index())
+    src_keys = ["Source Name", "Source Application EUC / MAL Code",
+                "Source Type"]
+    gr = cf.group(src_keys, dropna=False)
+    src = pd.DataFrame({**{k: gr.keys(k) for k in src_keys},
+                        "Databases": gr.nunique("Database Name"),
+                        "Rows": gr.size(),
+                        "Missing_DB_Name": gr.nulls("Database Name"),
+                        "Missing_Data_Owner": gr.nulls("Data Owner Name"),
+                        "Missing_Asset_Owner": gr.nulls("Asset Owner Name")})
     src["Source Name"] = src["Source Name"].fillna("«Source Missing»")
     src["Source Application EUC / MAL Code"] = \
         src["Source Application EUC / MAL Code"].fillna("«Code Missing»")
     src["Source Type"] = src["Source Type"].fillna("«Type Missing»")
-    src["Gap Flags"] = src.apply(
-        lambda r: "; ".join(f for f, c in [
-            ("Source missing", r["Source Name"] == "«Source Missing»"),
-            ("EUC/MAL missing", r["Source Application EUC / MAL Code"] == "«Code Missing»"),
-            ("DB name gaps", r["Missing_DB_Name"] > 0),
-            ("Data owner gaps", r["Missing_Data_Owner"] > 0),
-            ("Asset owner gaps", r["Missing_Asset_Owner"] > 0),
-        ] if c) or "Complete", axis=1)
+    gap = np.full(len(src), "", dtype=object)
+    for f, c in [
+            ("Source missing", src["Source Name"] == "«Source Missing»"),
+            ("EUC/MAL missing", src["Source Application EUC / MAL Code"]
+             == "«Code Missing»"),
+            ("DB name gaps", src["Missing_DB_Name"] > 0),
+            ("Data owner gaps", src["Missing_Data_Owner"] > 0),
+            ("Asset owner gaps", src["Missing_Asset_Owner"] > 0)]:
+        gap = np.where(c.to_numpy(bool), gap + "; " + f, gap)
+    src["Gap Flags"] = pd.Series(gap, index=src.index, dtype=object) \
+        .str[2:].replace("", "Complete")
     src = src.sort_values("Rows", ascending=False)
     a["source_inventory"] = src
 
@@ -789,13 +2223,13 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
         if len(kdq) else 0.0
 
     # ---- Top outputs by data-element footprint ----
-    top = (df.groupby("Output Name", dropna=False)
-             .agg(Data_Elements=("Data Element", lambda s: s.dropna().nunique()),
-                  Sources=("Source Name", lambda s: s.dropna().nunique()),
-                  Databases=("Database Name", lambda s: s.dropna().nunique()),
-                  Owner=("Output Owner",
-                         lambda s: s.dropna().iloc[0] if s.dropna().size else "—"))
-             .reset_index()
+    gr = cf.group("Output Name", dropna=False)
+    top = (pd.DataFrame({"Output Name": gr.keys("Output Name"),
+                         "Data_Elements": gr.nunique("Data Element"),
+                         "Sources": gr.nunique("Source Name"),
+                         "Databases": gr.nunique("Database Name"),
+                         "Owner": pd.array(gr.first_valid("Output Owner", "—"),
+                                           dtype="string")})
              .sort_values("Data_Elements", ascending=False))
     top["Output Name"] = top["Output Name"].fillna("Not Specified")
     top.columns = ["Output Name", "Data Elements", "Sources", "Databases",
@@ -803,118 +2237,103 @@ def build_analytics(combined: pd.DataFrame, results=None, dedup=None):
     a["top_outputs"] = top
 
     # ---- Schemas by Database (source side) ----
-    sdb = (df.dropna(subset=["Database Name"])
-             .groupby(["Database Type", "Database Name"], dropna=False)
-             .agg(Schemas=("Schema Name / File Path / API",
-                           lambda s: s.dropna().nunique()),
-                  Elements=("Data Element", lambda s: s.dropna().nunique()),
-                  Outputs=("Output Name", lambda s: s.dropna().nunique()),
-                  Rows=("Database Name", "size"))
-             .reset_index()
+    gr = cf.group(["Database Type", "Database Name"], dropna=False,
+                  where=df["Database Name"].notna())
+    sdb = (pd.DataFrame({"Database Type": gr.keys("Database Type"),
+                         "Database Name": gr.keys("Database Name"),
+                         "Schemas": gr.nunique("Schema Name / File Path / API"),
+                         "Elements": gr.nunique("Data Element"),
+                         "Outputs": gr.nunique("Output Name"),
+                         "Rows": gr.size()})
              .sort_values("Schemas", ascending=False))
     a["schemas_by_db"] = sdb
 
     # ---- CDE / BDE / Metric inventory ----
-    ind = (df.assign(_i=df["_ind"].fillna("Not Specified"))
-             .groupby("_i")
-             .agg(Elements=("Data Element", lambda s: s.dropna().nunique()),
-                  Outputs=("Output Name", lambda s: s.dropna().nunique()),
-                  Databases=("Database Name",
-                             lambda s: s.dropna().nunique()),
-                  Rows=("_i", "size"))
-             .reset_index()
-             .rename(columns={"_i": "Data Element Indicator"})
+    df["_i"] = fill_encoded(df["_ind"], "Not Specified")
+    df["_s"] = fill_encoded(df["Business Segment / Corporate Function"],
+                            "Not Specified")
+    gr = cf.group("_i")
+    ind = (pd.DataFrame({"Data Element Indicator": gr.keys("_i"),
+                         "Elements": gr.nunique("Data Element"),
+                         "Outputs": gr.nunique("Output Name"),
+                         "Databases": gr.nunique("Database Name"),
+                         "Rows": gr.size()})
              .sort_values("Elements", ascending=False))
     a["cde_inventory"] = ind
-    seg_ind = (df.assign(_i=df["_ind"].fillna("Not Specified"),
-                         _s=df["Business Segment / Corporate Function"]
-                         .fillna("Not Specified"))
-               .groupby(["_s", "_i"])["Data Element"]
-               .apply(lambda s: s.dropna().nunique())
+    gr = cf.group(["_s", "_i"])
+    seg_ind = (pd.Series(gr.nunique("Data Element"), name="Data Element",
+                         index=pd.MultiIndex.from_arrays(
+                             [gr.keys("_s"), gr.keys("_i")]))
                .unstack(fill_value=0).reset_index()
                .rename(columns={"_s":
                                 "Business Segment / Corporate Function"}))
     a["cde_by_segment"] = seg_ind
 
     # ---- Lineage coverage ----
-    lstat = (df.groupby("_lstat")
-               .agg(Rows=("_lstat", "size"),
-                    Elements=("Data Element",
-                              lambda s: s.dropna().nunique()),
-                    Outputs=("Output Name",
-                             lambda s: s.dropna().nunique()))
-               .reset_index()
-               .rename(columns={"_lstat": "Lineage Status"}))
+    gr = cf.group("_lstat")
+    lstat = pd.DataFrame({"Lineage Status": gr.keys("_lstat"),
+                          "Rows": gr.size(),
+                          "Elements": gr.nunique("Data Element"),
+                          "Outputs": gr.nunique("Output Name")})
     a["lineage_status"] = lstat
-    lsys = (df.dropna(subset=["Lineage System"])
-              .groupby("Lineage System")
-              .agg(Rows=("Lineage System", "size"),
-                   Elements=("Data Element",
-                             lambda s: s.dropna().nunique()),
-                   Lineage_DBs=("Lineage Database",
-                                lambda s: s.dropna().nunique()),
-                   Source_DBs=("Database Name",
-                               lambda s: s.dropna().nunique()))
-              .reset_index()
+    gr = cf.group("Lineage System")
+    lsys = (pd.DataFrame({"Lineage System": gr.keys("Lineage System"),
+                          "Rows": gr.size(),
+                          "Elements": gr.nunique("Data Element"),
+                          "Lineage_DBs": gr.nunique("Lineage Database"),
+                          "Source_DBs": gr.nunique("Database Name")})
               .sort_values("Rows", ascending=False))
     lsys.columns = ["Lineage System", "Rows", "Elements",
                     "Lineage Databases", "Source Databases"]
     a["lineage_systems"] = lsys
 
     # ---- Harvest Priority: elements/CDEs lacking lineage, by source DB ----
-    hv_rows = []
-    for (dbt_, dbn_), g in df.groupby(["Database Type", "Database Name"],
-                                      dropna=False):
-        if dbn_ is None or (isinstance(dbn_, float) and dbn_ != dbn_):
-            dbn_ = "«Name Missing»"
-        elems = g["Data Element"].dropna().nunique()
-        with_lin = g.loc[g["_lstat"] != "No Lineage",
-                         "Data Element"].dropna().nunique()
-        cde_g = g[g["_ind"] == "CDE"]
-        cdes = cde_g["Data Element"].dropna().nunique()
-        cde_with = cde_g.loc[cde_g["_lstat"] != "No Lineage",
-                             "Data Element"].dropna().nunique()
-        hv_rows.append({
-            "Database Type": dbt_ if isinstance(dbt_, str) else
-            "Not Specified",
-            "Database Name": dbn_,
-            "Elements": elems,
-            "CDEs": cdes,
-            "Elements w/o Lineage": elems - with_lin,
-            "CDEs w/o Lineage": cdes - cde_with,
-            "Schemas": g["Schema Name / File Path / API"]
-            .dropna().nunique(),
-            "Outputs": g["Output Name"].dropna().nunique(),
-            "Rows": len(g),
-            "Lineage Coverage %": round(100 * with_lin / elems, 1)
-            if elems else 0.0,
-        })
-    hv = pd.DataFrame(hv_rows).sort_values(
-        ["CDEs w/o Lineage", "Elements w/o Lineage"],
-        ascending=False).reset_index(drop=True)
+    has_lin = mask != 0
+    is_cde = (df["_ind"] == "CDE").to_numpy(bool)
+    gr = cf.group(["Database Type", "Database Name"], dropna=False)
+    elems = gr.nunique("Data Element")
+    with_lin = gr.nunique("Data Element", where=has_lin)
+    cdes = gr.nunique("Data Element", where=is_cde)
+    cde_with = gr.nunique("Data Element", where=is_cde & has_lin)
+    hv = pd.DataFrame({
+        "Database Type": [t if isinstance(t, str) else "Not Specified"
+                          for t in gr.keys("Database Type")],
+        "Database Name": ["«Name Missing»" if n is None or
+                          (isinstance(n, float) and n != n) else n
+                          for n in gr.keys("Database Name")],
+        "Elements": elems,
+        "CDEs": cdes,
+        "Elements w/o Lineage": elems - with_lin,
+        "CDEs w/o Lineage": cdes - cde_with,
+        "Schemas": gr.nunique("Schema Name / File Path / API"),
+        "Outputs": gr.nunique("Output Name"),
+        "Rows": gr.size(),
+        "Lineage Coverage %": [round(100 * w / e, 1) if e else 0.0
+                               for w, e in zip(with_lin.tolist(),
+                                               elems.tolist())],
+    }).sort_values(["CDEs w/o Lineage", "Elements w/o Lineage"],
+                   ascending=False).reset_index(drop=True)
     hv.insert(0, "Priority Rank", range(1, len(hv) + 1))
     a["harvest"] = hv
 
     # ---- Lineage target inventory (system > db > schema > table > column) --
-    ldet = (df.dropna(subset=["Lineage System"], how="all")
-              .groupby(LINEAGE_COLUMNS, dropna=False)
-              .agg(Rows=("Lineage System", "size"),
-                   Elements=("Data Element",
-                             lambda s: s.dropna().nunique()))
-              .reset_index()
-              .sort_values("Rows", ascending=False))
+    gr = cf.group(LINEAGE_COLUMNS, dropna=False,
+                  where=lineage_present(mask, "Lineage System"))
+    ldet = pd.DataFrame({**{c: gr.keys(c) for c in LINEAGE_COLUMNS},
+                         "Rows": gr.size(),
+                         "Elements": gr.nunique("Data Element")}) \
+        .sort_values("Rows", ascending=False)
     ldet = ldet[ldet[LINEAGE_COLUMNS].notna().any(axis=1)]
     a["lineage_detail"] = ldet
 
-    df.drop(columns=["_ind", "_lstat"], inplace=True, errors="ignore")
+    df.drop(columns=["_ind", "_lstat", "_i", "_s"], inplace=True,
+            errors="ignore")
 
     # ---- DB type normalization audit map ----
     if "Database Type (Original)" in df:
-        m = (combined.groupby(["Database Type (Original)", "Database Type"],
-                              dropna=False).size().reset_index(name="Rows")
-             .sort_values(["Database Type", "Rows"], ascending=[True, False]))
-        m.columns = ["Raw Value", "Normalized To", "Rows"]
-        a["norm_map"] = m
+        a["norm_map"] = NORMALIZER.audit_map(
+            "db_type", combined["Database Type (Original)"],
+            _normalize_db_type)
 
     return a
 
@@ -950,24 +2369,54 @@ def _excel_safe(v):
 
 
 def sanitize_df(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    for c in out.columns:
-        if out[c].dtype == object or str(out[c].dtype) in ("string", "str"):
-            out[c] = out[c].map(_excel_safe)
-        elif "datetime" in str(out[c].dtype) and getattr(
-                out[c].dtype, "tz", None) is not None:
-            out[c] = out[c].dt.tz_localize(None)
-    return out
-
-
-def write_output(folder, results, combined, analytics=None,
-                 dedup=None) -> str:
-    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    out_path = os.path.join(folder, f"DSCIT_Consolidated_{stamp}.xlsx")
+    """Excel-safe copy of df (plain columns, missing values as None)."""
+    return pd.DataFrame({c: _excel_column(df[c]) for c in df.columns},
+                        index=df.index, columns=df.columns)
+
+
+def _excel_column(s: pd.Series) -> np.ndarray:
+    """Object array of Excel-safe cell values for one column, missing
+    values as None. Categorical columns are decoded here, making each
+    distinct value safe once; string columns get one vectorised search
+    for illegal XML characters and only the hits are rewritten."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        lut = np.empty(len(s.cat.categories) + 1, dtype=object)
+        lut[:] = [_excel_safe(v) for v in s.cat.categories] + [None]
+        return lut[s.cat.codes.to_numpy()]
+    if "datetime" in str(s.dtype):
+        if getattr(s.dtype, "tz", None) is not None:
+            s = s.dt.tz_localize(None)
+        vals = s.astype(object).to_numpy()
+        vals[s.isna().to_numpy()] = None
+        return vals
+    vals = s.to_numpy(dtype=object, copy=True)
+    missing = pd.isna(s).to_numpy()
+    if s.dtype.kind == "f":
+        inf = np.isinf(s.to_numpy())
+        vals[inf] = np.where(s.to_numpy()[inf] > 0, "inf", "-inf")
+    elif s.dtype.kind not in "iub":
+        kind = pd.api.types.infer_dtype(vals, skipna=True)
+        if kind == "string":
+            bad = s.str.contains(_ILLEGAL_XML, na=False).to_numpy()
+            vals[bad] = [_ILLEGAL_XML.sub("", v) for v in vals[bad]]
+        elif kind not in ("empty", "integer", "floating", "boolean",
+                          "mixed-integer-float", "decimal"):
+            vals = np.array([_excel_safe(v) for v in vals], dtype=object)
+    vals[missing] = None
+    return vals
+
+
+XL_MAX_ROWS = 1_000_000            # headroom under Excel's 1,048,576
+XL_CHUNK_ROWS = 50_000             # rows materialised at a time when streaming
+
+
+def _run_summary(results, dedup):
+    """The Run Summary table: one row per discovered file."""
     summary = pd.DataFrame([{
         "File": r.file, "File Size": human_size(r.size),
         "Status": r.status, "Sheet": r.sheet,
-        "Header Row": r.header_row, "Rows Extracted": r.rows,
+        "Header Row": r.header_row, "Template": r.template,
+        "Rows Extracted": r.rows,
         "Columns Matched": f"{r.matched}/{len(TARGET_COLUMNS)}",
         "Missing Columns": "; ".join(r.missing), "Notes": r.message,
     } for r in results])
@@ -975,85 +2424,187 @@ def write_output(folder, results, combined, analytics=None,
         pf = dedup["per_file"]
         dmap = dict(zip(pf["File"], pf["Duplicate Rows Removed"]))
         kmap = dict(zip(pf["File"], pf["Unique Rows Kept"]))
-        summary.insert(6, "Duplicate Rows Removed",
+        summary.insert(7, "Duplicate Rows Removed",
                        summary["File"].map(dmap).fillna(0).astype(int))
-        summary.insert(7, "Unique Rows Kept",
+        summary.insert(8, "Unique Rows Kept",
                        summary["File"].map(kmap).fillna(0).astype(int))
+    return summary
 
-    XL_MAX_ROWS = 1_000_000            # headroom under Excel's 1,048,576
+
+def _template_summary(results):
+    """Per-template statistics: files, rows and column coverage for each
+    header layout the template registry resolved."""
+    rows = {}
+    for r in results:
+        if not r.template:
+            continue
+        t = rows.setdefault(r.template, {
+            "Template": r.template, "Files": 0, "Files with Warnings": 0,
+            "Rows Extracted": 0,
+            "Columns Matched": f"{r.matched}/{len(TARGET_COLUMNS)}",
+            "Missing Columns": "; ".join(r.missing), "Example File": r.file})
+        t["Files"] += 1
+        t["Files with Warnings"] += r.status == "WARN"
+        t["Rows Extracted"] += r.rows
+    cols = ["Template", "Files", "Files with Warnings", "Rows Extracted",
+            "Columns Matched", "Missing Columns", "Example File"]
+    return pd.DataFrame(list(rows.values()), columns=cols) \
+        .sort_values(["Files", "Template"], ascending=[False, True]) \
+        .reset_index(drop=True)
+
+
+def _sheet_plan(results, combined, analytics, dedup):
+    """[(sheet name, [(frame, startrow), ...]), ...] in workbook order."""
+    summary = _run_summary(results, dedup)
+    combined = combined.drop(columns=LINEAGE_MASK, errors="ignore")
+    plan = []
+    if len(combined) <= XL_MAX_ROWS:
+        plan.append(("Consolidated Data", [(combined, 0)]))
+    else:
+        for i, start in enumerate(range(0, len(combined), XL_MAX_ROWS)):
+            name = ("Consolidated Data" if i == 0
+                    else f"Consolidated Data ({i + 1})")
+            plan.append((name, [(combined.iloc[start:start + XL_MAX_ROWS],
+                                  0)]))
+    plan.append(("Run Summary", [(summary, 0),
+                                 (_template_summary(results),
+                                  len(summary) + 3)]))
+    if analytics:
+        plan.append(("Executive KPIs", [(pd.DataFrame(
+            list(analytics["kpis"].items()),
+            columns=["Metric", "Value"]), 0)]))
+        for key, name in [("db_type", "By Database Type"),
+                          ("db_inventory", "DB Inventory"),
+                          ("segment", "By Business Segment"),
+                          ("asset_owner", "By Asset Owner"),
+                          ("dbs_by_output", "DBs by Output"),
+                          ("dbs_by_owner", "DBs by Output Owner"),
+                          ("dbs_by_srctype", "DBs by Source Type"),
+                          ("source_inventory", "Source Inventory & Gaps"),
+                          ("dq", "Data Quality"),
+                          ("norm_map", "DB Type Mapping"),
+                          ("schemas_by_db", "Schemas by Database")]:
+            if key in analytics:
+                plan.append((name, [(analytics[key], 0)]))
+        plan.append(("CDE Inventory", [
+            (analytics["cde_inventory"], 0),
+            (analytics["cde_by_segment"],
+             len(analytics["cde_inventory"]) + 3)]))
+        plan.append(("Lineage Coverage", [
+            (analytics["lineage_status"], 0),
+            (analytics["lineage_systems"],
+             len(analytics["lineage_status"]) + 3)]))
+        plan.append(("Harvest Priority", [(analytics["harvest"], 0)]))
+        plan.append(("Lineage Detail",
+                     [(analytics["lineage_detail"].head(100000), 0)]))
+    if dedup:
+        metrics = pd.DataFrame([
+            ("Files Found", dedup["files_found"]),
+            ("Files Processed", dedup["files_processed"]),
+            ("Files Loaded from Extraction Cache",
+             dedup.get("files_from_cache", 0)),
+            ("Identical Files Skipped (byte-for-byte)",
+             dedup["identical_files_skipped"]),
+            ("Superseded Files Skipped (filename mode, optional)",
+             dedup["superseded_files_skipped"]),
+            ("Rows Before Row-Level Dedup", dedup["rows_before_dedup"]),
+            ("Duplicate Rows Removed", dedup["duplicate_rows_removed"]),
+            ("Rows After Dedup", dedup["rows_after_dedup"]),
+        ], columns=["Metric", "Value"])
+        skipped = pd.DataFrame(
+            dedup["skipped_detail"] or [("(none)", "")],
+            columns=["Skipped File", "Reason"])
+        plan.append(("Dedup Summary",
+                     [(metrics, 0), (skipped, len(metrics) + 3)]))
+        if len(dedup.get("per_file", [])):
+            parts = [(dedup["per_file"], 0)]
+            if len(dedup.get("overlap", [])):
+                parts.append((dedup["overlap"], len(dedup["per_file"]) + 3))
+            plan.append(("Content Overlap", parts))
+    return plan
+
+
+# ---- streaming xlsx writer ----
+# openpyxl's write-only workbook serialises each row as it is appended, so
+# a sheet is never held as cell objects. Frames are made Excel-safe and
+# appended XL_CHUNK_ROWS rows at a time; column widths come from a first
+# chunked pass, since a write-only sheet takes its widths before any row.
+
+def _xl_column(s: pd.Series):
+    """(values, width) for one column: values(start, stop) returns the
+    Excel-safe cells of rows start:stop as a list, and width is the widest
+    str() among its values. A categorical column makes each category safe
+    once; any other column is converted a row range at a time."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        lut = np.empty(len(s.cat.categories) + 1, dtype=object)
+        lut[:] = [_excel_safe(v) for v in s.cat.categories] + [None]
+        used = np.unique(codes)
+        width = max((len(str(lut[k])) for k in used
+                     if lut[k] is not None), default=0)
+        return (lambda a, b: lut[codes[a:b]].tolist()), width
+    width = 0
+    for a in range(0, len(s), XL_CHUNK_ROWS):
+        vals = _excel_column(s.iloc[a:a + XL_CHUNK_ROWS])
+        width = max(width, max((len(str(v)) for v in vals if v is not None),
+                               default=0))
+    return (lambda a, b: _excel_column(s.iloc[a:b]).tolist()), width
+
+
+def _write_streaming(out_path, plan):
+    """Write plan as an .xlsx through openpyxl's write-only workbook,
+    appending each sheet's rows XL_CHUNK_ROWS at a time. Column widths
+    follow the data: the widest value (header included, floor 10) + 2,
+    capped at 48."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    thin = Side(style="thin")
+    header_font = Font(bold=True)
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_align = Alignment(horizontal="center", vertical="top")
+
+    wb = Workbook(write_only=True)
+    for name, parts in plan:
+        ws = wb.create_sheet(name)
+        widths, columns = {}, []
+        for frame, _ in parts:
+            cols = [_xl_column(frame[c]) for c in frame.columns]
+            for j, c in enumerate(frame.columns):
+                widths[j] = max(widths.get(j, 10), len(str(c)), cols[j][1])
+            columns.append([values for values, _ in cols])
+        for j, w in widths.items():
+            ws.column_dimensions[get_column_letter(j + 1)].width = min(w + 2, 48)
+
+        row = 0                            # rows written so far
+        for (frame, startrow), renders in zip(parts, columns):
+            for _ in range(startrow - row):
+                ws.append([])
+            header = []
+            for c in frame.columns:
+                cell = WriteOnlyCell(ws, value=_excel_safe(str(c)))
+                cell.font, cell.border = header_font, header_border
+                cell.alignment = header_align
+                header.append(cell)
+            ws.append(header)
+            for a in range(0, len(frame), XL_CHUNK_ROWS):
+                b = min(a + XL_CHUNK_ROWS, len(frame))
+                for values in zip(*[render(a, b) for render in renders]):
+                    ws.append(values)
+            row = startrow + len(frame) + 1
+    wb.save(out_path)
+
+
+def _write_pandas(out_path, plan):
+    """Original pandas/openpyxl writer (whole workbook in memory, widths
+    from the first 200 rows)."""
     xw = pd.ExcelWriter(out_path, engine="openpyxl")
     try:
-        clean = sanitize_df(combined)
-        if len(clean) <= XL_MAX_ROWS:
-            clean.to_excel(xw, sheet_name="Consolidated Data", index=False)
-        else:
-            for i, start in enumerate(range(0, len(clean), XL_MAX_ROWS)):
-                name = ("Consolidated Data" if i == 0
-                        else f"Consolidated Data ({i + 1})")
-                clean.iloc[start:start + XL_MAX_ROWS].to_excel(
-                    xw, sheet_name=name, index=False)
-        sanitize_df(summary).to_excel(
-            xw, sheet_name="Run Summary", index=False)
-        if analytics:
-            pd.DataFrame(list(analytics["kpis"].items()),
-                         columns=["Metric", "Value"]).to_excel(
-                xw, sheet_name="Executive KPIs", index=False)
-            sanitize_df(analytics["db_type"]).to_excel(xw, sheet_name="By Database Type", index=False)
-            sanitize_df(analytics["db_inventory"]).to_excel(xw, sheet_name="DB Inventory", index=False)
-            sanitize_df(analytics["segment"]).to_excel(xw, sheet_name="By Business Segment", index=False)
-            sanitize_df(analytics["asset_owner"]).to_excel(xw, sheet_name="By Asset Owner", index=False)
-            sanitize_df(analytics["dbs_by_output"]).to_excel(xw, sheet_name="DBs by Output", index=False)
-            sanitize_df(analytics["dbs_by_owner"]).to_excel(xw, sheet_name="DBs by Output Owner",
-                                               index=False)
-            sanitize_df(analytics["dbs_by_srctype"]).to_excel(xw, sheet_name="DBs by Source Type",
-                                                 index=False)
-            sanitize_df(analytics["source_inventory"]).to_excel(xw, sheet_name="Source Inventory & Gaps",
-                                                   index=False)
-            sanitize_df(analytics["dq"]).to_excel(xw, sheet_name="Data Quality", index=False)
-            if "norm_map" in analytics:
-                sanitize_df(analytics["norm_map"]).to_excel(xw, sheet_name="DB Type Mapping",
-                                               index=False)
-            sanitize_df(analytics["schemas_by_db"]).to_excel(
-                xw, sheet_name="Schemas by Database", index=False)
-            sanitize_df(analytics["cde_inventory"]).to_excel(
-                xw, sheet_name="CDE Inventory", index=False)
-            sanitize_df(analytics["cde_by_segment"]).to_excel(
-                xw, sheet_name="CDE Inventory", index=False,
-                startrow=len(analytics["cde_inventory"]) + 3)
-            sanitize_df(analytics["lineage_status"]).to_excel(
-                xw, sheet_name="Lineage Coverage", index=False)
-            sanitize_df(analytics["lineage_systems"]).to_excel(
-                xw, sheet_name="Lineage Coverage", index=False,
-                startrow=len(analytics["lineage_status"]) + 3)
-            sanitize_df(analytics["harvest"]).to_excel(
-                xw, sheet_name="Harvest Priority", index=False)
-            sanitize_df(analytics["lineage_detail"].head(100000)).to_excel(
-                xw, sheet_name="Lineage Detail", index=False)
-        if dedup:
-            metrics = pd.DataFrame([
-                ("Files Found", dedup["files_found"]),
-                ("Files Processed", dedup["files_processed"]),
-                ("Identical Files Skipped (byte-for-byte)",
-                 dedup["identical_files_skipped"]),
-                ("Superseded Files Skipped (filename mode, optional)",
-                 dedup["superseded_files_skipped"]),
-                ("Rows Before Row-Level Dedup", dedup["rows_before_dedup"]),
-                ("Duplicate Rows Removed", dedup["duplicate_rows_removed"]),
-                ("Rows After Dedup", dedup["rows_after_dedup"]),
-            ], columns=["Metric", "Value"])
-            skipped = pd.DataFrame(
-                dedup["skipped_detail"] or [("(none)", "")],
-                columns=["Skipped File", "Reason"])
-            metrics.to_excel(xw, sheet_name="Dedup Summary", index=False)
-            skipped.to_excel(xw, sheet_name="Dedup Summary", index=False,
-                             startrow=len(metrics) + 3)
-            if len(dedup.get("per_file", [])):
-                sanitize_df(dedup["per_file"]).to_excel(
-                    xw, sheet_name="Content Overlap", index=False)
-                if len(dedup.get("overlap", [])):
-                    sanitize_df(dedup["overlap"]).to_excel(
-                        xw, sheet_name="Content Overlap", index=False,
-                        startrow=len(dedup["per_file"]) + 3)
+        for name, parts in plan:
+            for frame, startrow in parts:
+                sanitize_df(frame).to_excel(xw, sheet_name=name, index=False,
+                                            startrow=startrow)
         for ws in xw.book.worksheets:
             widths = {}
             for row in ws.iter_rows(min_row=1, max_row=200):
@@ -1075,13 +2626,204 @@ def write_output(folder, results, combined, analytics=None,
         except Exception:
             pass
         raise
-    return out_path
+
+
+def write_output(folder, results, combined, analytics=None,
+                 dedup=None, streaming=True, formats=("xlsx",)) -> str:
+    """Write the run's outputs and return the main path: the workbook when
+    "xlsx" is among formats, else the first sidecar folder.
+
+    streaming=True uses the streaming xlsx backend; False keeps the
+    original pandas.ExcelWriter path. "parquet" / "feather" in formats
+    add columnar sidecars (see write_sidecars)."""
+    bad = [f for f in formats if f not in OUTPUT_FORMATS]
+    if bad or not formats:
+        raise ValueError(f"formats must be drawn from {OUTPUT_FORMATS}, "
+                         f"got {tuple(formats)!r}")
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    paths = []
+    if "xlsx" in formats:
+        out_path = os.path.join(folder, f"DSCIT_Consolidated_{stamp}.xlsx")
+        plan = _sheet_plan(results, combined, analytics, dedup)
+        if streaming:
+            _write_streaming(out_path, plan)
+        else:
+            _write_pandas(out_path, plan)
+        paths.append(out_path)
+    for fmt in formats:
+        if fmt in SIDECAR_FORMATS:
+            paths.append(write_sidecars(folder, results, combined,
+                                        analytics, dedup, fmt, stamp))
+    return paths[0]
+
+
+# ---- columnar sidecars ----
+# The same tables as the workbook, one Parquet or Feather file each, plus
+# manifest.json (row counts, schemas, KPI / dedup scalars) and, for
+# Parquet, views.sql to mount the folder in DuckDB. Categorical columns
+# are stored dictionary-encoded. Feather is written uncompressed so
+# load_sidecars can memory-map it.
+
+SIDECAR_FORMATS = ("parquet", "feather")
+OUTPUT_FORMATS = ("xlsx",) + SIDECAR_FORMATS
+SIDECAR_MANIFEST = "manifest.json"
+
+
+def _arrow_text(v):
+    if v is None or v is pd.NA or (isinstance(v, float) and v != v):
+        return None
+    return v if isinstance(v, str) else str(v)
+
+
+def _arrow_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow-writable copy of df: mixed-type columns (numbers among
+    text, as DSCIT cells often are) are stored as text."""
+    out = {}
+    for c in df.columns:
+        s = df[c]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            kind = pd.api.types.infer_dtype(s.cat.categories, skipna=True)
+        elif s.dtype == object:
+            kind = pd.api.types.infer_dtype(s, skipna=True)
+        else:
+            kind = "typed"
+        if kind not in ("typed", "string", "empty", "integer", "floating",
+                        "boolean", "datetime", "date"):
+            s = map_encoded(s, _arrow_text)
+        out[str(c)] = s
+    return pd.DataFrame(out).reset_index(drop=True)
+
+
+def _run_tables(results, combined, analytics, dedup):
+    """{table name: frame} for every tabular output of a run."""
+    tables = {"consolidated": combined,
+              "run_summary": _run_summary(results, dedup),
+              "template_summary": _template_summary(results)}
+    if dedup:
+        for k in ("per_file", "overlap"):
+            if isinstance(dedup.get(k), pd.DataFrame):
+                tables[k] = dedup[k]
+    for k, v in (analytics or {}).items():
+        if isinstance(v, pd.DataFrame):
+            tables[k] = v
+    return tables
+
+
+def write_sidecars(folder, results, combined, analytics=None, dedup=None,
+                   fmt="parquet", stamp=None) -> str:
+    """Write every output table as fmt files into
+    DSCIT_Consolidated_<stamp>_<fmt>/ and return that folder."""
+    if fmt not in SIDECAR_FORMATS:
+        raise ValueError(f"fmt must be one of {SIDECAR_FORMATS}, "
+                         f"got {fmt!r}")
+    if not ARROW_AVAILABLE:
+        raise RuntimeError(f"{fmt} output needs pyarrow "
+                           f"(pip install pyarrow)")
+    stamp = stamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_dir = os.path.join(folder, f"DSCIT_Consolidated_{stamp}_{fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {"generated": datetime.now().isoformat(timespec="seconds"),
+                "format": fmt, "rules_version": rules_version(),
+                "tables": {}}
+    for name, df in _run_tables(results, combined, analytics,
+                                dedup).items():
+        fname = f"{name}.{fmt}"
+        frame = _arrow_frame(df)
+        if fmt == "parquet":
+            frame.to_parquet(os.path.join(out_dir, fname), index=False)
+        else:
+            frame.to_feather(os.path.join(out_dir, fname),
+                             compression="uncompressed")
+        manifest["tables"][name] = {
+            "file": fname, "rows": len(frame),
+            "columns": {c: str(t) for c, t in frame.dtypes.items()}}
+    if analytics:
+        manifest["kpis"] = analytics.get("kpis", {})
+        manifest["completeness_score"] = analytics.get("completeness_score")
+    if dedup:
+        manifest["dedup"] = {k: v for k, v in dedup.items()
+                             if not isinstance(v, pd.DataFrame)}
+    with open(os.path.join(out_dir, SIDECAR_MANIFEST), "w",
+              encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    if fmt == "parquet":
+        with open(os.path.join(out_dir, "views.sql"), "w",
+                  encoding="utf-8") as f:
+            f.write("-- duckdb -init views.sql  (run from this folder)\n")
+            for name, t in manifest["tables"].items():
+                f.write(f"CREATE OR REPLACE VIEW {name} AS "
+                        f"SELECT * FROM read_parquet('{t['file']}');\n")
+    return out_dir
+
+
+def load_sidecars(path, tables=None):
+    """Load a sidecar folder written by write_sidecars.
+
+    Returns (combined, analytics, dedup) shaped like the in-memory run,
+    so generate_dashboard can be fed without re-running the analytics;
+    tables limits which table files are read. Feather files are
+    memory-mapped."""
+    with open(os.path.join(path, SIDECAR_MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    frames = {}
+    for name, t in manifest["tables"].items():
+        if tables is not None and name not in tables:
+            continue
+        p = os.path.join(path, t["file"])
+        if manifest["format"] == "feather":
+            from pyarrow import feather
+            frames[name] = feather.read_table(p, memory_map=True).to_pandas()
+        else:
+            frames[name] = pd.read_parquet(p)
+    combined = frames.pop("consolidated", None)
+    frames.pop("run_summary", None)
+    dedup = dict(manifest.get("dedup", {}))
+    for k in ("per_file", "overlap"):
+        if k in frames:
+            dedup[k] = frames.pop(k)
+    analytics = dict(frames)
+    if "kpis" in manifest:
+        analytics["kpis"] = manifest["kpis"]
+        analytics["completeness_score"] = manifest["completeness_score"]
+    return combined, analytics, dedup
 
 
 # ============================================================================
 # 6. EXECUTIVE HTML DASHBOARD (self-contained, SVG charts, TD theme)
 # ============================================================================
 
+DASH_CHUNK_COMBOS = 65536     # combos per base64 chunk in the dashboard
+
+
+def _dash_cv(v):
+    if v is None or (isinstance(v, float) and v != v):
+        return None
+    s = str(v).strip()
+    return s if s and s.lower() not in (
+        "na", "n/a", "none", "null", "nan", "tbd", "-") else None
+
+
+def _first_seen(codes, values):
+    """Renumber codes (-1 = missing) by first appearance; returns the new
+    codes and values reordered to match."""
+    present = codes >= 0
+    u, first = np.unique(codes[present], return_index=True)
+    u = u[np.argsort(first, kind="stable")]
+    rank = np.full(len(values) + 1, -1, dtype=np.int32)
+    rank[u] = np.arange(len(u), dtype=np.int32)
+    return rank[codes], [values[k] for k in u]
+
+
+def _dash_codes(series, fn):
+    """Row codes (first-seen order, -1 = None) and the value table of
+    fn(value) over a column. fn runs once per distinct value."""
+    cat = series.array if isinstance(series.dtype, pd.CategoricalDtype) \
+        else encode(series)
+    vals = [fn(v) for v in cat.categories] + [fn(None)]
+    vcodes, uniq = pd.factorize(pd.Series(vals, dtype=object))
+    return _first_seen(vcodes[np.asarray(cat.codes)], list(uniq))
+
+
 def _dash_payload(combined: pd.DataFrame):
     """Compress row-level data for the dashboard.
 
@@ -1090,68 +2832,107 @@ def _dash_payload(combined: pd.DataFrame):
     rows with no Data Element, and the set of distinct Data Element ids.
     Dimension 12 is the canonicalized Data Element Indicator (CDE/BDE/
     Metric) and dimension 16 is the derived Lineage Status (Full/Partial/
-    No Lineage across the five Data Flow Linkage fields)."""
+    No Lineage across the five Data Flow Linkage fields).
+
+    Everything is columnar: "dims" holds one int32 code array per
+    dimension (-1 = missing), "cnt" / "nul" the per-combo counts, and the
+    element ids are CSR-packed ("ids" sliced by "ioff"). Codes, elements
+    and combos are numbered in order of first appearance."""
     base = ["Output Name", "Output Owner", "Source Name", "Source Type",
             "Source Application EUC / MAL Code", "Database Type",
             "Database Name", "Database",
             "Business Segment / Corporate Function", "Asset Owner Name",
             "Technology Asset Owner Name", "Data Owner Name"]
-    cols = base + ["Data Element Indicator", "Schema Name / File Path / API"] \
-        + LINEAGE_COLUMNS + ["Data Element"]
+    n = len(combined)
+
+    def col(c):
+        return combined[c] if c in combined else \
+            pd.Series([None] * n, dtype=object)
+
+    fields, codes = [], []
+    for j, c in enumerate(base + ["Data Element Indicator",
+                                  "Schema Name / File Path / API"]):
+        k, t = _dash_codes(col(c), classify_indicator if j == 12
+                           else _dash_cv)
+        codes.append(k)
+        fields.append(t)
+    for c in LINEAGE_COLUMNS[:2]:                      # lin system, db
+        k, t = _dash_codes(col(c), _dash_cv)
+        codes.append(k)
+        fields.append(t)
+    k, t = _first_seen(lineage_status_codes(lineage_mask(combined)),
+                       list(LINEAGE_STATUS))
+    codes.append(k)
+    fields.append(t)
+    elem, elems = _dash_codes(col("Data Element"), _dash_cv)
+
+    # -- combos: first-seen groups of the 17-code tuple --
+    comb, card = np.zeros(n, dtype=np.int64), 1
+    for k in codes:
+        radix = int(k.max(initial=-1)) + 2
+        if card * radix >= 1 << 62:      # re-densify before it overflows
+            comb = np.unique(comb, return_inverse=True)[1].ravel()
+            card = int(comb.max(initial=0)) + 1
+        comb = comb * radix + (k + 1)
+        card *= radix
+    _, first, gid = np.unique(comb, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[order] = np.arange(len(first))
+    gid = rank[gid.ravel()]
+    first = first[order]
+    ncombo = len(first)
+
+    has = elem >= 0
+    pairs = np.unique(gid[has] * max(len(elems), 1) + elem[has])
+    owner = pairs // max(len(elems), 1)
+    ioff = np.zeros(ncombo + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owner, minlength=ncombo), out=ioff[1:])
+    return {
+        "fields": fields, "elems": elems,
+        "dims": [k[first].astype(np.int32) for k in codes],
+        "cnt": np.bincount(gid, minlength=ncombo).astype(np.int32),
+        "nul": np.bincount(gid[~has], minlength=ncombo).astype(np.int32),
+        "ioff": ioff,
+        "ids": (pairs % max(len(elems), 1)).astype(np.int32),
+    }
 
-    def cv(v):
-        if v is None or (isinstance(v, float) and v != v):
-            return None
-        s = str(v).strip()
-        return s if s and s.lower() not in (
-            "na", "n/a", "none", "null", "nan", "tbd", "-") else None
-
-    n_dims = 17
-    lookups = [{} for _ in range(n_dims)]
-    tables = [[] for _ in range(n_dims)]
-    elem_map, elems = {}, []
-    combos = {}
-
-    def enc(j, v):
-        if v is None:
-            return -1
-        d = lookups[j]
-        idx = d.get(v)
-        if idx is None:
-            idx = d[v] = len(tables[j])
-            tables[j].append(v)
-        return idx
-
-    df = combined.reindex(columns=cols)
-    for tup in df.itertuples(index=False, name=None):
-        key = [enc(j, cv(tup[j])) for j in range(12)]
-        key.append(enc(12, classify_indicator(tup[12])))       # ind
-        key.append(enc(13, cv(tup[13])))                       # src schema
-        lvals = [cv(x) for x in tup[14:19]]                    # 5 lineage
-        key.append(enc(14, lvals[0]))                          # lin system
-        key.append(enc(15, lvals[1]))                          # lin database
-        present = sum(x is not None for x in lvals)
-        lstat = ("Full Lineage" if present == 5 else
-                 "Partial Lineage" if present else "No Lineage")
-        key.append(enc(16, lstat))                             # lin status
-        e = cv(tup[19])
-        k = tuple(key)
-        rec = combos.get(k)
-        if rec is None:
-            rec = combos[k] = [0, 0, set()]
-        rec[0] += 1
-        if e is None:
-            rec[1] += 1
-        else:
-            ei = elem_map.get(e)
-            if ei is None:
-                ei = elem_map[e] = len(elems)
-                elems.append(e)
-            rec[2].add(ei)
 
-    packed = [list(k) + [c[0], c[1], sorted(c[2])]
-              for k, c in combos.items()]
-    return {"fields": tables, "elems": elems, "combos": packed}
+_DASH_TYPES = [("Uint8", "<u1", 0xFF), ("Uint16", "<u2", 0xFFFF),
+               ("Int32", "<i4", 0x7FFFFFFF)]
+
+
+def _dash_chunks(payload, size=DASH_CHUNK_COMBOS):
+    """Split a _dash_payload into base64 chunks of up to size combos.
+
+    Returns (meta, chunks). meta carries the value tables, the total row
+    count (so the page can show it before the chunks are in) and, per chunk,
+    the combo count and the [column, typed-array type, byte offset, length]
+    layout of its buffer; each column gets the narrowest of Uint8 / Uint16
+    / Int32 that holds it. Dimension codes are stored +1 so 0 means
+    missing; element offsets are chunk-local."""
+    dims, ncombo = payload["dims"], len(payload["cnt"])
+    chunks, layout = [], []
+    for a in range(0, ncombo, size):
+        b = min(a + size, ncombo)
+        lo, hi = payload["ioff"][a], payload["ioff"][b]
+        cols = [(f"d{j}", dims[j][a:b] + 1) for j in range(len(dims))]
+        cols += [("cnt", payload["cnt"][a:b]), ("nul", payload["nul"][a:b]),
+                 ("ioff", payload["ioff"][a:b + 1] - lo),
+                 ("ids", payload["ids"][lo:hi])]
+        buf, spec = bytearray(), []
+        for name, arr in cols:
+            top = int(arr.max(initial=0))
+            typ, np_typ, _ = next(t for t in _DASH_TYPES if top <= t[2])
+            raw = np.ascontiguousarray(arr, dtype=np_typ).tobytes()
+            spec.append([name, typ, len(buf), len(arr)])
+            buf += raw + b"\0" * (-len(raw) % 4)     # keep views aligned
+        chunks.append(base64.b64encode(bytes(buf)).decode("ascii"))
+        layout.append({"n": b - a, "cols": spec})
+    meta = {"fields": payload["fields"], "elems": payload["elems"],
+            "combos": ncombo, "elemIds": int(len(payload["ids"])),
+            "rows": int(payload["cnt"].sum()), "chunks": layout}
+    return meta, chunks
 
 
 DASH_TEMPLATE = r"""<!DOCTYPE html>
@@ -1318,16 +3099,60 @@ body{font-family:'Segoe UI',Arial,sans-serif;background:var(--mist);
   <div class="content" id="content"></div>
 </div>
 
+<script type="application/json" id="dash-meta">__META__</script>
+__CHUNKS__
 <script>
 /* ==================== DATA (dictionary-encoded weighted combos) ========
-   Each combo: [12 field indexes (-1 = missing), rowCount,
-                rowsWithNoElement, [distinct element ids]]              */
-const P = __PAYLOAD__;
-const LOOK = P.fields, ELEMS = P.elems, COMBOS = P.combos;
-const ELEMS_LC = ELEMS.map(s => s.toLowerCase());
+   Combos are stored column-wise and referred to by index: D[field][i] is
+   the field's value index (-1 = missing), CNTA[i] the row count, NULA[i]
+   the rows with no Data Element, IDV[IOFF[i]..IOFF[i+1]) the distinct
+   element ids. The columns arrive as base64 chunks (non-executed script
+   blocks) that are decoded one at a time after the page has painted; the
+   overview is drawn from the first chunk and redrawn as the loaded share
+   doubles, so the page is useful long before the last chunk is in.    */
+const META = JSON.parse(document.getElementById("dash-meta").textContent);
+const LOOK = META.fields, ELEMS = META.elems, NCOMBO = META.combos;
+const D = LOOK.map(() => new Int32Array(NCOMBO));
+const CNTA = new Int32Array(NCOMBO), NULA = new Int32Array(NCOMBO);
+const IOFF = new Int32Array(NCOMBO + 1), IDV = new Int32Array(META.elemIds);
+let ELEMS_LC = null;                       /* built on first search */
+const elemsLc = () => ELEMS_LC || (ELEMS_LC = ELEMS.map(s => s.toLowerCase()));
+const ARRAY_TYPES = {Uint8:Uint8Array, Uint16:Uint16Array, Int32:Int32Array};
+function decodeChunk(c, at){
+  const spec = META.chunks[c], el = document.getElementById("dash-c" + c);
+  const bin = atob(el.textContent), u8 = new Uint8Array(bin.length);
+  for(let i=0;i<bin.length;i++) u8[i] = bin.charCodeAt(i);
+  el.remove();
+  const col = {};
+  for(const [name, typ, off, len] of spec.cols)
+    col[name] = new ARRAY_TYPES[typ](u8.buffer, off, len);
+  for(let j=0;j<D.length;j++){
+    const src = col["d" + j], dst = D[j];
+    for(let i=0;i<spec.n;i++) dst[at.combo + i] = src[i] - 1;
+  }
+  CNTA.set(col.cnt, at.combo); NULA.set(col.nul, at.combo);
+  for(let i=0;i<=spec.n;i++) IOFF[at.combo + i] = at.id + col.ioff[i];
+  IDV.set(col.ids, at.id);
+  at.combo += spec.n; at.id += col.ids.length;
+}
+function loadData(progress, done){
+  const at = {combo:0, id:0};
+  let c = 0, drawn = 0;
+  document.getElementById("content").innerHTML =
+    `<div class="note">Loading data…</div>`;
+  (function step(){
+    if(c === META.chunks.length){ done(); return; }
+    decodeChunk(c++, at);
+    /* redraw on doubling: total partial-render work stays O(combos) */
+    if(c < META.chunks.length && at.combo >= 2 * drawn){
+      drawn = at.combo;
+      progress(at.combo, c);
+    }
+    setTimeout(step, 0);
+  })();
+}
 const F = {out:0,owner:1,src:2,sty:3,mal:4,dbt:5,dbn:6,db:7,seg:8,ao:9,
            tao:10,downer:11,ind:12,sch:13,lsys:14,ldb:15,lstat:16};
-const CNT = 17, NUL = 18, IDS = 19;
 const FIELD_LABELS = [
  ["out","Output Name"],["owner","Output Owner"],["de","Data Element"],
  ["ind","Data Element Indicator (CDE/BDE/Metric)"],
@@ -1359,22 +3184,40 @@ const TABS = [
 const esc = s => s==null ? "—" :
   String(s).replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;");
 const fmt = n => (n==null?0:n).toLocaleString("en-US");
-function val(r, f){ const i = r[F[f]]; return i < 0 ? null : LOOK[F[f]][i]; }
-function sumW(rows){ let s=0; for(const r of rows) s += r[CNT]; return s; }
+function val(r, f){ const i = D[F[f]][r]; return i < 0 ? null : LOOK[F[f]][i]; }
+function sumW(rows){ let s=0; for(const r of rows) s += CNTA[r]; return s; }
+/* Distinct counts mark seen ids in a stamp array instead of building a
+   Set: a fresh epoch per call means the array is never cleared.        */
+let STAMP = null, EPOCH = 0;
+function nextEpoch(size){
+  if(!STAMP || STAMP.length < size)
+    STAMP = new Uint32Array(Math.max(size, STAMP ? STAMP.length : 0));
+  if(++EPOCH === 0xFFFFFFFF){ STAMP.fill(0); EPOCH = 1; }
+  return EPOCH;
+}
 function uniqF(rows, f){
-  const idx = F[f], s = new Set();
-  for(const r of rows) if(r[idx] >= 0) s.add(r[idx]);
-  return s.size;
+  const col = D[F[f]], ep = nextEpoch(LOOK[F[f]].length);
+  let n = 0;
+  for(const r of rows){
+    const c = col[r];
+    if(c >= 0 && STAMP[c] !== ep){ STAMP[c] = ep; n++; }
+  }
+  return n;
 }
 function uniqDE(rows){
-  const s = new Set();
-  for(const r of rows) for(const id of r[IDS]) s.add(id);
-  return s.size;
+  const ep = nextEpoch(ELEMS.length);
+  let n = 0;
+  for(const r of rows)
+    for(let k=IOFF[r];k<IOFF[r+1];k++){
+      const id = IDV[k];
+      if(STAMP[id] !== ep){ STAMP[id] = ep; n++; }
+    }
+  return n;
 }
 function missing(rows, f){
-  if(f === "de"){ let s=0; for(const r of rows) s += r[NUL]; return s; }
-  const idx = F[f]; let s=0;
-  for(const r of rows) if(r[idx] < 0) s += r[CNT];
+  if(f === "de"){ let s=0; for(const r of rows) s += NULA[r]; return s; }
+  const col = D[F[f]]; let s=0;
+  for(const r of rows) if(col[r] < 0) s += CNTA[r];
   return s;
 }
 function firstVal(rows, f){
@@ -1392,28 +3235,102 @@ function groupBy(rows, f, blank){
 }
 const topN = (m, fn, n) => [...m.entries()]
   .map(([k,v]) => [k, fn(v), v]).sort((a,b)=>b[1]-a[1]).slice(0, n||9999);
-const TOTAL_ROWS = sumW(COMBOS);
-
+const TOTAL_ROWS = META.rows;
+let READY = false;                         /* set once the data is in */
+
+/* ==================== CROSS-FILTER INDEX ====================
+   Per filter field, a posting list of combo indexes grouped by value
+   (bucket 0 = missing, bucket c+1 = value code c), built once by counting
+   sort. A selection becomes a bitmap over the combos; filters AND their
+   bitmaps and the search ORs the bitmaps of every matching value and
+   element, so a dropdown change never rescans the combos.           */
+const WORDS = (NCOMBO + 31) >>> 5;
+const FILTERS = [["seg","seg"],["dbt","dbt"],["owner","own"],["sty","sty"],
+                 ["ao","ao"],["ind","ind"],["lstat","lstat"],["lsys","lsys"],
+                 ["dbn","dbn"]];
+const POST = {}, CODE_OF = {}, SEL_BITS = new Map();
+let ALL_ROWS = null, ELEM_POST = null;
+
+function csr(n, buckets, each){
+  /* each(visit) calls visit(bucket, combo) in ascending combo order */
+  const off = new Int32Array(buckets + 1);
+  let total = 0;
+  each((b) => { off[b + 1]++; total++; });
+  for(let b=0;b<buckets;b++) off[b + 1] += off[b];
+  const idx = new Int32Array(total), pos = off.slice(0, buckets);
+  each((b, r) => { idx[pos[b]++] = r; });
+  return {off, idx};
+}
+function postings(f){
+  if(!POST[f]){
+    const col = D[F[f]];
+    POST[f] = csr(NCOMBO, LOOK[F[f]].length + 1, visit => {
+      for(let r=0;r<NCOMBO;r++) visit(col[r] + 1, r);
+    });
+  }
+  return POST[f];
+}
+function elemPostings(){
+  if(!ELEM_POST)
+    ELEM_POST = csr(NCOMBO, ELEMS.length, visit => {
+      for(let r=0;r<NCOMBO;r++)
+        for(let k=IOFF[r];k<IOFF[r+1];k++) visit(IDV[k], r);
+    });
+  return ELEM_POST;
+}
+function setBits(bm, p, b){
+  for(let k=p.off[b];k<p.off[b+1];k++){
+    const r = p.idx[k]; bm[r >>> 5] |= 1 << (r & 31);
+  }
+}
+function selBits(f, sel){
+  /* combos where (val(r,f) ?? "Not Specified") === sel */
+  const key = f + "\u0000" + sel;
+  let bm = SEL_BITS.get(key);
+  if(bm) return bm;
+  if(!CODE_OF[f]) CODE_OF[f] = new Map(LOOK[F[f]].map((v,i)=>[v,i]));
+  bm = new Uint32Array(WORDS);
+  const p = postings(f), code = CODE_OF[f].get(sel);
+  if(sel === "Not Specified") setBits(bm, p, 0);
+  if(code !== undefined) setBits(bm, p, code + 1);
+  if(SEL_BITS.size > 64) SEL_BITS.clear();
+  SEL_BITS.set(key, bm);
+  return bm;
+}
+function searchBits(q){
+  const bm = new Uint32Array(WORDS);
+  for(const f of ["out","src","mal","dbn"]){
+    const look = LOOK[F[f]], p = postings(f);
+    for(let c=0;c<look.length;c++)
+      if(String(look[c]).toLowerCase().includes(q)) setBits(bm, p, c + 1);
+  }
+  const lc = elemsLc(), ep = elemPostings();
+  for(let i=0;i<lc.length;i++)
+    if(lc[i].includes(q)) setBits(bm, ep, i);
+  return bm;
+}
 function filtered(){
+  let bm = null;
+  const and = b => { if(!bm) bm = b.slice();
+                     else for(let w=0;w<WORDS;w++) bm[w] &= b[w]; };
+  for(const [f, k] of FILTERS)
+    if(state[k] !== "ALL") and(selBits(f, state[k]));
   const q = state.q.toLowerCase();
-  let matchIds = null;
-  if(q){
-    matchIds = new Set();
-    for(let i=0;i<ELEMS_LC.length;i++)
-      if(ELEMS_LC[i].includes(q)) matchIds.add(i);
+  if(q) and(searchBits(q));
+  if(!bm){
+    if(!ALL_ROWS) ALL_ROWS = Array.from({length: NCOMBO}, (_, i) => i);
+    return ALL_ROWS;
   }
-  const pass = (r,f,sel) => sel==="ALL" ||
-    (val(r,f) ?? "Not Specified") === sel;
-  return COMBOS.filter(r =>
-    pass(r,"seg",state.seg) && pass(r,"dbt",state.dbt) &&
-    pass(r,"owner",state.own) && pass(r,"sty",state.sty) &&
-    pass(r,"ao",state.ao) && pass(r,"ind",state.ind) &&
-    pass(r,"lstat",state.lstat) && pass(r,"lsys",state.lsys) &&
-    pass(r,"dbn",state.dbn) &&
-    (!q ||
-      ["out","src","mal","dbn"].some(f =>
-        (val(r,f)||"").toLowerCase().includes(q)) ||
-      r[IDS].some(id => matchIds.has(id))));
+  const out = [];
+  for(let w=0;w<WORDS;w++){
+    let x = bm[w];
+    while(x){
+      const t = x & -x;
+      out.push((w << 5) + 31 - Math.clz32(t));
+      x ^= t;
+    }
+  }
+  return out;
 }
 
 /* ==================== CHARTS (SVG) ==================== */
@@ -1682,7 +3599,7 @@ function tabMal(rows){
       <div class="note">Source systems appearing without any EUC/MAL
       code.</div>
       ${table(["Source Name","Source Type","Rows"],
-        topN(groupBy(rows.filter(r=>r[F.mal]<0), "src",
+        topN(groupBy(rows.filter(r=>D[F.mal][r]<0), "src",
         "«Source Missing»"), v=>sumW(v))
         .map(([k,n,v])=>[k, firstVal(v,"sty"), n]),
         {scroll:true,max:100})}</div>
@@ -1793,9 +3710,9 @@ function tabQuality(rows){
     const flags = [];
     if(src==="«Source Missing»") flags.push("Source missing");
     if(mal==="«Code Missing»") flags.push("EUC/MAL missing");
-    if(v.some(r=>r[F.dbn]<0)) flags.push("DB name gaps");
-    if(v.some(r=>r[F.downer]<0)) flags.push("Data owner gaps");
-    if(v.some(r=>r[F.ao]<0)) flags.push("Asset owner gaps");
+    if(v.some(r=>D[F.dbn][r]<0)) flags.push("DB name gaps");
+    if(v.some(r=>D[F.downer][r]<0)) flags.push("Data owner gaps");
+    if(v.some(r=>D[F.ao][r]<0)) flags.push("Asset owner gaps");
     return [src,mal,sty,uniqF(v,"dbn"),sumW(v),
             flags.length?flags.join("; "):"Complete"];
   }).sort((a,b)=> (a[5]==="Complete") - (b[5]==="Complete") || b[4]-a[4]);
@@ -1843,7 +3760,7 @@ function tabLineage(rows){
     .sort((a,b)=> b[4]-a[4] || b[3]-a[3]);
 
   const cross = [];
-  for (const [s,v] of groupBy(rows.filter(r=>r[F.lsys]>=0), "lsys"))
+  for (const [s,v] of groupBy(rows.filter(r=>D[F.lsys][r]>=0), "lsys"))
     for (const [d,vv] of groupBy(v, "dbn", "«Name Missing»"))
       cross.push([s, d, uniqDE(vv), sumW(vv)]);
   cross.sort((a,b)=>b[3]-a[3]);
@@ -1900,7 +3817,7 @@ function buildNav(){
 }
 function fillSelect(id, f, label){
   const vals = new Set(LOOK[F[f]]);
-  if (COMBOS.some(r=>r[F[f]]<0)) vals.add("Not Specified");
+  if (D[F[f]].some(i=>i<0)) vals.add("Not Specified");
   const arr = [...vals].sort((a,b)=>a.localeCompare(b));
   document.getElementById(id).innerHTML =
     `<option value="ALL">All ${label} (${arr.length})</option>` +
@@ -1912,6 +3829,7 @@ function syncSelects(){
   f_q.value=state.q;
 }
 function render(){
+  if(!READY) return;
   TBL_SEQ = 0; TBL = {};
   const rows = filtered();
   const active = ["seg","dbt","own","sty","ao","ind","lstat","lsys","dbn"]
@@ -1928,13 +3846,21 @@ function render(){
     RENDERERS[state.tab](rows);
   document.querySelector(".content").scrollTop = 0;
 }
+function renderPartial(loaded, c){
+  /* Executive Overview over the combos decoded so far; filters and the
+     other tabs wait for the full data. */
+  const rows = Array.from({length: loaded}, (_, i) => i), n = sumW(rows);
+  const note = `<div class="note">Loading data… chunk ${c} of
+    ${META.chunks.length}. Figures cover ${fmt(n)} of ${fmt(TOTAL_ROWS)}
+    rows and refine as the rest arrive.</div>`;
+  TBL_SEQ = 0; TBL = {};
+  document.getElementById("f_chip").textContent =
+    `${fmt(n)} of ${fmt(TOTAL_ROWS)} rows loaded`;
+  document.getElementById("content").innerHTML = note +
+    (state.tab === "overview" ? tabOverview(rows) : "");
+}
 window.addEventListener("DOMContentLoaded", ()=>{
-  fillSelect("f_seg","seg","Segments");
-  fillSelect("f_dbt","dbt","Types");
-  fillSelect("f_own","owner","Owners");
-  fillSelect("f_sty","sty","Types");
-  fillSelect("f_ao","ao","Owners");
-  fillSelect("f_ind","ind","Types");
+  buildNav();
   const bind = (id,key)=>document.getElementById(id)
     .addEventListener("change", e=>{state[key]=e.target.value; render();});
   bind("f_seg","seg"); bind("f_dbt","dbt"); bind("f_own","own");
@@ -1949,7 +3875,16 @@ window.addEventListener("DOMContentLoaded", ()=>{
       ao:"ALL",ind:"ALL",lstat:"ALL",lsys:"ALL",dbn:"ALL",q:""});
     syncSelects(); render();
   });
-  buildNav(); render();
+  loadData(renderPartial, ()=>{
+    READY = true;
+    fillSelect("f_seg","seg","Segments");
+    fillSelect("f_dbt","dbt","Types");
+    fillSelect("f_own","owner","Owners");
+    fillSelect("f_sty","sty","Types");
+    fillSelect("f_ao","ao","Owners");
+    fillSelect("f_ind","ind","Types");
+    render();
+  });
 });
 </script></body></html>"""
 
@@ -1960,9 +3895,12 @@ def generate_dashboard(folder, analytics, combined, excel_path,
     out_path = os.path.join(
         folder,
         f"DSCIT_Executive_Dashboard_{stamp.strftime('%Y%m%d_%H%M%S')}.html")
-    payload = _dash_payload(combined)
-    data_json = json.dumps(payload, ensure_ascii=False,
+    meta, chunks = _dash_chunks(_dash_payload(combined))
+    meta_json = json.dumps(meta, ensure_ascii=False,
                            separators=(",", ":")).replace("</", "<\\/")
+    chunk_tags = "\n".join(
+        f'<script type="application/octet-stream" id="dash-c{i}">{c}'
+        f'</script>' for i, c in enumerate(chunks))
     if dedup:
         dd = (f"De-duplicated: {dedup['duplicate_rows_removed']:,} duplicate "
               f"rows removed · "
@@ -1976,7 +3914,8 @@ def generate_dashboard(folder, analytics, combined, excel_path,
            .replace("__EXCEL__",
                     html.escape(os.path.basename(excel_path or "—")))
            .replace("__DEDUP__", html.escape(dd))
-           .replace("__PAYLOAD__", data_json))
+           .replace("__CHUNKS__", chunk_tags)
+           .replace("__META__", meta_json))
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(doc)
     return out_path
@@ -1996,6 +3935,61 @@ WHITE = "#FFFFFF"
 AMBER = "#B45309"
 RED = "#B91C1C"
 
+UI_FRAME_MS = 100            # UI refresh interval
+UI_ROW_HEIGHT = 26           # results table row height (px)
+
+
+# ---- progress channel ----
+# progress_cb fires once per file on the consolidation thread. It only
+# appends to a deque (atomic under the GIL, no lock taken); the UI drains
+# it once per frame and applies the coalesced totals, so thousands of
+# files cost a few widget updates per frame rather than several per file.
+
+class ProgressAggregator:
+    """Per-file progress, published by the run and folded into running
+    totals by the UI."""
+
+    def __init__(self):
+        self._inbox = deque()
+        self.reset()
+
+    def reset(self):
+        self._inbox.clear()
+        self.results = []
+        self.done = self.total = 0
+        self.processed = self.rows = self.warn = self.err = 0
+
+    def publish(self, done, total, res):
+        """progress_cb for run_consolidation; safe from any thread."""
+        self._inbox.append((done, total, res))
+
+    def drain(self) -> int:
+        """Fold everything published since the last call into the totals
+        and self.results; returns how many results were added."""
+        pop, n = self._inbox.popleft, 0
+        while True:
+            try:
+                done, total, res = pop()
+            except IndexError:
+                return n
+            self.done, self.total = max(self.done, done), total
+            self.processed += res.status != "SKIP"
+            self.rows += res.rows
+            self.warn += res.status == "WARN"
+            self.err += res.status == "ERROR"
+            self.results.append(res)
+            n += 1
+
+
+def _result_row(res: FileResult):
+    """Results-table values for one file."""
+    return (res.file, human_size(res.size), res.status, res.sheet,
+            res.header_row or "—", res.rows,
+            f"{res.matched}/{len(TARGET_COLUMNS)}",
+            (("[cached] " if res.cached else "") + res.message
+             + ("  |  Missing: " + ", ".join(res.missing)
+                if res.missing else ""))[:180])
+
 
 def launch_ui():
     import tkinter as tk
@@ -2008,10 +4002,13 @@ def launch_ui():
     root.minsize(980, 660)
 
     ui_queue = queue.Queue()
+    progress = ProgressAggregator()
     state = {"running": False, "folder": tk.StringVar(value=""),
              "excel": None, "html": None,
              "results": None, "combined": None, "dedup": None,
-             "keep_latest": tk.BooleanVar(value=False)}
+             "keep_latest": tk.BooleanVar(value=False),
+             "use_processes": tk.BooleanVar(value=False),
+             "rebuild_cache": tk.BooleanVar(value=False)}
 
     style = ttk.Style(root)
     style.theme_use("clam")
@@ -2042,7 +4039,7 @@ def launch_ui():
     style.map("Ghost.TButton", background=[("active", TD_MIST)])
     style.configure("TD.Horizontal.TProgressbar", troughcolor="#E3EAE3",
                     background=TD_GREEN_LIGHT, thickness=14, borderwidth=0)
-    style.configure("Treeview", font=("Segoe UI", 9), rowheight=26,
+    style.configure("Treeview", font=("Segoe UI", 9), rowheight=UI_ROW_HEIGHT,
                     background=WHITE, fieldbackground=WHITE, foreground=CHARCOAL)
     style.configure("Treeview.Heading", font=("Segoe UI Semibold", 9),
                     background=TD_MIST, foreground=CHARCOAL)
@@ -2117,6 +4114,20 @@ def launch_ui():
         bg=WHITE, fg=GREY, activebackground=WHITE,
         font=("Segoe UI", 9), anchor="w", highlightthickness=0)
     dedup_chk.pack(anchor="w", pady=(2, 0))
+    proc_chk = tk.Checkbutton(
+        frow, text=f"Parse files on all CPU cores ({default_workers('process')}"
+        " worker processes) instead of a thread pool — faster on large folders",
+        variable=state["use_processes"], onvalue=True, offvalue=False,
+        bg=WHITE, fg=GREY, activebackground=WHITE,
+        font=("Segoe UI", 9), anchor="w", highlightthickness=0)
+    proc_chk.pack(anchor="w", pady=(2, 0))
+    cache_chk = tk.Checkbutton(
+        frow, text="Force full rebuild — ignore the extraction cache "
+        f"({CACHE_DIRNAME}) and re-parse every workbook",
+        variable=state["rebuild_cache"], onvalue=True, offvalue=False,
+        bg=WHITE, fg=GREY, activebackground=WHITE,
+        font=("Segoe UI", 9), anchor="w", highlightthickness=0)
+    cache_chk.pack(anchor="w", pady=(2, 0))
 
     # stats row
     stats = tk.Frame(body, bg=TD_MIST)
@@ -2150,7 +4161,8 @@ def launch_ui():
     tk.Label(pcard, textvariable=status_var, bg=TD_MIST, fg=GREY,
              font=("Segoe UI", 9)).pack(anchor="w", pady=(6, 0))
 
-    # results table
+    # results table (virtual: only the visible rows exist as tree items;
+    # scrolling re-fills them from progress.results)
     tcard = tk.Frame(body, bg=WHITE, highlightbackground="#E2E8E2",
                      highlightthickness=1)
     tcard.pack(fill="both", expand=True, pady=(16, 0))
@@ -2164,14 +4176,61 @@ def launch_ui():
     for c, (txt, w) in heads.items():
         tree.heading(c, text=txt)
         tree.column(c, width=w, anchor="w")
-    vsb = ttk.Scrollbar(tcard, orient="vertical", command=tree.yview)
-    tree.configure(yscrollcommand=vsb.set)
+    vsb = ttk.Scrollbar(tcard, orient="vertical")
     tree.pack(side="left", fill="both", expand=True, padx=(1, 0), pady=1)
     vsb.pack(side="right", fill="y")
     tree.tag_configure("OK", foreground="#006A00")
     tree.tag_configure("WARN", foreground=AMBER)
     tree.tag_configure("ERROR", foreground=RED)
     tree.tag_configure("SKIP", foreground="#8a97a5")
+    view = {"top": 0, "rows": 1}       # first shown result, visible rows
+
+    def render_table():
+        results = progress.results
+        n, rows = len(results), view["rows"]
+        top = view["top"] = max(0, min(view["top"], n - rows))
+        shown = min(rows, n - top)
+        items = tree.get_children()
+        if len(items) > shown:
+            tree.delete(*items[shown:])
+        for k in range(shown):
+            res = results[top + k]
+            if k < len(items):
+                tree.item(items[k], values=_result_row(res),
+                          tags=(res.status,))
+            else:
+                tree.insert("", "end", values=_result_row(res),
+                            tags=(res.status,))
+        if n:
+            vsb.set(top / n, (top + shown) / n)
+        else:
+            vsb.set(0, 1)
+
+    def scroll_table(*args):
+        if args[0] == "moveto":
+            view["top"] = int(float(args[1]) * len(progress.results))
+        elif args[0] == "scroll":
+            step = view["rows"] if args[2] == "pages" else 1
+            view["top"] += int(args[1]) * step
+        render_table()
+
+    def wheel(event):
+        if event.num in (4, 5):                        # X11
+            scroll_table("scroll", -1 if event.num == 4 else 1, "units")
+        else:
+            scroll_table("scroll", -3 if event.delta > 0 else 3, "units")
+        return "break"
+
+    def resize(event):
+        rows = max(1, event.height // UI_ROW_HEIGHT - 1)   # minus heading
+        if rows != view["rows"]:
+            view["rows"] = rows
+            render_table()
+
+    vsb.configure(command=scroll_table)
+    for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        tree.bind(seq, wheel)
+    tree.bind("<Configure>", resize)
 
     # footer buttons
     foot = tk.Frame(body, bg=TD_MIST)
@@ -2199,12 +4258,14 @@ def launch_ui():
     open_folder_btn.pack(side="right", padx=(0, 8))
 
     # ---------------- workers ----------------
-    def consolidation_worker(folder, keep_latest):
+    def consolidation_worker(folder, keep_latest, executor, rebuild):
         try:
-            def cb(done, total, res):
-                ui_queue.put(("progress", done, total, res))
             results, combined, dedup = run_consolidation(
-                folder, progress_cb=cb, keep_latest_per_id=keep_latest)
+                folder, progress_cb=progress.publish,
+                keep_latest_per_id=keep_latest,
+                executor=executor,
+                cache_dir=os.path.join(folder, CACHE_DIRNAME),
+                rebuild_cache=rebuild)
             analytics = build_analytics(combined, results, dedup) \
                 if len(combined) else None
             out = write_output(folder, results, combined, analytics, dedup)
@@ -2235,8 +4296,9 @@ def launch_ui():
             messagebox.showinfo(
                 "No files", "No DSCIT*.xlsx files were found in that folder.")
             return
-        for i in tree.get_children():
-            tree.delete(i)
+        progress.reset()
+        view["top"] = 0
+        render_table()
         for kk in ("processed", "rows", "dupes", "warn", "err"):
             stat_vars[kk].set("0")
         stat_vars["found"].set(str(len(files)))
@@ -2250,7 +4312,10 @@ def launch_ui():
             b.state(["disabled"])
         status_var.set("Running consolidation…")
         threading.Thread(target=consolidation_worker,
-                         args=(folder, state["keep_latest"].get()),
+                         args=(folder, state["keep_latest"].get(),
+                               "process" if state["use_processes"].get()
+                               else "thread",
+                               state["rebuild_cache"].get()),
                          daemon=True).start()
 
     def start_dashboard():
@@ -2268,32 +4333,22 @@ def launch_ui():
     run_btn.configure(command=start)
     dash_btn.configure(command=start_dashboard)
 
+    def apply_progress():
+        """One frame's worth of coalesced progress."""
+        if not progress.drain():
+            return
+        pbar["value"] = progress.done
+        for key in ("processed", "rows", "warn", "err"):
+            stat_vars[key].set(str(getattr(progress, key)))
+        status_var.set(f"Processed {progress.done} of {progress.total}…")
+        render_table()
+
     def poll():
+        apply_progress()              # before "done": totals are complete
         try:
             while True:
                 msg = ui_queue.get_nowait()
-                if msg[0] == "progress":
-                    _, done, total, res = msg
-                    pbar["value"] = done
-                    if res.status != "SKIP":
-                        stat_vars["processed"].set(
-                            str(int(stat_vars["processed"].get()) + 1))
-                    stat_vars["rows"].set(
-                        str(int(stat_vars["rows"].get()) + res.rows))
-                    if res.status == "WARN":
-                        stat_vars["warn"].set(
-                            str(int(stat_vars["warn"].get()) + 1))
-                    if res.status == "ERROR":
-                        stat_vars["err"].set(
-                            str(int(stat_vars["err"].get()) + 1))
-                    tree.insert("", "end", tags=(res.status,), values=(
-                        res.file, human_size(res.size), res.status, res.sheet,
-                        res.header_row or "—", res.rows,
-                        f"{res.matched}/{len(TARGET_COLUMNS)}",
-                        (res.message + ("  |  Missing: " + ", ".join(res.missing)
-                                        if res.missing else ""))[:180]))
-                    status_var.set(f"Processed {done} of {total}…")
-                elif msg[0] == "done":
+                if msg[0] == "done":
                     _, results, combined, out, dedup = msg
                     state.update(running=False, excel=out,
                                  results=results, combined=combined,
@@ -2329,7 +4384,7 @@ def launch_ui():
                     messagebox.showerror("Run failed", msg[1][-1500:])
         except queue.Empty:
             pass
-        root.after(100, poll)
+        root.after(UI_FRAME_MS, poll)
 
     poll()
     root.mainloop()
@@ -2339,20 +4394,179 @@ def launch_ui():
 # 8. ENTRY
 # ============================================================================
 
-if __name__ == "__main__":
-    if "--headless" in sys.argv:
-        folder = sys.argv[sys.argv.index("--headless") + 1]
+def _format_list(value):
+    formats = tuple(f.strip().lower() for f in value.split(",") if f.strip())
+    bad = [f for f in formats if f not in OUTPUT_FORMATS]
+    if bad or not formats:
+        raise argparse.ArgumentTypeError(
+            f"formats must be a comma list drawn from {OUTPUT_FORMATS}")
+    return formats
+
+
+def build_arg_parser():
+    p = argparse.ArgumentParser(
+        prog=os.path.basename(sys.argv[0]),
+        description="Consolidate a folder of DSCIT Tier-1 workbooks without "
+                    "the UI (for scheduled / batch runs).")
+    p.add_argument("folder", help="folder containing the DSCIT Excel files")
+    p.add_argument("--workers", type=int, default=None,
+                   help="parser workers (default: one per core for "
+                        "processes, a small pool for threads)")
+    p.add_argument("--executor", choices=EXECUTORS, default="thread",
+                   help="parse on a thread pool or a process pool")
+    p.add_argument("--cache-dir", default=None,
+                   help=f"extraction cache folder (default: "
+                        f"<folder>/{CACHE_DIRNAME})")
+    p.add_argument("--no-cache", action="store_true",
+                   help="parse every file, no extraction cache")
+    p.add_argument("--rebuild-cache", action="store_true",
+                   help="discard the extraction cache and re-parse")
+    p.add_argument("--incremental", action="store_true",
+                   help="reuse the previous run's combined frame for "
+                        "unchanged files")
+    p.add_argument("--keep-latest", action="store_true",
+                   help="keep only the newest file per DSCIT ID")
+    p.add_argument("--formats", type=_format_list, default=("xlsx",),
+                   help=f"comma list of outputs from {OUTPUT_FORMATS} "
+                        f"(default: xlsx)")
+    p.add_argument("--no-excel", action="store_true",
+                   help="drop xlsx from --formats (falls back to parquet)")
+    p.add_argument("--no-dashboard", action="store_true",
+                   help="skip the HTML dashboard")
+    p.add_argument("--progress", choices=("text", "json"), default="text",
+                   help="json prints one JSON object per line on stdout")
+    p.add_argument("--timings-log", metavar="PATH",
+                   help="append this run's timing record (one JSON line) "
+                        "to PATH")
+    return p
+
+
+def main(argv=None):
+    """Headless entry point: run_consolidation -> build_analytics ->
+    write_output -> generate_dashboard, reporting progress and per-stage
+    timings. Returns a process exit code: 0 on success, 1 when a stage
+    fails, 3 when the folder holds no DSCIT files and 4 when every file
+    that was parsed failed (nothing is written in either case), 5 when
+    some files failed and the outputs hold the rest. Usage errors exit
+    with argparse's 2."""
+    args = build_arg_parser().parse_args(argv)
+    folder = args.folder
+    if not os.path.isdir(folder):
+        build_arg_parser().error(f"not a folder: {folder}")
+    as_json = args.progress == "json"
+
+    def emit(event, **payload):
+        if as_json:
+            print(json.dumps({"event": event, **payload}, default=str),
+                  flush=True)
+
+    def on_file(done, total, r):
+        if as_json:
+            emit("file", done=done, total=total, file=r.file,
+                 status=r.status, rows=r.rows, message=r.message)
+        else:
+            print(f"[{done}/{total}] {r.file}: {r.status} rows={r.rows} "
+                  f"{r.message}", flush=True)
+
+    formats = args.formats
+    if args.no_excel:
+        formats = tuple(f for f in formats if f != "xlsx") or ("parquet",)
+    cache_dir = None if args.no_cache else \
+        (args.cache_dir or os.path.join(folder, CACHE_DIRNAME))
+    timings = {}
+    started = time.perf_counter()
+    emit("start", folder=os.path.abspath(folder), executor=args.executor,
+         workers=args.workers or default_workers(args.executor),
+         formats=list(formats), incremental=args.incremental)
+    if not discover_files(folder):       # as the UI: refuse, write nothing
+        msg = f"No DSCIT*.xlsx/.xlsm/.xls files found in {folder}"
+        emit("error", error=msg)
+        if not as_json:
+            print(msg, file=sys.stderr)
+        return 3
+    try:
         results, combined, dedup = run_consolidation(
-            folder, progress_cb=lambda d, t, r: print(
-                f"[{d}/{t}] {r.file}: {r.status} rows={r.rows} {r.message}"))
+            folder, progress_cb=on_file, workers=args.workers,
+            keep_latest_per_id=args.keep_latest, executor=args.executor,
+            cache_dir=cache_dir, rebuild_cache=args.rebuild_cache,
+            incremental=args.incremental and cache_dir is not None,
+            timings=timings)
+        for stage in ("discover", "hash", "parse", "dedup"):
+            emit("stage", stage=stage, seconds=round(timings[stage], 3))
+        errors = sum(1 for r in results if r.status == "ERROR")
+        parsed = sum(1 for r in results if r.status != "SKIP")
+        if errors and errors == parsed:     # no data: write nothing
+            msg = f"All {errors} DSCIT file(s) in {folder} failed to parse"
+            emit("error", error=msg, files_failed=errors)
+            if not as_json:
+                print(msg, file=sys.stderr)
+            return 4
+
+        t0 = time.perf_counter()
         analytics = build_analytics(combined, results, dedup)
-        out = write_output(folder, results, combined, analytics, dedup)
-        dash = generate_dashboard(folder, analytics, combined, out, dedup)
+        timings["analytics"] = time.perf_counter() - t0
+        emit("stage", stage="analytics",
+             seconds=round(timings["analytics"], 3))
+
+        t0 = time.perf_counter()
+        out = write_output(folder, results, combined, analytics, dedup,
+                           formats=formats)
+        timings["write"] = time.perf_counter() - t0
+        emit("stage", stage="write", seconds=round(timings["write"], 3))
+
+        dash = None
+        if not args.no_dashboard:
+            t0 = time.perf_counter()
+            dash = generate_dashboard(folder, analytics, combined, out,
+                                      dedup)
+            timings["dashboard"] = time.perf_counter() - t0
+            emit("stage", stage="dashboard",
+                 seconds=round(timings["dashboard"], 3))
+    except Exception as e:
+        emit("error", error=f"{type(e).__name__}: {e}",
+             traceback=traceback.format_exc())
+        if not as_json:
+            traceback.print_exc()
+        return 1
+
+    timings["total"] = time.perf_counter() - started
+    timings = {k: round(v, 3) for k, v in timings.items()}
+    record = {
+        "finished": datetime.now().isoformat(timespec="seconds"),
+        "folder": os.path.abspath(folder),
+        "files_found": dedup["files_found"],
+        "files_processed": dedup["files_processed"],
+        "files_from_cache": dedup["files_from_cache"],
+        "files_failed": errors,
+        "rows_before_dedup": dedup["rows_before_dedup"],
+        "rows_after_dedup": dedup["rows_after_dedup"],
+        "rows_per_second": round(dedup["rows_before_dedup"]
+                                 / max(timings["total"], 1e-9), 1),
+        "timings": timings,
+        "output": out,
+        "dashboard": dash,
+    }
+    if args.timings_log:
+        with open(args.timings_log, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, default=str) + "\n")
+    if as_json:
+        emit("done", **record)
+    else:
         print(f"\nDedup: {dedup['duplicate_rows_removed']:,} duplicate rows "
               f"removed; {dedup['identical_files_skipped']} identical + "
               f"{dedup['superseded_files_skipped']} superseded file(s) "
               f"skipped")
-        print(f"Workbook:  {out}  ({len(combined):,} unique rows)")
-        print(f"Dashboard: {dash}")
-    else:
-        launch_ui()
+        print("Timings:   " + "  ".join(
+            f"{k}={v:.2f}s" for k, v in timings.items()))
+        print(f"Output:    {out}  ({len(combined):,} unique rows)")
+        if dash:
+            print(f"Dashboard: {dash}")
+        if errors:
+            print(f"Failed:    {errors} file(s)", file=sys.stderr)
+    return 5 if errors else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    launch_ui()
@@ -14,6 +14,12 @@ from datetime import datetime
 from collections import defaultdict
 import threading
 import math
+import itertools
+import bisect
+import tempfile
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # ─────────────────────────────────────────────────────────────────────────────
 # THEME & PALETTE
@@ -57,20 +63,263 @@ FONTS = {
 # ─────────────────────────────────────────────────────────────────────────────
 # DATA ENGINE
 # ─────────────────────────────────────────────────────────────────────────────
-def load_file(path: str) -> pd.DataFrame:
+# Optional: pyarrow gives the multithreaded CSV parser and memory-mapped
+# Parquet / Feather reads; without it the loader falls back to pandas.
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+SNIFF_ROWS        = 10_000        # CSV rows sampled to pin text column types
+FRAME_CACHE_FILES = 4             # files whose loaded columns stay cached
+FRAME_CACHE_BYTES = 1 << 30       # ... within this many bytes of columns
+_ARROW_EXTS       = (".feather", ".arrow")
+# pandas' default NA markers, handed to the pyarrow parser so both CSV
+# paths agree on what is missing
+CSV_NA_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN",
+                 "-NaN", "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA",
+                 "NULL", "NaN", "None", "n/a", "nan", "null"]
+
+def _series_bytes(s: pd.Series) -> int:
+    """Memory held by a column; object columns are sized from their first
+    thousand values rather than walking every string."""
+    if s.dtype != object:
+        return int(s.memory_usage(index=False))
+    head = s.iloc[:1000]
+    per_row = head.memory_usage(index=False, deep=True) / max(1, len(head))
+    return int(per_row * len(s))
+
+class _FrameCache:
+    """Loaded columns per file, keyed by path and checked against the
+    file's mtime and size. Re-running a comparison with other columns only
+    reads the columns not loaded yet; the least recently used files are
+    dropped past FRAME_CACHE_FILES files or FRAME_CACHE_BYTES of columns,
+    and a file that alone exceeds the byte budget is not kept at all."""
+    def __init__(self, max_files: int = FRAME_CACHE_FILES,
+                 max_bytes: int = FRAME_CACHE_BYTES):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._files = OrderedDict()
+        self._lock  = threading.Lock()
+
+    def entry(self, path: str) -> dict:
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            ent = self._files.get(path)
+            if ent is None or ent["stamp"] != stamp:
+                ent = {"stamp": stamp, "info": None, "cols": {}, "bytes": 0}
+                self._files[path] = ent
+            self._files.move_to_end(path)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+            return ent
+
+    def store(self, ent: dict, cols: dict):
+        """Add loaded columns to a file's entry, then evict by bytes."""
+        with self._lock:
+            ent["cols"].update(cols)
+            ent["bytes"] += sum(_series_bytes(s) for s in cols.values())
+            total = sum(e["bytes"] for e in self._files.values())
+            for path in list(self._files):
+                if total <= self.max_bytes:
+                    break
+                old = self._files[path]
+                if old is ent:
+                    continue
+                total -= old["bytes"]
+                del self._files[path]
+            if total > self.max_bytes:
+                ent["cols"].clear()
+                ent["bytes"] = 0
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+
+FRAME_CACHE = _FrameCache()
+
+def _csv_sep(ext: str) -> str:
+    return "\t" if ext == ".tsv" else ","
+
+def sniff_file(path: str) -> dict:
+    """Read just enough of a file to list its columns.
+
+    Returns {"columns", "rows", "text_cols"}; rows is None when it cannot
+    be known without a full read (CSV / Excel), and text_cols are the CSV
+    columns the sample parses as text, which the full read keeps as text."""
+    ent = FRAME_CACHE.entry(path)
+    if ent["info"] is not None:
+        return ent["info"]
+    ext = os.path.splitext(path)[1].lower()
+    rows, text_cols = None, []
+    if ext == ".parquet" and ARROW_AVAILABLE:
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(path, memory_map=True)
+        meta = pf.schema_arrow.pandas_metadata or {}
+        index_cols = [c for c in meta.get("index_columns", []) if isinstance(c, str)]
+        columns = [c for c in pf.schema_arrow.names if c not in index_cols]
+        rows = pf.metadata.num_rows
+    elif ext in _ARROW_EXTS and ARROW_AVAILABLE:
+        import pyarrow as pa
+        with pa.memory_map(path) as src:
+            reader = pa.ipc.open_file(src)
+            columns = list(reader.schema.names)
+            rows = sum(reader.get_batch(i).num_rows
+                       for i in range(reader.num_record_batches))
+    elif ext in (".xlsx", ".xls"):
+        columns = list(pd.read_excel(path, nrows=0).columns)
+    elif ext in (".json", ".parquet") + _ARROW_EXTS:
+        # No projection possible: load once and keep every column cached
+        df = _read_columns(path, None, None)
+        FRAME_CACHE.store(ent, {c: df[c] for c in df.columns})
+        columns, rows = list(df.columns), len(df)
+    else:
+        sample = pd.read_csv(path, sep=_csv_sep(ext), nrows=SNIFF_ROWS)
+        columns = list(sample.columns)
+        # Object columns are text, except True/False with blanks, which
+        # pyarrow reads as bool with nulls the way pandas does
+        text_cols = [c for c in columns if sample[c].dtype == object and
+                     not sample[c].dropna().map(type).eq(bool).all()]
+        if len(sample) < SNIFF_ROWS:
+            rows = len(sample)
+    ent["info"] = {"columns": columns, "rows": rows, "text_cols": text_cols}
+    return ent["info"]
+
+def _csv_arrow_options(sep: str, columns: list, text_cols: list) -> dict:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    return {
+        "read_options":    pacsv.ReadOptions(use_threads=True),
+        "parse_options":   pacsv.ParseOptions(delimiter=sep),
+        "convert_options": pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c in columns if c in text_cols},
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"]),
+    }
+
+def _csv_frame(table) -> pd.DataFrame:
+    """A pyarrow CSV table as pandas would have parsed it: bool and text
+    columns with nulls hold NaN, not None."""
+    import pyarrow as pa
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_null(field.type):
+            df[field.name] = np.full(len(df), np.nan)
+        elif ((pa.types.is_boolean(field.type) or pa.types.is_string(field.type)
+                or pa.types.is_large_string(field.type))
+                and table.column(field.name).null_count
+                and df[field.name].dtype == object):
+            df[field.name] = df[field.name].fillna(np.nan)
+    return df
+
+def _read_csv_arrow(path: str, sep: str, columns: list,
+                    text_cols: list) -> pd.DataFrame:
+    import pyarrow.csv as pacsv
+    return _csv_frame(pacsv.read_csv(path, **_csv_arrow_options(sep, columns,
+                                                                text_cols)))
+
+def _read_columns(path: str, columns: list, info: dict) -> pd.DataFrame:
+    """Read `columns` (all when None) from a file with the fastest reader
+    available for its format."""
     ext = os.path.splitext(path)[1].lower()
     if ext in (".xlsx", ".xls"):
-        return pd.read_excel(path)
-    elif ext == ".csv":
-        return pd.read_csv(path)
-    elif ext == ".tsv":
-        return pd.read_csv(path, sep="\t")
+        return pd.read_excel(path, usecols=columns)
     elif ext == ".json":
-        return pd.read_json(path)
+        df = pd.read_json(path)
+        return df if columns is None else df[columns]
     elif ext == ".parquet":
-        return pd.read_parquet(path)
-    else:
-        return pd.read_csv(path)
+        if ARROW_AVAILABLE:
+            return pd.read_parquet(path, columns=columns, memory_map=True)
+        return pd.read_parquet(path, columns=columns)
+    elif ext in _ARROW_EXTS:
+        if ARROW_AVAILABLE:
+            import pyarrow.feather as feather
+            return feather.read_table(path, columns=columns,
+                                      memory_map=True).to_pandas()
+        return pd.read_feather(path, columns=columns)
+    sep = _csv_sep(ext)
+    if ARROW_AVAILABLE and columns is not None and info is not None:
+        try:
+            return _read_csv_arrow(path, sep, columns, info["text_cols"])
+        except Exception:
+            pass                        # type drift past the sample: use pandas
+    # round_trip parses floats exactly, as pyarrow does
+    return pd.read_csv(path, sep=sep, usecols=columns,
+                       float_precision="round_trip")
+
+def load_file(path: str, columns: list = None) -> pd.DataFrame:
+    """Load `columns` of a file (every column when None).
+
+    Columns already loaded from an unchanged file come from FRAME_CACHE;
+    only the rest are read, projected at parse time. The frame shares its
+    columns with the cache, so callers must not modify it in place."""
+    info = sniff_file(path)
+    ent  = FRAME_CACHE.entry(path)
+    want = list(info["columns"] if columns is None else columns)
+    cols = dict(ent["cols"])
+    missing = [c for c in want if c not in cols]
+    if missing:
+        df = _read_columns(path, missing, info)
+        loaded = {c: df[c] for c in missing}
+        cols.update(loaded)
+        FRAME_CACHE.store(ent, loaded)
+    return pd.DataFrame({c: cols[c] for c in want}, copy=False)
+
+def _streamable(path: str) -> bool:
+    return ARROW_AVAILABLE and \
+        os.path.splitext(path)[1].lower() not in (".xlsx", ".xls", ".json")
+
+def _frame_converter(src):
+    """The Arrow table -> DataFrame conversion load_file applies for `src`
+    (a path or a DataFrame): Parquet / Feather keep Arrow's to_pandas,
+    everything pandas parses (CSV, Excel, JSON, in-memory frames) holds
+    NaN rather than None in its nullable object columns."""
+    import pyarrow as pa
+    if isinstance(src, str) and \
+            os.path.splitext(src)[1].lower() in (".parquet",) + _ARROW_EXTS:
+        return pa.Table.to_pandas
+    return _csv_frame
+
+def iter_file_chunks(path: str, columns: list, rows: int = None):
+    """Yield `columns` of a file as DataFrames of about `rows` rows
+    (CHUNK_ROWS by default), typed as load_file types them.
+
+    CSV / TSV go through pyarrow's streaming reader and Parquet / Feather
+    are read batch by batch, so one chunk is resident at a time. Excel,
+    JSON and anything read without pyarrow are loaded whole and sliced."""
+    rows = rows or CHUNK_ROWS
+    if not _streamable(path):
+        df = load_file(path, columns)
+        for start in range(0, len(df), rows):
+            yield df.iloc[start:start + rows]
+        return
+    import pyarrow as pa
+    ext = os.path.splitext(path)[1].lower()
+    with pa.memory_map(path) as src:
+        if ext == ".parquet":
+            import pyarrow.parquet as pq
+            batches = pq.ParquetFile(src).iter_batches(batch_size=rows,
+                                                       columns=columns)
+        elif ext in _ARROW_EXTS:
+            reader  = pa.ipc.open_file(src)
+            batches = (reader.get_batch(i).select(columns)
+                       for i in range(reader.num_record_batches))
+        else:
+            import pyarrow.csv as pacsv
+            batches = pacsv.open_csv(src, **_csv_arrow_options(
+                _csv_sep(ext), columns, sniff_file(path)["text_cols"]))
+        convert = _frame_converter(path)
+        pending, n = [], 0
+        for batch in batches:
+            pending.append(batch)
+            n += batch.num_rows
+            if n >= rows:
+                yield convert(pa.Table.from_batches(pending))
+                pending, n = [], 0
+        if pending:
+            yield convert(pa.Table.from_batches(pending))
 
 def compute_column_stats(df: pd.DataFrame, col: str) -> dict:
     s = df[col]
@@ -101,14 +350,36 @@ def compute_column_stats(df: pd.DataFrame, col: str) -> dict:
     stats["top_values"] = [(str(k), int(v)) for k, v in top5.items()]
     return stats
 
-def compare_columns(df_a: pd.DataFrame, df_b: pd.DataFrame,
-                    key_col: str, compare_cols: list) -> dict:
-    results = {}
-
-    # Merge on key
+# Diff-row sample kept per column, and the out-of-core engine knobs: inputs
+# with at least CHUNKED_MIN_ROWS rows (A + B) are hash-partitioned on the key
+# into CHUNK_PARTITIONS on-disk spills, written CHUNK_ROWS rows at a time, and
+# the partition pairs are compared independently by CHUNK_WORKERS threads.
+# compare_files streams file pairs of that many rows (or, where the row count
+# is unknown without a full read, CHUNKED_MIN_BYTES on disk) from disk. The
+# sort-merge engine hands back exclusive keys as lists up to KEY_LIST_MAX;
+# compare_files only tries it on files whose first SORT_PROBE_ROWS keys (and,
+# for a CSV, last SORT_PROBE_BYTES) are in order.
+DIFF_SAMPLE_ROWS = 500
+KEY_LIST_MAX     = 100_000
+CHUNKED_MIN_ROWS = 2_000_000
+CHUNKED_MIN_BYTES = 256 << 20
+CHUNK_PARTITIONS = 64
+CHUNK_ROWS       = 1_000_000
+CHUNK_WORKERS    = max(1, min(4, os.cpu_count() or 1))
+SORT_PROBE_ROWS  = 65_536
+SORT_PROBE_BYTES = 1 << 20
+_HASH_MIX        = np.uint64(0x9E3779B97F4A7C15)
+
+def _compare_block(part_a: pd.DataFrame, part_b: pd.DataFrame,
+                   key_col: str, compare_cols: list,
+                   sample: int = DIFF_SAMPLE_ROWS):
+    """Outer-merge one pair of frames and reduce it to summary counters.
+
+    Returns (block, merged). The block holds only counters, the exclusive
+    keys and the first `sample` diff rows per column, so blocks from
+    separate key partitions can be folded together by _fold_blocks."""
     merged = pd.merge(
-        df_a[[key_col] + compare_cols].copy(),
-        df_b[[key_col] + compare_cols].copy(),
+        part_a, part_b,
         on=key_col, how="outer", suffixes=("__A", "__B"), indicator=True
     )
 
@@ -116,46 +387,648 @@ def compare_columns(df_a: pd.DataFrame, df_b: pd.DataFrame,
     only_b_mask = merged["_merge"] == "right_only"
     both_mask   = merged["_merge"] == "both"
 
-    results["total_keys_a"]    = len(df_a[key_col].dropna().unique())
-    results["total_keys_b"]    = len(df_b[key_col].dropna().unique())
-    results["keys_only_in_a"]  = merged.loc[only_a_mask, key_col].tolist()
-    results["keys_only_in_b"]  = merged.loc[only_b_mask, key_col].tolist()
-    results["keys_in_both"]    = int(both_mask.sum())
-    results["total_matched"]   = int(both_mask.sum())
+    block = {
+        "keys_a": len(part_a[key_col].dropna().unique()),
+        "keys_b": len(part_b[key_col].dropna().unique()),
+        "only_a": merged.loc[only_a_mask, key_col],
+        "only_b": merged.loc[only_b_mask, key_col],
+        "both":   int(both_mask.sum()),
+        "cols":   {},
+    }
+
+    cols = [c for c in compare_cols
+            if c + "__A" in merged.columns and c + "__B" in merged.columns]
+    if cols:
+        block["cols"] = _diff_kernel(merged[both_mask], key_col, cols, sample)
+    return block, merged
+
+def _diff_kernel(matched: pd.DataFrame, key_col: str, cols: list,
+                 sample: int = DIFF_SAMPLE_ROWS) -> dict:
+    """Compare every column of the matched rows in one pass.
+
+    The A and B sides are lifted into (columns x rows) arrays, one block per
+    shared numpy dtype, and a NaN-aware equality matrix is built for all
+    columns at once; the per-column counters are reductions over it. Only
+    the first `sample` mismatches per column are gathered into diff rows."""
+    cols_a = [c + "__A" for c in cols]
+    cols_b = [c + "__B" for c in cols]
+    n_rows = len(matched)
+
+    null_a = matched[cols_a].isna().to_numpy().T
+    null_b = matched[cols_b].isna().to_numpy().T
+    same   = np.empty((len(cols), n_rows), dtype=bool)
+
+    # Columns whose two sides share a plain numpy dtype compare as a 2-D
+    # block; extension / mixed dtypes compare column by column.
+    groups = defaultdict(list)
+    for j, (ca, cb) in enumerate(zip(cols_a, cols_b)):
+        da, db = matched[ca].dtype, matched[cb].dtype
+        groups[da if da == db and isinstance(da, np.dtype) else None].append(j)
+
+    for dtype, idx in groups.items():
+        if dtype is not None:
+            a_blk = matched[[cols_a[j] for j in idx]].to_numpy(dtype).T
+            b_blk = matched[[cols_b[j] for j in idx]].to_numpy(dtype).T
+            try:
+                same[idx] = a_blk == b_blk
+                continue
+            except (TypeError, ValueError):
+                pass                        # objects without a plain bool ==
+        for j in idx:
+            eq = matched[cols_a[j]] == matched[cols_b[j]]
+            same[j] = eq.to_numpy(dtype=bool, na_value=False)
+
+    same |= null_a & null_b
+    match_n = same.sum(axis=1)
+    nulls_a = null_a.sum(axis=1)
+    nulls_b = null_b.sum(axis=1)
+
+    key_pos = matched.columns.get_loc(key_col)
+    out = {}
+    for j, col in enumerate(cols):
+        hits = np.flatnonzero(~same[j])[:sample]
+        diff_rows = matched.iloc[hits, [key_pos,
+                                        matched.columns.get_loc(cols_a[j]),
+                                        matched.columns.get_loc(cols_b[j])]]
+        diff_rows.columns = [key_col, "value_a", "value_b"]
+        out[col] = {
+            "match":  int(match_n[j]),
+            "diff":   n_rows - int(match_n[j]),
+            "null_a": int(nulls_a[j]),
+            "null_b": int(nulls_b[j]),
+            "rows":   diff_rows,
+        }
+    return out
+
+def _key_sorted(parts: list, key_col: str):
+    """Concatenate per-partition key Series / diff frames back into the
+    key order a single outer merge would have produced."""
+    out = pd.concat(parts, ignore_index=True)
+    if len(parts) > 1:
+        try:
+            if isinstance(out, pd.Series):
+                out = out.sort_values(kind="mergesort", ignore_index=True)
+            else:
+                out = out.sort_values(key_col, kind="mergesort", ignore_index=True)
+        except TypeError:
+            pass                            # unorderable keys: keep partition order
+    return out
+
+def _fold_blocks(blocks: list, key_col: str, compare_cols: list,
+                 sample: int = DIFF_SAMPLE_ROWS) -> dict:
+    results = {}
+    both = sum(b["both"] for b in blocks)
+    results["total_keys_a"]    = sum(b["keys_a"] for b in blocks)
+    results["total_keys_b"]    = sum(b["keys_b"] for b in blocks)
+    results["keys_only_in_a"]  = _key_sorted([b["only_a"] for b in blocks], key_col).tolist()
+    results["keys_only_in_b"]  = _key_sorted([b["only_b"] for b in blocks], key_col).tolist()
+    results["keys_in_both"]    = both
+    results["total_matched"]   = both
 
     col_diffs = {}
     for col in compare_cols:
-        col_a = col + "__A"
-        col_b = col + "__B"
-        if col_a not in merged.columns or col_b not in merged.columns:
+        parts = [b["cols"][col] for b in blocks if col in b["cols"]]
+        if not parts:
             continue
-        matched_rows = merged[both_mask].copy()
-        a_vals = matched_rows[col_a]
-        b_vals = matched_rows[col_b]
-
-        # Compare with NaN-aware logic
-        same_mask = (
-            (a_vals == b_vals) |
-            (a_vals.isna() & b_vals.isna())
-        )
-        diff_rows = matched_rows[~same_mask][[key_col, col_a, col_b]].copy()
-        diff_rows.columns = [key_col, "value_a", "value_b"]
+        match = sum(p["match"] for p in parts)
+        diff  = sum(p["diff"] for p in parts)
+        diff_rows = _key_sorted([p["rows"] for p in parts], key_col).head(sample)
+        col_diffs[col] = {
+            "match_count":  match,
+            "diff_count":   diff,
+            "match_pct":    round(match / both * 100, 2) if both > 0 else 0,
+            "diff_pct":     round(diff / both * 100, 2) if both > 0 else 0,
+            "diff_rows":    diff_rows.to_dict("records"),
+            "null_only_a":  sum(p["null_a"] for p in parts),
+            "null_only_b":  sum(p["null_b"] for p in parts),
+        }
+    results["column_diffs"] = col_diffs
+    return results
 
+def _key_partition(keys: pd.Series, n_parts: int, numeric: bool) -> np.ndarray:
+    """Partition number per row. Rows whose keys would match in pd.merge
+    always land in the same partition: numeric keys are hashed as float64
+    (so 1 on one side meets 1.0 on the other), anything else by Python
+    hash, and every missing key goes to the same bucket."""
+    if numeric:
+        vals = keys.to_numpy(dtype="float64", na_value=np.nan)
+        h = pd.util.hash_array(vals, categorize=False)
+    else:
+        missing = keys.isna().to_numpy()
+        h = np.fromiter((hash(k) for k in keys.to_numpy(dtype=object)),
+                        dtype=np.int64, count=len(keys)).view(np.uint64)
+        h[missing] = 0
+    return ((h * _HASH_MIX) >> np.uint64(32)) % np.uint64(n_parts)
+
+def _source_chunks(src, cols: list, rows: int = None):
+    """(first chunk, iterator over all chunks) of `cols` from a DataFrame or
+    a file path (streamed by iter_file_chunks). With no rows at all the
+    first chunk is an empty frame with the right columns."""
+    rows = rows or CHUNK_ROWS
+    if isinstance(src, pd.DataFrame):
+        chunks = (src.iloc[start:start + rows][cols]
+                  for start in range(0, len(src), rows))
+        empty  = src.iloc[:0][cols]
+    else:
+        chunks = iter_file_chunks(src, cols, rows)
+        empty  = pd.DataFrame(columns=cols)
+    first = next(chunks, None)
+    if first is None:
+        return empty, iter(())
+    return first, itertools.chain([first], chunks)
+
+def _spill_schema(src, first: pd.DataFrame, cols: list):
+    """Arrow schema for one side's spills. A file's chunks share the first
+    chunk's types; an in-memory frame is typed whole, so an object column
+    that is empty in its first chunk is not pinned to Arrow's null type."""
+    import pyarrow as pa
+    frame = src[cols] if isinstance(src, pd.DataFrame) else first
+    return pa.Schema.from_pandas(frame, preserve_index=False)
+
+def _spill_partitions(chunks, key_col: str, n_parts: int, numeric: bool,
+                      paths: list, schema):
+    """Hash-partition a stream of chunks on the key into one Arrow IPC file
+    per partition, a record batch per chunk that has rows in it."""
+    import pyarrow as pa
+    writers = [pa.ipc.new_file(p, schema) for p in paths]
+    try:
+        for chunk in chunks:
+            part  = _key_partition(chunk[key_col], n_parts, numeric).astype(np.int64)
+            order = np.argsort(part, kind="stable")
+            bounds = np.searchsorted(part[order], np.arange(n_parts + 1))
+            table = pa.Table.from_pandas(chunk, schema=schema,
+                                         preserve_index=False).take(order)
+            for p in range(n_parts):
+                lo, hi = bounds[p], bounds[p + 1]
+                if lo < hi:
+                    writers[p].write_table(table.slice(lo, hi - lo))
+    finally:
+        for w in writers:
+            w.close()
+
+def _load_partition(path: str, empty: pd.DataFrame, convert) -> pd.DataFrame:
+    import pyarrow as pa
+    table = pa.ipc.open_file(path).read_all()
+    if table.num_rows == 0:
+        return empty
+    return convert(table)
+
+def compare_columns_chunked(df_a, df_b, key_col: str, compare_cols: list,
+                            n_parts: int = CHUNK_PARTITIONS,
+                            workers: int = CHUNK_WORKERS,
+                            spill_dir: str = None) -> dict:
+    """Out-of-core compare_columns. df_a / df_b are DataFrames or file
+    paths; paths are read CHUNK_ROWS at a time (iter_file_chunks), so
+    neither input has to fit in memory. Both sides are hash-partitioned on
+    the key into on-disk Arrow IPC spills and the partition pairs are
+    merged and compared independently, so peak memory is a few partitions
+    rather than the full outer merge. Only counters, exclusive keys and a
+    bounded diff sample are kept; "merged" is None in the result. Raises
+    pyarrow.ArrowException for a column Arrow cannot type (an object
+    column mixing, say, numbers and strings)."""
+    cols = [key_col] + compare_cols
+    first_a, chunks_a = _source_chunks(df_a, cols)
+    first_b, chunks_b = _source_chunks(df_b, cols)
+    # A file's chunks share one schema, so the first decides the hashing
+    numeric = (pd.api.types.is_numeric_dtype(first_a[key_col]) and
+               pd.api.types.is_numeric_dtype(first_b[key_col]))
+    empty_a = first_a.iloc[:0]
+    empty_b = first_b.iloc[:0]
+    schema_a = _spill_schema(df_a, first_a, cols)
+    schema_b = _spill_schema(df_b, first_b, cols)
+    convert_a = _frame_converter(df_a)
+    convert_b = _frame_converter(df_b)
+
+    with tempfile.TemporaryDirectory(prefix="dqcmp_", dir=spill_dir) as tmp:
+        paths_a = [os.path.join(tmp, f"a_{p:04d}.arrow") for p in range(n_parts)]
+        paths_b = [os.path.join(tmp, f"b_{p:04d}.arrow") for p in range(n_parts)]
+        _spill_partitions(chunks_a, key_col, n_parts, numeric, paths_a, schema_a)
+        _spill_partitions(chunks_b, key_col, n_parts, numeric, paths_b, schema_b)
+        del first_a, first_b
+
+        def compare_part(p):
+            part_a = _load_partition(paths_a[p], empty_a, convert_a)
+            part_b = _load_partition(paths_b[p], empty_b, convert_b)
+            block, _ = _compare_block(part_a, part_b, key_col, compare_cols)
+            return block
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            blocks = list(pool.map(compare_part, range(n_parts)))
+
+    results = _fold_blocks(blocks, key_col, compare_cols)
+    results["merged"] = None
+    return results
+
+class _KeySpool:
+    """Append-only on-disk list of exclusive keys.
+
+    Written window by window by the sort-merge engine as record batches of
+    an Arrow IPC file and read back lazily, so the only-in-A / only-in-B key
+    lists never sit in memory. Supports the list operations the UI and
+    exports use: len(), slicing, iteration and tolist(); spool[i] reads only
+    the batch holding key i. The first read closes the file for writing.
+    The backing file is removed with the spool."""
+    def __init__(self, spill_dir: str = None):
+        fd, self.path = tempfile.mkstemp(prefix="dqkeys_", suffix=".arrow",
+                                         dir=spill_dir)
+        os.close(fd)
+        self._writer = None
+        self._type   = None
+        self._ends   = []               # running key count after each batch
+
+    def extend(self, keys: pd.Series):
+        import pyarrow as pa
+        if not len(keys):
+            return
+        arr = pa.Array.from_pandas(keys, type=self._type)
+        if self._writer is None:
+            if self._ends:
+                raise ValueError("key spool is closed for writing")
+            self._type   = arr.type
+            self._writer = pa.ipc.new_file(
+                self.path, pa.schema([("key", self._type)]))
+        self._writer.write_batch(pa.record_batch([arr], names=["key"]))
+        self._ends.append(len(self) + len(arr))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def _iter_from(self, start: int):
+        """Keys from index `start` on, skipping the batches before it."""
+        import pyarrow as pa
+        if start >= len(self):
+            return
+        self.close()
+        reader = pa.ipc.open_file(self.path)
+        first  = bisect.bisect_right(self._ends, start)
+        skip   = start - (self._ends[first - 1] if first else 0)
+        for i in range(first, reader.num_record_batches):
+            keys = reader.get_batch(i).column(0).to_pandas().tolist()
+            yield from keys[skip:] if skip else keys
+            skip = 0
+
+    def __iter__(self):
+        return self._iter_from(0)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step < 0:
+                return self.tolist()[idx]
+            return list(itertools.islice(self._iter_from(start),
+                                         0, max(0, stop - start), step))
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("key spool index out of range")
+        return next(self._iter_from(idx))
+
+    def tolist(self) -> list:
+        return list(self)
+
+    def __del__(self):
+        try:
+            self.close()
+            os.remove(self.path)
+        except (OSError, AttributeError):
+            pass
+
+def _keys_sorted(keys: pd.Series) -> bool:
+    return keys.is_monotonic_increasing
+
+class _SortedSide:
+    """One input of the sort-merge walk: rows pulled chunk by chunk from a
+    DataFrame or file (_source_chunks) into a buffer, with the key order
+    checked across chunk boundaries as they arrive."""
+    def __init__(self, src, cols: list, key_col: str, rows: int):
+        first, self._chunks = _source_chunks(src, cols, rows)
+        self.key_col = key_col
+        self.frame = first.iloc[:0]
+        self.keys  = self.frame[key_col].to_numpy()
+        self.done  = False
+        self._last = None
+
+    def pull(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.done = True
+            return
+        k = chunk[self.key_col].to_numpy()
+        if len(k):
+            try:
+                ordered = (not pd.isna(k).any() and bool((k[1:] >= k[:-1]).all())
+                           and (self._last is None or k[0] >= self._last))
+            except TypeError:
+                ordered = False             # mixed, unorderable key types
+            if not ordered:
+                raise ValueError(f"Key column '{self.key_col}' is not sorted "
+                                 f"ascending in both files.")
+            self._last = k[-1]
+        if len(self.keys):
+            self.frame = pd.concat([self.frame, chunk])
+            self.keys  = np.concatenate([self.keys, k])
+        else:
+            self.frame, self.keys = chunk, k
+
+    def fill(self, rows: int):
+        while not self.done and len(self.keys) < rows:
+            self.pull()
+
+    def take(self, n: int):
+        part, keys = self.frame.iloc[:n], self.keys[:n]
+        self.frame, self.keys = self.frame.iloc[n:], self.keys[n:]
+        return part, keys
+
+def _sorted_window(ka: np.ndarray, kb: np.ndarray, part_a: pd.DataFrame,
+                   part_b: pd.DataFrame, key_col: str, compare_cols: list,
+                   sample: int) -> dict:
+    """Join one key-aligned window of two sorted inputs by a merge walk
+    (searchsorted) and reduce it to a block like _compare_block's."""
+    if len(ka) > 1 and (ka[1:] == ka[:-1]).any() or \
+       len(kb) > 1 and (kb[1:] == kb[:-1]).any():
+        # Duplicate keys need the many-to-many product; the window is small
+        block, _ = _compare_block(part_a, part_b, key_col, compare_cols, sample)
+        return block
+
+    pos = np.searchsorted(kb, ka)
+    hit = np.zeros(len(ka), dtype=bool)
+    if len(kb):
+        hit = kb[np.minimum(pos, len(kb) - 1)] == ka
+    ai = np.flatnonzero(hit)
+    bi = pos[ai]
+    in_b = np.zeros(len(kb), dtype=bool)
+    in_b[bi] = True
+
+    left  = part_a.iloc[ai].reset_index(drop=True)
+    right = part_b.iloc[bi].reset_index(drop=True)
+    matched = pd.concat([left[[key_col]],
+                         left[compare_cols].add_suffix("__A"),
+                         right[compare_cols].add_suffix("__B")], axis=1)
+    return {
+        "keys_a": len(ka),
+        "keys_b": len(kb),
+        "only_a": part_a[key_col].iloc[np.flatnonzero(~hit)],
+        "only_b": part_b[key_col].iloc[np.flatnonzero(~in_b)],
+        "both":   len(ai),
+        "cols":   _diff_kernel(matched, key_col, compare_cols, sample)
+                  if compare_cols else {},
+    }
+
+def compare_columns_sorted(df_a, df_b, key_col: str, compare_cols: list,
+                           window: int = CHUNK_ROWS,
+                           spill_dir: str = None,
+                           sample: int = DIFF_SAMPLE_ROWS) -> dict:
+    """Sort-merge compare_columns for inputs already sorted by the key.
+
+    df_a / df_b are DataFrames or file paths; paths are read `window` rows
+    at a time (iter_file_chunks). Both sides are walked together in
+    key-aligned windows: a window ends just before the smaller of the two
+    buffered last keys, and a side whose buffer holds only that key pulls
+    more chunks, so no key straddles two windows and each window is joined
+    on its own. Memory stays at about a window and a chunk per side (more
+    only for a key repeated past a whole chunk) plus the diff samples; the
+    exclusive keys stream to _KeySpool files and come back as plain lists
+    when they are at most KEY_LIST_MAX long. Raises ValueError as soon as
+    a key column turns out not to be sorted (missing keys count as
+    unsorted)."""
+    cols = [key_col] + compare_cols
+    sides = (_SortedSide(df_a, cols, key_col, window),
+             _SortedSide(df_b, cols, key_col, window))
+    side_a, side_b = sides
+
+    only_a = _KeySpool(spill_dir)
+    only_b = _KeySpool(spill_dir)
+    totals = {"keys_a": 0, "keys_b": 0, "both": 0}
+    col_acc = {c: {"match": 0, "diff": 0, "null_a": 0, "null_b": 0, "rows": []}
+               for c in compare_cols}
+
+    try:
+        while True:
+            for side in sides:
+                side.fill(window)
+            open_sides = [s for s in sides if not s.done]
+            if open_sides:
+                bound = min(s.keys[-1] for s in open_sides)
+                ja = int(np.searchsorted(side_a.keys, bound, side="left"))
+                jb = int(np.searchsorted(side_b.keys, bound, side="left"))
+                if ja == 0 and jb == 0:
+                    # Every buffered row carries the bound key: read on
+                    for s in open_sides:
+                        if s.keys[-1] == bound:
+                            s.pull()
+                    continue
+            else:
+                ja, jb = len(side_a.keys), len(side_b.keys)
+                if ja == 0 and jb == 0:
+                    break
+
+            part_a, ka = side_a.take(ja)
+            part_b, kb = side_b.take(jb)
+            block = _sorted_window(ka, kb, part_a, part_b,
+                                   key_col, compare_cols, sample)
+            for k in totals:
+                totals[k] += block[k]
+            only_a.extend(block["only_a"])
+            only_b.extend(block["only_b"])
+            for col, d in block["cols"].items():
+                acc = col_acc[col]
+                for f in ("match", "diff", "null_a", "null_b"):
+                    acc[f] += d[f]
+                kept = sum(len(r) for r in acc["rows"])
+                if kept < sample and len(d["rows"]):
+                    acc["rows"].append(d["rows"].head(sample - kept))
+    finally:
+        only_a.close()
+        only_b.close()
+
+    both = totals["both"]
+    col_diffs = {}
+    for col, acc in col_acc.items():
+        rows = (pd.concat(acc["rows"], ignore_index=True) if acc["rows"]
+                else pd.DataFrame(columns=[key_col, "value_a", "value_b"]))
         col_diffs[col] = {
-            "match_count":  int(same_mask.sum()),
-            "diff_count":   int((~same_mask).sum()),
-            "match_pct":    round(same_mask.sum() / len(matched_rows) * 100, 2) if len(matched_rows) > 0 else 0,
-            "diff_pct":     round((~same_mask).sum() / len(matched_rows) * 100, 2) if len(matched_rows) > 0 else 0,
-            "diff_rows":    diff_rows.head(500).to_dict("records"),
-            "null_only_a":  int(a_vals.isna().sum()),
-            "null_only_b":  int(b_vals.isna().sum()),
+            "match_count":  acc["match"],
+            "diff_count":   acc["diff"],
+            "match_pct":    round(acc["match"] / both * 100, 2) if both > 0 else 0,
+            "diff_pct":     round(acc["diff"] / both * 100, 2) if both > 0 else 0,
+            "diff_rows":    rows.to_dict("records"),
+            "null_only_a":  acc["null_a"],
+            "null_only_b":  acc["null_b"],
         }
+    return {
+        "total_keys_a":   totals["keys_a"],
+        "total_keys_b":   totals["keys_b"],
+        "keys_only_in_a": only_a.tolist() if len(only_a) <= KEY_LIST_MAX else only_a,
+        "keys_only_in_b": only_b.tolist() if len(only_b) <= KEY_LIST_MAX else only_b,
+        "keys_in_both":   both,
+        "total_matched":  both,
+        "column_diffs":   col_diffs,
+        "merged":         None,
+    }
 
-    results["column_diffs"] = col_diffs
+def compare_columns(df_a: pd.DataFrame, df_b: pd.DataFrame,
+                    key_col: str, compare_cols: list,
+                    chunked: bool = None, sorted_keys: bool = None) -> dict:
+    """Compare two frames on key_col.
+
+    The result's "keys_only_in_a" / "keys_only_in_b" are lists, except
+    from the sort-merge engine past KEY_LIST_MAX keys: there they are
+    _KeySpool objects backed by a temp file. A spool supports len(),
+    truth testing, slicing, iteration and tolist(), but it is not a list,
+    and spool[i] reads a record batch from the file each time; call
+    tolist() for repeated random access. "merged" is None from both
+    out-of-core engines."""
+    # Large inputs go through an out-of-core engine unless told otherwise:
+    # sort-merge when both key columns are already sorted, else partitioned
+    large = len(df_a) + len(df_b) >= CHUNKED_MIN_ROWS
+    if sorted_keys is None and chunked is not False and large:
+        sorted_keys = _keys_sorted(df_a[key_col]) and _keys_sorted(df_b[key_col])
+    if sorted_keys:
+        return compare_columns_sorted(df_a, df_b, key_col, compare_cols)
+    if chunked is None:
+        chunked = large
+    if chunked:
+        import pyarrow as pa
+        try:
+            return compare_columns_chunked(df_a, df_b, key_col, compare_cols)
+        except pa.ArrowException:
+            pass                        # untypeable object column: merge in memory
+
+    # Merge on key
+    block, merged = _compare_block(
+        df_a[[key_col] + compare_cols].copy(),
+        df_b[[key_col] + compare_cols].copy(),
+        key_col, compare_cols)
+    results = _fold_blocks([block], key_col, compare_cols)
     results["merged"] = merged
     return results
 
-def compute_dq_summary(df: pd.DataFrame) -> dict:
+def large_pair(path_a: str, path_b: str) -> bool:
+    """Whether two files should be compared straight from disk: both
+    streamable, and CHUNKED_MIN_ROWS rows between them (or, when a row
+    count is unknown without a full read, CHUNKED_MIN_BYTES on disk)."""
+    if not (_streamable(path_a) and _streamable(path_b)):
+        return False
+    rows = [sniff_file(p)["rows"] for p in (path_a, path_b)]
+    if None not in rows:
+        return sum(rows) >= CHUNKED_MIN_ROWS
+    return os.path.getsize(path_a) + os.path.getsize(path_b) >= CHUNKED_MIN_BYTES
+
+def _maybe_sorted(path: str, key_col: str) -> bool:
+    """Cheap look at whether a file's key column is sorted ascending, so an
+    unsorted pair skips the sort-merge pass. False when the first
+    SORT_PROBE_ROWS keys, the Parquet row-group statistics or Feather batch
+    boundaries, or the tail (last row group / batch, or last
+    SORT_PROBE_BYTES of a CSV) show keys out of order or missing; True
+    otherwise (compare_columns_sorted still checks every key as it
+    reads)."""
+    import pyarrow as pa
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        chunks = iter_file_chunks(path, [key_col], SORT_PROBE_ROWS)
+        head = next(chunks, None)
+        chunks.close()
+        if head is None:
+            return True
+        head = head[key_col]
+        if not _keys_sorted(head):
+            return False
+        bounds = []                     # (first, last) key of each block
+        if ext == ".parquet":
+            import pyarrow.parquet as pq
+            meta = pq.read_metadata(path)
+            col  = meta.schema.names.index(key_col)
+            for i in range(meta.num_row_groups):
+                st = meta.row_group(i).column(col).statistics
+                if st is None or not st.has_min_max:
+                    continue
+                if st.has_null_count and st.null_count:
+                    return False
+                bounds.append((st.min, st.max))
+            if meta.num_row_groups > 1:
+                tail = pq.ParquetFile(path).read_row_group(
+                    meta.num_row_groups - 1, columns=[key_col])
+                if not _keys_sorted(tail.column(key_col).to_pandas()):
+                    return False
+        elif ext in _ARROW_EXTS:
+            with pa.memory_map(path) as src:
+                reader = pa.ipc.open_file(src)
+                for i in range(reader.num_record_batches):
+                    keys = reader.get_batch(i).column(key_col)
+                    if keys.null_count:
+                        return False
+                    if len(keys):
+                        bounds.append((keys[0].as_py(), keys[-1].as_py()))
+                if reader.num_record_batches > 1 and \
+                        not _keys_sorted(keys.to_pandas()):
+                    return False
+        elif os.path.getsize(path) > SORT_PROBE_BYTES:
+            import pyarrow.csv as pacsv
+            with open(path, "rb") as fh:
+                header = fh.readline()
+                fh.seek(-SORT_PROBE_BYTES, os.SEEK_END)
+                tail = fh.read()
+            tail = tail[tail.find(b"\n") + 1:]     # drop the partial first line
+            keys = _csv_frame(pacsv.read_csv(
+                pa.BufferReader(header + tail), **_csv_arrow_options(
+                    _csv_sep(ext), [key_col],
+                    sniff_file(path)["text_cols"])))[key_col]
+            if len(keys):
+                if not _keys_sorted(keys):
+                    return False
+                bounds = [(head.iloc[0], head.iloc[-1]),
+                          (keys.iloc[0], keys.iloc[-1])]
+        last = None
+        for first, end in bounds:
+            if first > end or (last is not None and first < last):
+                return False
+            last = end
+    except (pa.ArrowException, TypeError, ValueError):
+        pass                            # no cheap answer: let the engine check
+    return True
+
+def compare_files(path_a: str, path_b: str, key_col: str,
+                  compare_cols: list, sorted_keys: bool = None) -> dict:
+    """compare_columns for two files. A large_pair is compared by an
+    out-of-core engine reading both files chunk by chunk: the sort-merge
+    engine when both key columns look sorted (_maybe_sorted, or when the
+    caller says so with sorted_keys=True), else the hash-partitioned one.
+    Keys found out of order past the probe end the sort-merge pass there,
+    and the pair is partitioned instead; sorted_keys=False goes straight to
+    partitioning. Anything else (or a CSV whose types drift past pyarrow's
+    first block) is loaded through load_file and compared in memory."""
+    cols = [key_col] + compare_cols
+    if large_pair(path_a, path_b):
+        import pyarrow as pa
+        if sorted_keys is None:
+            sorted_keys = (_maybe_sorted(path_a, key_col) and
+                           _maybe_sorted(path_b, key_col))
+        try:
+            if sorted_keys:
+                try:
+                    return compare_columns_sorted(path_a, path_b, key_col,
+                                                  compare_cols)
+                except pa.ArrowException:
+                    raise
+                except ValueError:
+                    pass                # out of order past the probe: partition
+            return compare_columns_chunked(path_a, path_b, key_col, compare_cols)
+        except pa.ArrowException:
+            pass
+    return compare_columns(load_file(path_a, cols), load_file(path_b, cols),
+                           key_col, compare_cols)
+
+def compute_dq_summary(df: pd.DataFrame, approx: bool = None) -> dict:
+    # Past PROFILE_EXACT_ROWS rows the sketch profiler takes over
+    if approx is None:
+        approx = len(df) > PROFILE_EXACT_ROWS
+    if approx:
+        return profile_frame(df)
     total_cells = df.shape[0] * df.shape[1]
     null_cells   = df.isna().sum().sum()
     dup_rows     = df.duplicated().sum()
@@ -171,6 +1044,279 @@ def compute_dq_summary(df: pd.DataFrame) -> dict:
         "col_stats":  {c: compute_column_stats(df, c) for c in df.columns},
     }
 
+# ---- streaming profiler ----
+# compute_dq_summary stays exact up to PROFILE_EXACT_ROWS rows. Beyond that
+# profile_frame makes one chunked pass: counts, nulls and min/max/mean/std
+# stay exact; duplicate rows are counted on a 64-bit hash folded from the
+# column hashes, so a collision (odds about rows^2 / 2^65) could add one.
+# Distinct counts (HyperLogLog), median (t-digest) and top values
+# (space-saving) come from sketches and are listed in each column's
+# "approx" set; while no value has been evicted from the space-saving table
+# (under PROFILE_TOPK_CAPACITY distinct values) all three are exact.
+PROFILE_EXACT_ROWS    = 1_000_000
+PROFILE_CHUNK_ROWS    = 250_000
+PROFILE_HLL_BITS      = 14          # 16384 registers, ~0.8% standard error
+PROFILE_TDIGEST_DELTA = 500
+PROFILE_TOPK_CAPACITY = 1_000
+
+class _HyperLogLog:
+    def __init__(self, bits: int = PROFILE_HLL_BITS):
+        self.bits = bits
+        self.regs = np.zeros(1 << bits, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray):
+        tail_bits = 64 - self.bits
+        idx  = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # rank = leading zeros in the tail + 1; frexp's exponent is the bit length
+        _, blen = np.frexp(tail.astype(np.float64))
+        rank = (tail_bits - blen + 1).astype(np.uint8)
+        np.maximum.at(self.regs, idx, rank)
+
+    def estimate(self) -> int:
+        m = len(self.regs)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        est = alpha * m * m / np.sum(np.ldexp(1.0, -self.regs.astype(np.int64)))
+        zeros = int((self.regs == 0).sum())
+        if est <= 2.5 * m and zeros:
+            est = m * math.log(m / zeros)      # linear counting for small sets
+        return int(round(est))
+
+class _TDigest:
+    """Merging t-digest. Each update re-buckets the old centroids together
+    with the new points along the arcsine scale function, so a centroid
+    never spans more than one unit of k; that keeps the tails fine-grained
+    and the whole merge vectorised. Centroids also keep their min and max,
+    so one holding a single repeated value is known to be exact."""
+    def __init__(self, delta: int = PROFILE_TDIGEST_DELTA):
+        self.delta   = delta
+        self.means   = np.empty(0)
+        self.weights = np.empty(0)
+        self.mins    = np.empty(0)
+        self.maxs    = np.empty(0)
+
+    def update(self, values: np.ndarray):
+        if not len(values):
+            return
+        # Sort the chunk, then slot the (few) old centroids into it
+        values  = np.sort(values)
+        at      = np.searchsorted(values, self.means)
+        means   = np.insert(values, at, self.means)
+        weights = np.insert(np.ones(len(values)), at, self.weights)
+        mins    = np.insert(values, at, self.mins)
+        maxs    = np.insert(values, at, self.maxs)
+        cum = np.cumsum(weights)
+        q   = (cum - weights / 2) / cum[-1]
+        k   = np.floor(self.delta / (2 * np.pi) * np.arcsin(2 * q - 1))
+        starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means   = np.add.reduceat(means * weights, starts) / self.weights
+        self.mins    = np.minimum.reduceat(mins, starts)
+        self.maxs    = np.maximum.reduceat(maxs, starts)
+
+    def quantile(self, q: float, lo: float, hi: float) -> float:
+        cum = np.cumsum(self.weights)
+        # The q-quantile as pandas takes it: between the values at ranks
+        # floor(pos) and ceil(pos). Where both fall in single-valued
+        # centroids (discrete data) those values are exact.
+        pos = q * (cum[-1] - 1)
+        at = np.minimum(np.searchsorted(cum, [math.floor(pos) + 1,
+                                              math.ceil(pos) + 1]), len(cum) - 1)
+        if (self.mins[at] == self.maxs[at]).all():
+            a, b = self.means[at]
+            return float(a + (b - a) * (pos - math.floor(pos)))
+        mid = (cum - self.weights / 2) / cum[-1]
+        return float(np.interp(q, np.r_[0.0, mid, 1.0], np.r_[lo, self.means, hi]))
+
+class _SpaceSaving:
+    """Mergeable space-saving counter over value hashes: exact per-chunk
+    counts are folded into at most `capacity` monitored values, each
+    remembering its first row (for value_counts-style tie order) and the
+    value itself. A value starts monitored at the current `floor` (the largest
+    count evicted so far), which it keeps as its `err`: its true count lies
+    in [count - err, count]. While floor is 0 nothing was evicted and the
+    counts are exact."""
+    def __init__(self, capacity: int = PROFILE_TOPK_CAPACITY):
+        self.capacity = capacity
+        self.keys   = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.first  = np.empty(0, dtype=np.int64)
+        self.err    = np.empty(0, dtype=np.int64)
+        self.values = {}
+        self.floor  = 0
+
+    def update(self, hashes: np.ndarray, values: pd.Series, offset: int):
+        # Exact chunk counts; factorize keeps first-seen order, so a value's
+        # first row is where its code first exceeds every earlier code
+        codes, c_keys = pd.factorize(hashes)
+        c_counts = np.bincount(codes, minlength=len(c_keys)) + self.floor
+        c_pos = np.flatnonzero(np.r_[True, codes[1:] > np.maximum.accumulate(codes)[:-1]])
+        c_first = c_pos + offset
+        c_err   = np.full(len(c_keys), self.floor, dtype=np.int64)
+
+        # Monitored values seen again add their count (minus the floor
+        # charged to new values); the rest carry over unchanged
+        hit   = pd.Index(c_keys).get_indexer(self.keys)
+        found = hit >= 0
+        c_counts[hit[found]] += self.counts[found] - self.floor
+        c_first[hit[found]]   = self.first[found]
+        c_err[hit[found]]     = self.err[found]
+        keys   = np.concatenate([c_keys, self.keys[~found]])
+        counts = np.concatenate([c_counts, self.counts[~found]])
+        first  = np.concatenate([c_first, self.first[~found]])
+        err    = np.concatenate([c_err, self.err[~found]])
+
+        if len(keys) > self.capacity:
+            part = np.argpartition(-counts, self.capacity)
+            self.floor = max(self.floor, int(counts[part[self.capacity:]].max()))
+            keep = part[:self.capacity]
+            keys, counts, first, err = keys[keep], counts[keep], first[keep], err[keep]
+        self.keys, self.counts, self.first, self.err = keys, counts, first, err
+
+        # Remember newly monitored values from this chunk; forget evicted ones
+        kept = {k: self.values[k] for k in keys.tolist() if k in self.values}
+        new = [k for k in keys.tolist() if k not in kept]
+        if new:
+            at = pd.Index(c_keys).get_indexer(np.array(new, dtype=np.uint64))
+            kept.update(zip(new, values.iloc[c_pos[at]].tolist()))
+        self.values = kept
+
+    def top(self, n: int) -> tuple:
+        """([(label, count)], error) for the n most frequent values. Counts
+        are guaranteed lower bounds (count - err), each at most `error` below
+        the true count; values whose lower bound is 0 are left out, since
+        nothing is known about them beyond the sketch error."""
+        lower = self.counts - self.err
+        order = np.lexsort((self.first, -lower))
+        order = order[lower[order] > 0][:n]
+        error = int(self.err[order].max()) if len(order) else 0
+        return ([(str(self.values[int(k)]), int(c))
+                 for k, c in zip(self.keys[order], lower[order])], error)
+
+    def quantile(self, q: float) -> float:
+        """Exact q-quantile (pandas' linear rule) of a numeric column from
+        the monitored values; only meaningful while floor is 0."""
+        vals = np.array([float(self.values[int(k)]) for k in self.keys])
+        order = np.argsort(vals, kind="stable")
+        vals, cum = vals[order], np.cumsum(self.counts[order])
+        pos = q * (cum[-1] - 1)
+        a, b = vals[np.searchsorted(cum, [math.floor(pos) + 1,
+                                          math.ceil(pos) + 1])]
+        return float(a + (b - a) * (pos - math.floor(pos)))
+
+class _ColumnProfile:
+    def __init__(self, s: pd.Series):
+        self.dtype      = str(s.dtype)
+        self.is_numeric = pd.api.types.is_numeric_dtype(s)
+        self.total = self.nulls = 0
+        self.hll   = _HyperLogLog()
+        self.top   = _SpaceSaving()
+        if self.is_numeric:
+            self.n = 0
+            self.mean = self.m2 = 0.0
+            self.lo, self.hi = math.inf, -math.inf
+            self.digest = _TDigest()
+
+    def update(self, s: pd.Series, hashes: np.ndarray, offset: int):
+        mask = s.notna().to_numpy()
+        non_null = s[mask]
+        self.total += len(s)
+        self.nulls += len(s) - len(non_null)
+        if not len(non_null):
+            return
+        self.hll.update(hashes[mask])
+        self.top.update(hashes[mask], non_null, offset)
+        if self.is_numeric:
+            vals = non_null.to_numpy(dtype="float64")
+            # Chan et al. pairwise update of count / mean / M2
+            n, mean = len(vals), vals.mean()
+            m2 = ((vals - mean) ** 2).sum()
+            delta, tot = mean - self.mean, self.n + n
+            self.mean += delta * n / tot
+            self.m2   += m2 + delta * delta * self.n * n / tot
+            self.n = tot
+            self.lo, self.hi = min(self.lo, vals.min()), max(self.hi, vals.max())
+            self.digest.update(vals)
+
+    def stats(self) -> dict:
+        total, nulls = self.total, self.nulls
+        non_null = total - nulls
+        exact_top = self.top.floor == 0
+        unique = len(self.top.keys) if exact_top else self.hll.estimate()
+        top_values, top_error = self.top.top(5)
+        stats = {
+            "total":        total,
+            "null_count":   nulls,
+            "null_pct":     round(nulls / total * 100, 2) if total > 0 else 0,
+            "non_null":     non_null,
+            "unique":       unique,
+            "unique_pct":   round(unique / non_null * 100, 2) if non_null > 0 else 0,
+            "dtype":        self.dtype,
+            "is_numeric":   self.is_numeric,
+            "top_values":   top_values,
+            "top_values_error": top_error,
+            "approx":       set() if exact_top else {"unique", "unique_pct", "top_values"},
+        }
+        if self.is_numeric and self.n > 0:
+            stats.update({
+                "min":    round(float(self.lo), 4),
+                "max":    round(float(self.hi), 4),
+                "mean":   round(float(self.mean), 4),
+                "median": round(self.top.quantile(0.5) if exact_top else
+                                self.digest.quantile(0.5, self.lo, self.hi), 4),
+                "std":    round(math.sqrt(self.m2 / (self.n - 1)), 4) if self.n > 1 else float("nan"),
+            })
+            if not exact_top:
+                stats["approx"].add("median")
+        return stats
+
+def profile_frame(df: pd.DataFrame, chunk_rows: int = PROFILE_CHUNK_ROWS) -> dict:
+    """compute_dq_summary in one chunked pass over `df` using sketches.
+    Same keys as the exact summary plus "approx": True; fields that are
+    estimates are named in each column's "approx" set."""
+    return profile_chunks((df.iloc[start:start + chunk_rows]
+                           for start in range(0, len(df), chunk_rows)),
+                          df.iloc[:0])
+
+def profile_chunks(chunks, empty: pd.DataFrame = None) -> dict:
+    """profile_frame over a stream of chunks (e.g. iter_file_chunks), so
+    a file can be profiled without being loaded. `empty` gives the columns
+    when the stream turns out to have no rows."""
+    profiles, row_hashes, rows = None, [], 0
+    for chunk in chunks:
+        if profiles is None:
+            profiles = {c: _ColumnProfile(chunk[c]) for c in chunk.columns}
+        # Each column is hashed once: the hashes feed its HyperLogLog and
+        # fold into the row hash used for duplicate detection
+        row_h = np.zeros(len(chunk), dtype=np.uint64)
+        for c in chunk.columns:
+            h = pd.util.hash_pandas_object(chunk[c], index=False).to_numpy()
+            profiles[c].update(chunk[c], h, rows)
+            row_h = row_h * _HASH_MIX + h
+        row_hashes.append(row_h)
+        rows += len(chunk)
+    if profiles is None:
+        empty = pd.DataFrame() if empty is None else empty
+        profiles = {c: _ColumnProfile(empty[c]) for c in empty.columns}
+
+    cols         = len(profiles)
+    total_cells  = rows * cols
+    null_cells   = sum(p.nulls for p in profiles.values())
+    hashes       = np.sort(np.concatenate(row_hashes)) if row_hashes else np.empty(0, np.uint64)
+    dup_rows     = int((hashes[1:] == hashes[:-1]).sum())
+    return {
+        "rows":       rows,
+        "cols":       cols,
+        "total_cells":int(total_cells),
+        "null_cells": int(null_cells),
+        "null_pct":   round(null_cells / total_cells * 100, 2) if total_cells > 0 else 0,
+        "dup_rows":   int(dup_rows),
+        "dup_pct":    round(dup_rows / rows * 100, 2) if rows > 0 else 0,
+        "dtypes":     {c: p.dtype for c, p in profiles.items()},
+        "col_stats":  {c: p.stats() for c, p in profiles.items()},
+        "approx":     True,
+    }
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CUSTOM WIDGETS
 # ─────────────────────────────────────────────────────────────────────────────
@@ -251,7 +1397,7 @@ class FileDropZone(tk.Frame):
                          highlightbackground=THEME["border"], **kwargs)
         self.on_load = on_load
         self.label   = label
-        self.df      = None
+        self.info    = None
         self.path    = None
         self._build()
 
@@ -283,31 +1429,34 @@ class FileDropZone(tk.Frame):
             w.bind("<Button-1>", lambda e: self._pick())
             w.bind("<Enter>",    lambda e: self.configure(highlightbackground=THEME["accent_blue"]))
             w.bind("<Leave>",    lambda e: self.configure(
-                highlightbackground=THEME["accent_green"] if self.df is not None else THEME["border"]))
+                highlightbackground=THEME["accent_green"] if self.info is not None else THEME["border"]))
 
     def _pick(self):
         path = filedialog.askopenfilename(
             title=f"Select {self.label}",
-            filetypes=[("Data files", "*.csv *.xlsx *.xls *.tsv *.json *.parquet"),
+            filetypes=[("Data files", "*.csv *.xlsx *.xls *.tsv *.json *.parquet *.feather *.arrow"),
                        ("All files", "*.*")])
         if not path:
             return
         try:
-            df = load_file(path)
-            self.df   = df
+            # Only the header is read here; columns load on Run
+            info = sniff_file(path)
+            self.info = info
             self.path = path
+            cols  = [str(c) for c in info["columns"]]
+            rows  = f"{info['rows']:,} rows" if info["rows"] is not None else "rows read on run"
             fname = os.path.basename(path)
             self.file_lbl.config(text=fname, fg=THEME["text_primary"])
             self.icon_lbl.config(text="✓", fg=THEME["accent_green"])
             self.sub_lbl.config(
-                text=f"{df.shape[0]:,} rows  ×  {df.shape[1]} columns",
+                text=f"{rows}  ×  {len(cols)} columns",
                 fg=THEME["accent_yellow"])
             size_kb = os.path.getsize(path) / 1024
             self.meta_lbl.config(
-                text=f"Size: {size_kb:.1f} KB  ·  Columns: {', '.join(df.columns[:4])}{'…' if len(df.columns) > 4 else ''}",
+                text=f"Size: {size_kb:.1f} KB  ·  Columns: {', '.join(cols[:4])}{'…' if len(cols) > 4 else ''}",
                 fg=THEME["text_secondary"])
             self.configure(highlightbackground=THEME["accent_green"])
-            self.on_load(df, path)
+            self.on_load(info, path)
         except Exception as ex:
             messagebox.showerror("Load Error", str(ex))
 
@@ -389,6 +1538,8 @@ class DQComparatorApp(tk.Tk):
         self.geometry("1440x920")
         self.minsize(1100, 700)
 
+        self.info_a  = None
+        self.info_b  = None
         self.df_a    = None
         self.df_b    = None
         self.path_a  = None
@@ -636,10 +1787,11 @@ class DQComparatorApp(tk.Tk):
             tk.Frame(card, bg=THEME["border"], height=1).pack(fill="x")
             items = [
                 ("Rows",          f"{summary['rows']:,}"),
-                ("Columns",       f"{summary['cols']}"),
-                ("Total Cells",   f"{summary['total_cells']:,}"),
-                ("Null Cells",    f"{summary['null_cells']:,}  ({summary['null_pct']}%)"),
-                ("Duplicate Rows",f"{summary['dup_rows']:,}  ({summary['dup_pct']}%)"),
+                ("Columns",       f"{summary['cols']} selected of {summary['file_cols']}"),
+                ("Selected Cells",f"{summary['total_cells']:,}"),
+                ("Nulls in Selected", f"{summary['null_cells']:,}  ({summary['null_pct']}%)"),
+                ("Dups in Selected",  f"{summary['dup_rows']:,}  ({summary['dup_pct']}%)"),
+                ("Profile",       "≈ streaming sketches" if summary.get("approx") else "exact"),
             ]
             for k, v in items:
                 r = tk.Frame(card, bg=THEME["bg_card"])
@@ -826,11 +1978,16 @@ class DQComparatorApp(tk.Tk):
                      padx=12, pady=8).pack(anchor="w")
             tk.Frame(card, bg=THEME["border"], height=1).pack(fill="x")
 
+            # Sketch estimates from the streaming profiler are marked ≈
+            approx = s.get("approx", set())
+            def mark(field, text):
+                return f"≈ {text}" if field in approx else text
+
             base_stats = [
                 ("Total Rows",   f"{s['total']:,}"),
                 ("Null Count",   f"{s['null_count']:,}  ({s['null_pct']}%)"),
                 ("Non-Null",     f"{s['non_null']:,}"),
-                ("Unique Values",f"{s['unique']:,}  ({s['unique_pct']}%)"),
+                ("Unique Values",mark("unique", f"{s['unique']:,}  ({s['unique_pct']}%)")),
                 ("Data Type",    s["dtype"]),
             ]
             if s.get("is_numeric"):
@@ -838,7 +1995,7 @@ class DQComparatorApp(tk.Tk):
                     ("Min",    str(s.get("min", ""))),
                     ("Max",    str(s.get("max", ""))),
                     ("Mean",   str(s.get("mean", ""))),
-                    ("Median", str(s.get("median", ""))),
+                    ("Median", mark("median", str(s.get("median", "")))),
                     ("Std Dev",str(s.get("std", ""))),
                 ]
             for k, v in base_stats:
@@ -851,10 +2008,19 @@ class DQComparatorApp(tk.Tk):
                          bg=THEME["bg_card"], fg=THEME["text_primary"],
                          anchor="w").pack(side="left")
 
-            # Top values
-            tk.Label(card, text="TOP VALUES", font=FONTS["badge"],
+            # Top values; sketched counts are lower bounds, up to
+            # top_values_error below the true count
+            top_approx = "top_values" in approx
+            heading = "TOP VALUES"
+            if top_approx:
+                heading = f"≈ TOP VALUES  (≥ counts, up to +{s.get('top_values_error', 0):,})"
+            tk.Label(card, text=heading, font=FONTS["badge"],
                      bg=THEME["bg_card"], fg=THEME["text_muted"],
                      padx=12, pady=6).pack(anchor="w")
+            if top_approx and not s.get("top_values"):
+                tk.Label(card, text="No value stands out past the sketch error.",
+                         font=FONTS["body_sm"], bg=THEME["bg_card"],
+                         fg=THEME["text_muted"], padx=12).pack(anchor="w")
             for val, cnt in s.get("top_values", []):
                 r2 = tk.Frame(card, bg=THEME["bg_hover"])
                 r2.pack(fill="x", padx=12, pady=1)
@@ -866,7 +2032,8 @@ class DQComparatorApp(tk.Tk):
                          width=24, anchor="w", padx=4, pady=3).pack(side="left")
                 bar = tk.Frame(r2, bg=THEME["accent_blue"], height=6, width=bar_w)
                 bar.pack(side="left", padx=4)
-                tk.Label(r2, text=f"{pct:.1f}%  ({cnt:,})",
+                tk.Label(r2, text=(f"≥ {pct:.1f}%  (≥ {cnt:,})" if top_approx
+                                   else f"{pct:.1f}%  ({cnt:,})"),
                          font=FONTS["mono_sm"],
                          bg=THEME["bg_hover"], fg=THEME["text_secondary"]).pack(side="left")
 
@@ -891,20 +2058,20 @@ class DQComparatorApp(tk.Tk):
         self.log_txt.freeze()
 
     # ── Event Handlers ───────────────────────────────────────────────────────
-    def _on_load_a(self, df, path):
-        self.df_a   = df
+    def _on_load_a(self, info, path):
+        self.info_a = info
         self.path_a = path
         self._refresh_controls()
 
-    def _on_load_b(self, df, path):
-        self.df_b   = df
+    def _on_load_b(self, info, path):
+        self.info_b = info
         self.path_b = path
         self._refresh_controls()
 
     def _refresh_controls(self):
-        if self.df_a is None or self.df_b is None:
+        if self.info_a is None or self.info_b is None:
             return
-        common = [c for c in self.df_a.columns if c in self.df_b.columns]
+        common = [c for c in self.info_a["columns"] if c in self.info_b["columns"]]
         self.key_combo["values"] = common
         if common:
             self.key_var.set(common[0])
@@ -912,7 +2079,7 @@ class DQComparatorApp(tk.Tk):
         self._set_status(f"Files loaded  ·  {len(common)} common column(s)")
 
     def _run_comparison(self):
-        if self.df_a is None or self.df_b is None:
+        if self.info_a is None or self.info_b is None:
             messagebox.showwarning("Missing Files", "Please load both files first.")
             return
         key = self.key_var.get()
@@ -929,9 +2096,27 @@ class DQComparatorApp(tk.Tk):
 
         def worker():
             try:
-                summary_a = compute_dq_summary(self.df_a)
-                summary_b = compute_dq_summary(self.df_b)
-                res = compare_columns(self.df_a, self.df_b, key, compare_cols)
+                cols = [key] + compare_cols
+                if large_pair(self.path_a, self.path_b):
+                    # Too big to hold: profile and compare straight from disk
+                    self.after(0, lambda: self._set_status("Streaming large files…"))
+                    self.df_a = self.df_b = None
+                    summary_a = profile_chunks(iter_file_chunks(self.path_a, cols))
+                    summary_b = profile_chunks(iter_file_chunks(self.path_b, cols))
+                    res = compare_files(self.path_a, self.path_b, key, compare_cols)
+                else:
+                    # Only the key and compared columns are read (and cached)
+                    self.after(0, lambda: self._set_status("Loading selected columns…"))
+                    self.df_a = load_file(self.path_a, cols)
+                    self.df_b = load_file(self.path_b, cols)
+                    self.after(0, lambda: self._set_status("Running comparison…"))
+                    summary_a = compute_dq_summary(self.df_a)
+                    summary_b = compute_dq_summary(self.df_b)
+                    res = compare_columns(self.df_a, self.df_b, key, compare_cols)
+                # The profiles cover only `cols`; the cards say so and show
+                # the file's full width alongside
+                summary_a["file_cols"] = len(self.info_a["columns"])
+                summary_b["file_cols"] = len(self.info_b["columns"])
                 self.after(0, lambda: self._render_results(res, summary_a, summary_b))
             except Exception as ex:
                 self.after(0, lambda: messagebox.showerror("Error", str(ex)))
@@ -1010,9 +2195,9 @@ class DQComparatorApp(tk.Tk):
         for tag, s in [("A", sa), ("B", sb)]:
             line(f"  File {tag}:", "subheading")
             line(f"    Rows:          {s['rows']:,}")
-            line(f"    Columns:       {s['cols']}")
-            line(f"    Null cells:    {s['null_cells']:,}  ({s['null_pct']}%)")
-            line(f"    Duplicate rows:{s['dup_rows']:,}  ({s['dup_pct']}%)")
+            line(f"    Columns:       {s['cols']} selected of {s['file_cols']}")
+            line(f"    Null cells:    {s['null_cells']:,}  ({s['null_pct']}%)  in selected columns")
+            line(f"    Duplicate rows:{s['dup_rows']:,}  ({s['dup_pct']}%)  on selected columns")
         line()
         line(sep, "sep")
         line("  KEY ANALYSIS", "subheading")